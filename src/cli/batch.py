@@ -0,0 +1,287 @@
+import click
+import csv
+import functools
+import json
+import sys
+
+
+class NdjsonWriter:
+    """Writes each record as a line of JSON as soon as it is written."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, record, rows=None):
+        self.stream.write(json.dumps(record, default=str) + "\n")
+        self.stream.flush()
+
+
+class CsvWriter:
+    """Writes flat rows as CSV as soon as they are written. The header is taken from the first row."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._writer = None
+
+    def write(self, record, rows=None):
+        """
+        Args:
+            record (dict): The record to write when no rows are given.
+            rows (list): The flat rows of a nested record, e.g. one row per partition.
+        """
+        for row in [record] if rows is None else rows:
+            if self._writer is None:
+                self._writer = csv.DictWriter(
+                    self.stream, fieldnames=list(row), extrasaction="ignore"
+                )
+                self._writer.writeheader()
+
+            # Lists such as replica ids do not fit in a cell, so they are written as JSON
+            self._writer.writerow(
+                {k: json.dumps(v) if isinstance(v, (list, dict)) else v for k, v in row.items()}
+            )
+        self.stream.flush()
+
+
+WRITERS = {"ndjson": NdjsonWriter, "csv": CsvWriter}
+
+
+def batch_command(f):
+    """
+    Decorate a batch command with the --output option.
+
+    The command receives the AdminClient config and a writer for the chosen format, and Kafka
+    errors are reported as a failed command instead of a traceback. Commands write each record
+    as soon as it is described, so the first records are written while the others are fetched.
+    """
+
+    @click.option(
+        "--output",
+        "-o",
+        type=click.Choice(list(WRITERS), case_sensitive=False),
+        default="ndjson",
+        show_default=True,
+        help="The output format.",
+    )
+    @click.pass_obj
+    @functools.wraps(f)
+    def command(obj, output, **kwargs):
+        from confluent_kafka import KafkaError, KafkaException
+
+        writer = WRITERS[output.lower()](sys.stdout)
+        try:
+            f(obj["admin_client_config"], writer, **kwargs)
+        except KafkaException as e:
+            raise click.ClickException(str(e))
+        except Exception as e:
+            # Futures may fail with an exception that only carries a KafkaError
+            if e.args and isinstance(e.args[0], KafkaError):
+                raise click.ClickException(e.args[0].str())
+            raise
+
+    return command
+
+
+@click.group()
+def topics():
+    """List and describe topics."""
+
+
+@topics.command("list")
+@click.option("--show-internal", "-i", is_flag=True, help="Include internal topics.")
+@batch_command
+def list_topics(admin_client_config, writer, show_internal):
+    """List topics."""
+    from kafka_wrapper import Topic
+
+    with Topic(admin_client_config=admin_client_config) as topic:
+        for record in topic.iter_list(show_internal=show_internal):
+            writer.write(record)
+
+
+@topics.command("describe")
+@click.argument("topic_names", nargs=-1)
+@batch_command
+def describe_topics(admin_client_config, writer, topic_names):
+    """Describe topics. Defaults to all topics."""
+    from kafka_wrapper import Topic
+
+    with Topic(admin_client_config=admin_client_config) as topic:
+        for topic_name, description in topic.iter_describe(topic_names=list(topic_names)):
+            rows = [
+                {
+                    "topic": topic_name,
+                    "partition": p["id"],
+                    **{k: v for k, v in p.items() if k != "id"},
+                }
+                for p in description["availability"]
+            ]
+            writer.write({"name": topic_name, **description}, rows)
+
+
+@click.group()
+def groups():
+    """List and describe consumer groups."""
+
+
+@groups.command("list")
+@click.option("--show-empty", "-e", is_flag=True, help="Include empty consumer groups.")
+@click.option("--show-simple", "-s", is_flag=True, help="Include simple consumer groups.")
+@batch_command
+def list_groups(admin_client_config, writer, show_empty, show_simple):
+    """List consumer groups."""
+    from kafka_wrapper import ConsumerGroup
+
+    with ConsumerGroup(admin_client_config=admin_client_config) as consumer_group:
+        for record in consumer_group.list(show_empty=show_empty, show_simple=show_simple):
+            writer.write(record)
+
+
+@groups.command("describe")
+@click.argument("group_ids", nargs=-1)
+@click.option("--lag", is_flag=True, help="Include the offset lag of the assigned partitions.")
+@click.option("--show-empty", "-e", is_flag=True, help="Include empty consumer groups.")
+@batch_command
+def describe_groups(admin_client_config, writer, group_ids, lag, show_empty):
+    """Describe consumer groups as they are described. Defaults to all consumer groups."""
+    from kafka_wrapper import ConsumerGroup
+
+    with ConsumerGroup(admin_client_config=admin_client_config) as consumer_group:
+        for group_id, description in consumer_group.iter_describe(
+            group_ids=list(group_ids), include_offset_lag=lag, show_empty=show_empty
+        ):
+            rows = []
+            for member in description["members"]:
+                member_row = {
+                    "group": group_id,
+                    "state": description["state"],
+                    "member": member["id"],
+                    "client_id": member["client_id"],
+                    "host": member["host"],
+                }
+                # Members without assignments still get a row with the same columns
+                assignments = member["assignments"] or [
+                    dict.fromkeys(
+                        ["topic", "partition", "current_offset", "log_end_offset", "lag"], ""
+                    )
+                ]
+                rows.extend({**member_row, **assignment} for assignment in assignments)
+            writer.write({"id": group_id, **description}, rows)
+
+
+@click.group()
+def brokers():
+    """List and describe brokers."""
+
+
+@brokers.command("list")
+@batch_command
+def list_brokers(admin_client_config, writer):
+    """List brokers."""
+    from kafka_wrapper import Broker
+
+    with Broker(admin_client_config=admin_client_config) as broker:
+        for record in broker.iter_list():
+            writer.write(record)
+
+
+@brokers.command("describe")
+@batch_command
+def describe_brokers(admin_client_config, writer):
+    """Describe the cluster brokers."""
+    from kafka_wrapper import Broker
+
+    with Broker(admin_client_config=admin_client_config) as broker:
+        writer.write(broker.describe())
+
+
+@click.command()
+@click.argument("topic_name")
+@click.argument("file", type=click.File("rb"), default="-")
+@click.option(
+    "--format",
+    "-F",
+    "input_format",
+    type=click.Choice(["ndjson", "delimited", "binary"], case_sensitive=False),
+    default=None,
+    help="The format of the messages. Defaults to the file extension, or delimited lines for stdin.",
+)
+@click.option(
+    "--delimiter",
+    "-d",
+    default="\t",
+    show_default="tab",
+    help="The separator of the key and the value of delimited lines.",
+)
+@click.option(
+    "--linger-ms",
+    type=click.IntRange(min=0),
+    default=50,
+    show_default=True,
+    help="The time to wait for a batch to fill.",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=1_000_000,
+    show_default=True,
+    help="The maximum size of a batch in bytes.",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(["none", "gzip", "snappy", "lz4", "zstd"], case_sensitive=False),
+    default="lz4",
+    show_default=True,
+    help="The compression of the batches.",
+)
+@click.option(
+    "--max-in-flight-mb",
+    type=click.IntRange(min=1),
+    default=64,
+    show_default=True,
+    help="The maximum number of megabytes waiting for delivery.",
+)
+@batch_command
+def produce(
+    admin_client_config,
+    writer,
+    topic_name,
+    file,
+    input_format,
+    delimiter,
+    linger_ms,
+    batch_size,
+    compression,
+    max_in_flight_mb,
+):
+    """Produce messages from a file or stdin and report the throughput and delivery latency."""
+    from kafka_wrapper.producer import Producer, READERS, guess_format, read_delimited
+
+    if input_format is None:
+        # Stdin has no extension, so it is read as delimited lines
+        input_format = guess_format(getattr(file, "name", ""))
+
+    if input_format == "delimited":
+        records = read_delimited(file, delimiter.encode())
+    else:
+        records = READERS[input_format](file)
+
+    producer_config = {
+        **admin_client_config,
+        "linger.ms": linger_ms,
+        "batch.size": batch_size,
+        "compression.type": compression.lower(),
+    }
+    try:
+        with Producer(
+            producer_config, max_in_flight_bytes=max_in_flight_mb * 1024 * 1024
+        ) as producer:
+            report = producer.produce_all(topic_name, records)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    writer.write({"topic": topic_name, **report})
+    if report["errors"]:
+        raise click.ClickException(
+            f"{report['errors']} messages were not delivered: {report['last_error']}"
+        )
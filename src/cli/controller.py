@@ -1,16 +1,34 @@
-from typing import Type, Tuple, Dict
-from confluent_kafka.admin import AdminClient
+from collections import OrderedDict
+from typing import Optional, Type, Tuple, Dict
+from kafka_wrapper import admin_client_pool
 from .color import curses_color, curses_color_pair
 from .model import *
 from .view import *
 from .error import K4Error
+from .refresher import Refresher
 
 import curses
+import math
+import os
 import time
 
+
 class Navigation:
-    def __init__(self) -> None:
+    def __init__(self, max_cached_focuses: int = 4) -> None:
+        """
+        Args:
+            max_cached_focuses (int): The number of focuses whose view and model are kept for reuse.
+        """
         self.current_focus = "topics"
+        self.max_cached_focuses = max_cached_focuses
+
+        # The key of the resource shown by a details focus, e.g. a consumer group id
+        self.current_key = None
+
+        # The view and model of the recently visited focuses, least recently used first
+        self._cache: "OrderedDict[Tuple[str, Optional[str]], Tuple[Any, Any]]" = OrderedDict()
+
+        # A list focus names the focus that describes its rows, which names its parent to go back to
         self.focuses = {
             "topics": {
                 "view": TopicView,
@@ -19,6 +37,12 @@ class Navigation:
             "consumergroups": {
                 "view": ConsumerGroupView,
                 "model": ConsumerGroupModel,
+                "describe": "consumergroup",
+            },
+            "consumergroup": {
+                "view": ConsumerGroupLagView,
+                "model": ConsumerGroupLagModel,
+                "parent": "consumergroups",
             },
         }
 
@@ -46,24 +70,78 @@ class Navigation:
             "quit": ("Q", "q"),
         }
 
-    def navigate(self, command: str) -> None:
-        if command == "brokers" or command in self.aliases["brokers"]:
-            self.current_focus = "brokers"
+    def navigate(self, command: str) -> bool:
+        """Focus on the list named by a command. Returns False and keeps the current focus if there is none."""
+        for focus in ("brokers", "topics", "consumergroups"):
+            # A focus without a view, e.g. brokers, is not shown yet
+            if (command == focus or command in self.aliases[focus]) and focus in self.focuses:
+                self.current_focus, self.current_key = focus, None
+                return True
+        return False
 
-        elif command == "topics" or command in self.aliases["topics"]:
-            self.current_focus = "topics"
+    def describe(self, key: Optional[str]) -> bool:
+        """Focus on the details of a row of the current focus. Returns False if its rows have no details."""
+        focus = self.focuses.get(self.current_focus, {}).get("describe")
+        if not focus or key is None:
+            return False
 
-        elif command == "consumergroups" or command in self.aliases["consumergroups"]:
-            self.current_focus = "consumergroups"
+        self.current_focus, self.current_key = focus, key
+        return True
+
+    def back(self) -> bool:
+        """Focus on the list the current details were opened from. Returns False if there is none."""
+        focus = self.focuses.get(self.current_focus, {}).get("parent")
+        if not focus:
+            return False
+
+        self.current_focus, self.current_key = focus, None
+        return True
 
     def get_current_focus(self, window: Type[curses.window], kafka_admin_client_config) -> Tuple[Any, Any]:
-        view = self.focuses[self.current_focus]["view"](window)
-        model = self.focuses[self.current_focus]["model"](kafka_admin_client_config)
+        """
+        Returns the view and model of the current focus.
+
+        A recently visited focus returns its cached view and model, so its client, last snapshot,
+        filter and namespace are reused. The least recently used focus is closed when the cache is full.
+        Details are cached per key, e.g. coming back to a consumer group keeps its lag samples.
+        """
+        cache_key = (self.current_focus, self.current_key)
+        if cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+            view, model = self._cache[cache_key]
+
+            # The layout may be stale, e.g. the terminal was resized while another focus was shown
+            view.handle_resize()
+            return view, model
+
+        focus = self.focuses[self.current_focus]
+        view = focus["view"](window)
+        if self.current_key is None:
+            model = focus["model"](kafka_admin_client_config)
+        else:
+            model = focus["model"](kafka_admin_client_config, self.current_key)
+        self._cache[cache_key] = (view, model)
+
+        while len(self._cache) > self.max_cached_focuses:
+            _, (_, evicted_model) = self._cache.popitem(last=False)
+            evicted_model.close()
+
         return view, model
 
+    def close(self) -> None:
+        """Close the models of every cached focus."""
+        while self._cache:
+            _, (_, model) = self._cache.popitem()
+            model.close()
+
 
 class Controller:
-    def __init__(self):
+    def __init__(
+        self, refresh_interval: float = 10, input_timeout_ms: int = 100, max_fps: float = 30
+    ):
+        self.refresh_interval = refresh_interval
+        self.input_timeout_ms = input_timeout_ms
+        self.frame_interval = 1 / max_fps
         self.screen = curses.initscr()
 
         # Setup screen
@@ -96,52 +174,155 @@ class Controller:
         self.navigation = Navigation()
 
     def run(self, kafka_admin_client_config: Dict[str, str]) -> None:
+        refresher = None
         try:
             # Initialize home screen
             view, model = self.navigation.get_current_focus(self.screen, kafka_admin_client_config)
 
             model.update_input(view.input)
-            model.refresh()
+            refresher = Refresher(model, interval=self.refresh_interval).start()
 
+            drawn_snapshot, drawn_status, drawn_at = None, None, -math.inf
             while True:
-                model.refresh(wait_seconds=10)
-                view.display(model)
+                # Only redraw when a key was pressed or the refresher published something new
+                status = (refresher.is_refreshing, refresher.is_stale())
+                is_damaged = model.snapshot is not drawn_snapshot or status != drawn_status
+                if is_damaged:
+                    # Render at most once per frame, the keys pressed until then are drawn together
+                    frame_wait = drawn_at + self.frame_interval - time.perf_counter()
+                    if frame_wait <= 0:
+                        view.display(model, refresher)
+                        drawn_snapshot, drawn_status, drawn_at = (
+                            model.snapshot,
+                            status,
+                            time.perf_counter(),
+                        )
+                        is_damaged = False
 
-                line = view.select_item_line().split(" ")[0]
+                # Poll for input so new snapshots are drawn while the user is idle,
+                # and wake up in time for a pending frame
+                timeout_ms = math.ceil(frame_wait * 1000) if is_damaged else self.input_timeout_ms
+                self.screen.timeout(timeout_ms)
 
-                # Handle user input
-                ch = view.get_ch()
+                # Handle user input, keys that are not bound change nothing and are not redrawn
+                effects = self.read_input(view, model)
+                if not effects:
+                    continue
 
-                # Handle user command
-                if ch == ord(":"):
-                    command = view.get_command(model)
-                    self.navigation.navigate(command)
-                    
-                    view, model = self.navigation.get_current_focus(self.screen, kafka_admin_client_config)
+                drawn_snapshot = None
+
+                # Only keys that change the model input fetch data, e.g. scrolling and
+                # namespaces redraw or select rows from the latest snapshot
+                if REFRESH in effects:
                     model.update_input(view.input)
-                    model.refresh()
+                    refresher.request_refresh()
 
+                # Handle user command
+                if COMMAND in effects:
+                    command = view.get_command(model)
                     if command == "quit" or command in self.navigation.aliases["quit"]:
                         break
-                
-                # Handle user controls
-                elif ch in [ord(k[-1]) for k in model.controls.keys()] or ch in [ord(str(k)) for k in model.namespaces.keys()]:
-                    view.top_win.erase()
-                    model.update_input(view.input)
-                    model.refresh()
-                    view.display(model)
 
-                # Handle screen resize
-                elif ch == curses.KEY_RESIZE:
-                    view.handle_resize()
+                    # An empty or unknown command keeps the current focus, e.g. the details of a group
+                    is_focus_changed = self.navigation.navigate(command)
+                elif DESCRIBE in effects:
+                    is_focus_changed = self.navigation.describe(view.get_selected_key(model))
+                elif BACK in effects:
+                    is_focus_changed = self.navigation.back()
+                else:
+                    is_focus_changed = False
+
+                if PRODUCE in effects:
+                    topic_name = view.get_selected_key(model)
+                    if topic_name:
+                        self.produce(topic_name, kafka_admin_client_config)
+                        view.handle_resize()
+
+                if is_focus_changed:
+                    # The model stays cached with its client and last snapshot, which is shown
+                    # at once when the user comes back while the new refresher catches up
+                    refresher.stop()
+                    view, model = self.navigation.get_current_focus(
+                        self.screen, kafka_admin_client_config
+                    )
+                    model.update_input(view.input)
+                    refresher = Refresher(model, interval=self.refresh_interval).start()
 
         except KeyboardInterrupt:
             pass
         except Exception as e:
             return K4Error("Curses! Something went wrong!", e)
         finally:
+            if refresher:
+                refresher.stop()
+            self.navigation.close()
             self.cleanup()
 
+    def produce(self, topic_name: str, kafka_admin_client_config: Dict[str, str]) -> None:
+        """
+        Produce the messages of a file to a topic and show the delivery report.
+
+        Like an editor, the load runs in the shell outside of curses, and the user returns to
+        the UI when they have read the report.
+        """
+        from kafka_wrapper.producer import Producer, READERS, guess_format
+
+        curses.def_prog_mode()
+        curses.endwin()
+        try:
+            path = input(
+                f"Produce to {topic_name} from file (.ndjson, .bin or key<tab>value lines): "
+            ).strip()
+            if path:
+                path = os.path.expanduser(path)
+                print(f"Producing {path} to {topic_name}…")
+                with open(path, "rb") as f, Producer(kafka_admin_client_config) as producer:
+                    report = producer.produce_all(topic_name, READERS[guess_format(path)](f))
+
+                print(
+                    f"Delivered {report['messages']} messages ({report['bytes']} bytes) in {report['seconds']:.2f}s: "
+                    f"{report['messages_per_second']:.0f} messages/s, {report['bytes_per_second'] / 1024 / 1024:.2f} MB/s"
+                )
+                if report["messages"]:
+                    print(
+                        f"Delivery latency: p50 {report['p50_latency_ms']:.1f}ms, p99 {report['p99_latency_ms']:.1f}ms"
+                    )
+                if report["errors"]:
+                    print(f"Failed to deliver {report['errors']} messages: {report['last_error']}")
+        except Exception as e:
+            # The user is told what went wrong instead of leaving the UI
+            print(f"Failed to produce: {e}")
+        finally:
+            try:
+                input("Press enter to return to k4")
+            except EOFError:
+                pass
+            curses.reset_prog_mode()
+
+    def read_input(self, view, model) -> set:
+        """
+        Apply the pending keys to the view and return their effects.
+
+        The first key is waited for up to the screen timeout. The keys that follow, e.g. a held
+        arrow key, are drained without waiting so a burst of keys is drawn in a single frame.
+        Draining stops at a command so the keys typed after ":" are left to the command line.
+        """
+        effects = set()
+        ch = view.get_ch()
+
+        self.screen.timeout(0)
+        deadline = time.perf_counter() + self.frame_interval
+        while ch != -1:
+            effect = view.dispatch(ch, model)
+            if effect:
+                effects.add(effect)
+            if effect == COMMAND or time.perf_counter() > deadline:
+                break
+            ch = view.get_ch()
+
+        return effects
+
     def cleanup(self):
+        admin_client_pool.close()
         self.screen.clear()
         curses.endwin()
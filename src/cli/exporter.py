@@ -0,0 +1,341 @@
+from collections import Counter, defaultdict
+
+import click
+import logging
+import math
+import time
+
+# The http server is imported when the exporter is served, so the other commands start without it.
+
+logger = logging.getLogger(__name__)
+
+# The type and help of each metric, in the order they are exposed
+METRICS = {
+    "k4_brokers": ("gauge", "The number of brokers in the cluster."),
+    "k4_topics": ("gauge", "The number of topics in the cluster."),
+    "k4_partitions": ("gauge", "The number of partitions in the cluster."),
+    "k4_replicas": ("gauge", "The number of partition replicas in the cluster."),
+    "k4_consumer_groups": ("gauge", "The number of stable high-level consumer groups."),
+    "k4_topic_partitions": ("gauge", "The number of partitions of a topic."),
+    "k4_topic_under_replicated_partitions": (
+        "gauge",
+        "The number of partitions of a topic with replicas out of sync.",
+    ),
+    "k4_consumergroup_lag": (
+        "gauge",
+        "The number of messages a consumer group is behind on a partition.",
+    ),
+    "k4_consumergroup_committed_offset": (
+        "gauge",
+        "The offset a consumer group committed on a partition.",
+    ),
+    "k4_consumergroup_lag_sum": (
+        "gauge",
+        "The number of messages a consumer group is behind on all its partitions.",
+    ),
+    "k4_consumergroup_consume_rate": (
+        "gauge",
+        "The number of messages per second a consumer group consumes.",
+    ),
+    "k4_consumergroup_lag_trend": (
+        "gauge",
+        "The change of the lag of a consumer group in messages per second.",
+    ),
+    "k4_exporter_collection_duration_seconds": (
+        "gauge",
+        "The number of seconds the last collection of a collector took.",
+    ),
+    "k4_exporter_collection_success": (
+        "gauge",
+        "Whether the last collection of a collector succeeded.",
+    ),
+    "k4_exporter_collection_timestamp_seconds": ("gauge", "The time the last collection finished."),
+    "k4_exporter_dropped_series": (
+        "gauge",
+        "The number of series of a metric dropped by the cardinality limit.",
+    ),
+}
+
+# The metrics about the exporter itself are few and never dropped
+EXPORTER_PREFIX = "k4_exporter_"
+
+
+def escape_label_value(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_sample_value(value):
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(int(value))
+
+
+class MetricSet:
+    """
+    The series of a single collection in the Prometheus text format.
+
+    At most max_series series are kept per metric, so a cluster with many groups or partitions
+    can not grow a scrape without bound. The series over the limit are counted instead, see
+    k4_exporter_dropped_series.
+    """
+
+    def __init__(self, max_series=10_000):
+        """
+        Args:
+            max_series (int): The maximum number of series of each metric.
+        """
+        self.max_series = max_series
+        self.series = defaultdict(list)
+        self.dropped = Counter()
+
+    def add(self, name, value, **labels):
+        """Add a series of a metric in METRICS, e.g. add("k4_topic_partitions", 3, topic="orders")."""
+        series = self.series[name]
+        if len(series) >= self.max_series and not name.startswith(EXPORTER_PREFIX):
+            self.dropped[name] += 1
+            return
+        series.append((labels, value))
+
+    def render(self):
+        """Returns the series in the Prometheus text exposition format."""
+        for name, dropped in sorted(self.dropped.items()):
+            self.add("k4_exporter_dropped_series", dropped, metric=name)
+        self.dropped.clear()
+
+        lines = []
+        for name, (metric_type, help_text) in METRICS.items():
+            series = self.series.get(name)
+            if not series:
+                continue
+
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in series:
+                if labels:
+                    label_text = ",".join(
+                        f'{k}="{escape_label_value(v)}"' for k, v in labels.items()
+                    )
+                    lines.append(f"{name}{{{label_text}}} {format_sample_value(value)}")
+                else:
+                    lines.append(f"{name} {format_sample_value(value)}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class Collector:
+    """
+    Collects the cluster, topic and consumer group lag metrics on a background thread.
+
+    Scrapes read the text rendered by the latest collection and never wait on Kafka. Each part
+    of a collection is timed and fails on its own, e.g. the topic metrics are still exposed while
+    the consumer groups can not be listed.
+    """
+
+    def __init__(self, admin_client_config, max_series=10_000, include_lag=True, timeout=10):
+        """
+        Args:
+            admin_client_config (dict): The Kafka AdminClient configuration.
+            max_series (int): The maximum number of series of each metric, see MetricSet.
+            include_lag (bool): Whether to collect the lag of every partition of every consumer group.
+            timeout (int): The timeout for kafka operations.
+        """
+        self.admin_client_config = admin_client_config
+        self.max_series = max_series
+        self.include_lag = include_lag
+        self.timeout = timeout
+        self.text = ""
+
+        self._broker = None
+        self._topic = None
+        self._consumer_group = None
+        self._lag_sampler = None
+        self._collect_loop = None
+
+    def _open(self):
+        if self._broker:
+            return
+
+        from kafka_wrapper import Broker, Topic, ConsumerGroup, LagSampler
+
+        self._broker = Broker(admin_client_config=self.admin_client_config, timeout=self.timeout)
+        self._topic = Topic(admin_client_config=self.admin_client_config, timeout=self.timeout)
+        self._consumer_group = ConsumerGroup(
+            admin_client_config=self.admin_client_config, timeout=self.timeout
+        )
+
+        # A few samples are enough for the rates, the lag itself is the latest sample
+        self._lag_sampler = LagSampler(self._consumer_group, capacity=10)
+
+    def collect(self):
+        """Collect every metric and publish the rendered text for the next scrapes."""
+        self._open()
+
+        metrics = MetricSet(self.max_series)
+        collectors = {"brokers": self.collect_brokers, "topics": self.collect_topics}
+        if self.include_lag:
+            collectors["consumergroups"] = self.collect_lag
+
+        for name, collect in collectors.items():
+            start = time.perf_counter()
+            try:
+                collect(metrics)
+                success = 1
+            except Exception as e:
+                logger.warning("Failed to collect the %s metrics: %s", name, e)
+                success = 0
+
+            metrics.add(
+                "k4_exporter_collection_duration_seconds",
+                time.perf_counter() - start,
+                collector=name,
+            )
+            metrics.add("k4_exporter_collection_success", success, collector=name)
+
+        metrics.add("k4_exporter_collection_timestamp_seconds", time.time())
+
+        # Scrapes see either the previous or the new collection, never a mix
+        self.text = metrics.render()
+
+    def collect_brokers(self, metrics):
+        description = self._broker.describe(consumer_group=self._consumer_group)
+        metrics.add("k4_brokers", description["brokers"])
+        metrics.add("k4_topics", description["topics"])
+        metrics.add("k4_partitions", description["partitions"])
+        metrics.add("k4_replicas", description["replicas"])
+        metrics.add("k4_consumer_groups", description["consumer_groups"])
+
+    def collect_topics(self, metrics):
+        for topic_name, description in sorted(self._topic.describe().items()):
+            under_replicated = sum(
+                p["status"] == "UNDER-REPLICATED" for p in description["availability"]
+            )
+            metrics.add("k4_topic_partitions", description["partitions"], topic=topic_name)
+            metrics.add("k4_topic_under_replicated_partitions", under_replicated, topic=topic_name)
+
+    def collect_lag(self, metrics):
+        self._lag_sampler.sample()
+
+        for group_id in self._lag_sampler.get_group_ids():
+            for p in self._lag_sampler.get_partition_stats(group_id):
+                labels = {"group": group_id, "topic": p["topic"], "partition": p["partition"]}
+                metrics.add("k4_consumergroup_lag", p["lag"], **labels)
+                metrics.add("k4_consumergroup_committed_offset", p["committed_offset"], **labels)
+
+            stats = self._lag_sampler.get_group_stats(group_id)
+            metrics.add("k4_consumergroup_lag_sum", stats["lag"], group=group_id)
+            if stats["lag_trend"] is not None:
+                metrics.add("k4_consumergroup_consume_rate", stats["consume_rate"], group=group_id)
+                metrics.add("k4_consumergroup_lag_trend", stats["lag_trend"], group=group_id)
+
+    def start(self, interval=30):
+        """
+        Collect at once and then every interval seconds on a background thread.
+
+        Args:
+            interval (float): The number of seconds between the start of collections.
+        """
+        if self._collect_loop is None:
+            from kafka_wrapper.background import BackgroundLoop
+
+            self._collect_loop = BackgroundLoop(name="k4-exporter")
+
+        self._collect_loop.start(self._collect_in_background, interval)
+        return self
+
+    def stop(self):
+        """Stop the background collection."""
+        if self._collect_loop:
+            self._collect_loop.stop()
+
+    def _collect_in_background(self):
+        try:
+            self.collect()
+        except Exception as e:
+            logger.warning("Failed to collect metrics: %s", e)
+
+    def close(self):
+        """Stop collecting and release the pooled admin clients."""
+        self.stop()
+        for resource in (self._broker, self._topic, self._consumer_group):
+            if resource:
+                resource.close()
+
+
+def create_server(collector, host="127.0.0.1", port=9308):
+    """Returns an HTTP server exposing the latest metrics of the collector at /metrics."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+
+            body = collector.text.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug("%s - %s", self.address_string(), format % args)
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    return server
+
+
+@click.command()
+@click.option(
+    "--host", default="127.0.0.1", show_default=True, help="The address to serve the metrics on."
+)
+@click.option(
+    "--port",
+    "-p",
+    type=click.IntRange(min=0, max=65535),
+    default=9308,
+    show_default=True,
+    envvar="K4_EXPORTER_PORT",
+    show_envvar=True,
+    help="The port to serve the metrics on.",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=1),
+    default=30,
+    show_default=True,
+    help="The number of seconds between collections. Scrapes return the latest collection.",
+)
+@click.option(
+    "--max-series",
+    type=click.IntRange(min=1),
+    default=10_000,
+    show_default=True,
+    help="The maximum number of series of each metric. Further series are dropped and counted.",
+)
+@click.option(
+    "--lag/--no-lag",
+    default=True,
+    show_default=True,
+    help="Collect the lag of every consumer group partition.",
+)
+@click.pass_obj
+def exporter(obj, host, port, interval, max_series, lag):
+    """Serve cluster, topic and consumer group lag metrics for Prometheus at /metrics."""
+    collector = Collector(obj["admin_client_config"], max_series=max_series, include_lag=lag)
+    server = create_server(collector, host, port)
+    collector.start(interval)
+
+    click.echo(f"Serving metrics at http://{host}:{server.server_address[1]}/metrics", err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        collector.close()
@@ -1,9 +1,15 @@
-from collections import defaultdict
-from typing import List, Dict
+from collections import Counter
+from operator import itemgetter
+from typing import List, Dict, Optional
 
+import heapq
 import re
 
 
+# The leading alphanumeric word of a name, optionally after one of "._-"
+PREFIX_PATTERN = re.compile(r"^[._-]?([a-zA-Z0-9]+)")
+
+
 def chunk_dict(d: Dict[str, str], chunk_size=6):
     """
     Splits a dictionary into a list of sub-dictionaries, with each sub-dictionary containing at most chunk_size key-value pairs.
@@ -48,18 +54,25 @@ def get_top_prefixes(names: List[str], max_keys: int = 9) -> Dict[str, int]:
         >>> get_top_prefixes(names)
         {'topic3': 3, 'topic1': 2, 'topic2': 2}
     """
-    pattern = r"^[._-]?([a-zA-Z0-9]+)"
+    namespace_to_counts = Counter()
+    for name in names:
+        prefix = get_prefix(name)
+        if prefix:
+            namespace_to_counts[prefix] += 1
 
-    namespace_to_counts = defaultdict(int)
+    return dict(heapq.nlargest(max_keys, namespace_to_counts.items(), key=itemgetter(1)))
 
-    for name in names:
-        match = re.match(pattern, name, re.IGNORECASE)
-        if match:
-            namespace_to_counts[match.group(1).lower()] += 1
-    
-    top_prefix_to_counts = {k:v for k, v in sorted(namespace_to_counts.items(), key=lambda item: item[1], reverse=True)[:max_keys]}
 
-    return top_prefix_to_counts
+def get_prefix(name: str) -> Optional[str]:
+    """
+    Returns the lower-cased namespace prefix of a name, or None if the name has no prefix.
+
+    Example:
+        >>> get_prefix("_Topic3-example")
+        'topic3'
+    """
+    match = PREFIX_PATTERN.match(name)
+    return match.group(1).lower() if match else None
 
 def shorten(text: str, width: int, placeholder: str = '...') -> str:
     """
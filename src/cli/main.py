@@ -1,17 +1,16 @@
-from confluent_kafka.admin import AdminClient
-from confluent_kafka import KafkaError
-from .controller import Controller
 from .error import K4Error
+from . import batch, exporter
 
 import click
-import curses
 import logging
-import yaml
 import os
 import traceback
 
+# Kafka, yaml and curses are imported on first use so that --help, --version
+# and the batch commands start without loading them.
 
-@click.command()
+
+@click.group(invoke_without_command=True)
 @click.version_option(package_name="K4", prog_name="K4")
 @click.option(
     "--bootstrap-servers",
@@ -45,8 +44,18 @@ import traceback
     show_envvar=True,
     help="The logging level to use for the logger and console handler.",
 )
-def cli(bootstrap_servers, kafka_config, log_level):
-    """A command-line client for Kafka."""
+@click.option(
+    "--max-fps",
+    type=click.FloatRange(min=1),
+    default=30,
+    show_default=True,
+    envvar="K4_MAX_FPS",
+    show_envvar=True,
+    help="The maximum number of frames per second drawn by the terminal UI.",
+)
+@click.pass_context
+def cli(ctx, bootstrap_servers, kafka_config, log_level, max_fps):
+    """A command-line client for Kafka. Launches the terminal UI when no command is given."""
 
     log_level = log_level
     logger = logging.getLogger()
@@ -54,8 +63,17 @@ def cli(bootstrap_servers, kafka_config, log_level):
 
     # kafka_admin_client_config = {"bootstrap.servers": bootstrap_servers, "logger": logger}
     kafka_admin_client_config = {"bootstrap.servers": bootstrap_servers}
+    ctx.obj = {"admin_client_config": kafka_admin_client_config}
+
+    if ctx.invoked_subcommand is None:
+        run_ui(kafka_admin_client_config, max_fps=max_fps)
 
-    controller = Controller()
+
+def run_ui(kafka_admin_client_config, max_fps=30):
+    # Curses is only imported and initialized for the terminal UI, not for batch commands
+    from .controller import Controller
+
+    controller = Controller(max_fps=max_fps)
     err = controller.run(kafka_admin_client_config)
 
     if err:
@@ -67,3 +85,10 @@ def cli(bootstrap_servers, kafka_config, log_level):
         raise err.error
         traceback.print_tb(err.error.__traceback__)
         click.echo(err.traceback)
+
+
+cli.add_command(batch.topics)
+cli.add_command(batch.groups)
+cli.add_command(batch.brokers)
+cli.add_command(batch.produce)
+cli.add_command(exporter.exporter)
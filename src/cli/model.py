@@ -1,67 +1,202 @@
-from tabulate import tabulate
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Sequence, Tuple
 from kafka_wrapper.topic import Topic
 from kafka_wrapper.consumer_group import ConsumerGroup
+from kafka_wrapper.lag_sampler import LagSampler
+from .search import NamespaceIndex, SearchIndex
+from .table import Table
 from .timer import Timer
 from . import helper
 
 import re
 import os
+import threading
+import time
+
+
+@dataclass(frozen=True, eq=False)
+class ModelSnapshot:
+    """An immutable view of the model data published by a single refresh."""
+
+    info: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    namespaces: Mapping[int, str] = field(default_factory=lambda: MappingProxyType({}))
+    contents: Table = field(default_factory=lambda: Table([]))
+    created_at: Optional[float] = None
+    fetch_duration: Optional[float] = None
+    index: SearchIndex = field(default_factory=lambda: SearchIndex([]))
+    row_ids_by_namespace: Mapping[str, Sequence[int]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
 
 class BaseModel:
     def __init__(self, admin_client_config: Dict[str, str], timeout: int = 10) -> None:
         self.name = None
+        self.headers = []
         self.bootstrap_servers = admin_client_config.get("bootstrap.servers")
-        self.info = {"context": None, "cluster": self.bootstrap_servers, "user": None}
-        self.namespaces = {}
         self.controls = {
             "shift-c": "Create",
             "d": "Describe",
             "e": "Edit",
             "ctrl-d": "Delete",
+            "/": "Filter",
+            "o": "Sort",
+            "shift-o": "Reverse",
             "?": "Help",
         }
-        self.contents = []
         self.client = None
         self.timer = Timer()
         self.input = {}
+        self.namespace_index = NamespaceIndex()
+        self._refresh_lock = threading.Lock()
+        self.snapshot = ModelSnapshot(info=MappingProxyType(self.get_info()))
+
+    @property
+    def info(self) -> Mapping[str, Any]:
+        return self.snapshot.info
+
+    @property
+    def namespaces(self) -> Mapping[int, str]:
+        return self.snapshot.namespaces
+
+    @property
+    def contents(self) -> Table:
+        """Returns the header line followed by a line per row. Lines are formatted when they are indexed."""
+        return self.snapshot.contents
+
+    @property
+    def index(self) -> SearchIndex:
+        """Returns the search index over the keys of the content rows, excluding the header."""
+        return self.snapshot.index
 
     def update_input(self, data: Dict[str, str]) -> None:
         self.input = data
 
-    def refresh_info(self) -> None:
-        self.info = {"context": None, "cluster": self.bootstrap_servers, "user": None}
+    @property
+    def fetch_duration(self) -> Optional[float]:
+        """Returns the number of seconds the latest refresh spent fetching data from Kafka."""
+        return self.snapshot.fetch_duration
+
+    def get_info(self, fetch_duration: Optional[float] = None) -> Dict[str, Any]:
+        info = {"context": None, "cluster": self.bootstrap_servers, "user": None}
+        if fetch_duration is not None:
+            info["fetch"] = f"{fetch_duration * 1000:.0f}ms"
+        return info
+
+    def fetch(self) -> List[Dict[str, Any]]:
+        """Fetch the resources listed by the model. Called once per refresh."""
+        return []
+
+    def get_namespaces(self) -> Dict[int, str]:
+        """Returns the namespace selected by each number key. Zero selects all namespaces."""
+        top_namespaces = ["all"] + list(self.namespace_index.get_top_namespaces().keys())
+        return dict(enumerate(top_namespaces))
 
-    def refresh_namespaces(self) -> None:
-        self.namespace = {}
-    
     def get_sorted_controls(self):
         """Returns the controls dictionary sorted by value."""
         return dict(sorted(self.controls.items(), key=lambda x: x[1]))
 
-    def refresh_contents(self) -> None:
-        self.contents = []
+    def get_key(self, item: Dict[str, Any]) -> str:
+        """Returns the key used to sort, filter and search an item, e.g. the topic name."""
+        return ""
+
+    def get_rows(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Returns the items sorted by key."""
+        return sorted(items, key=self.get_key)
+
+    def get_row_ids(
+        self, namespace: int = 0, query: str = "", sort_column: int = 0, reverse: bool = False
+    ) -> Optional[Sequence[int]]:
+        """
+        Returns the ids of the content rows, excluding the header, in a namespace that match a filter query.
+
+        Args:
+            namespace (int): The number of the namespace. Zero selects all namespaces.
+            query (str): The filter query, see SearchIndex.search().
+            sort_column (int): The column to order the rows by. Rows are already ordered by the key column 0.
+            reverse (bool): Order the rows in descending order.
+
+        Returns:
+            Optional[Sequence[int]]: The ordered row ids, or None if every row is selected in row order.
+        """
+        snapshot = self.snapshot
+        row_ids = None
+        if namespace:
+            row_ids = snapshot.row_ids_by_namespace.get(snapshot.namespaces.get(namespace), ())
+
+        if query:
+            matches = snapshot.index.search(query)
+            if row_ids is None:
+                row_ids = matches
+            else:
+                namespace_row_ids = set(row_ids)
+                row_ids = [row_id for row_id in matches if row_id in namespace_row_ids]
+
+        if sort_column or reverse:
+            if row_ids is None:
+                row_ids = snapshot.contents.get_sorted_row_ids(sort_column, reverse)
+            else:
+                row_ids = snapshot.contents.sort_row_ids(row_ids, sort_column, reverse)
+
+        return row_ids
+
+    def get_record(self, item: Dict[str, Any]) -> Tuple:
+        """Returns the typed values of an item, one per header."""
+        return ()
+
+    def get_contents(self, rows: List[Dict[str, Any]]) -> Table:
+        return Table(self.headers, (self.get_record(row) for row in rows))
 
     def refresh(self, wait_seconds: int = 0) -> None:
-        if self.timer.has_elapsed(seconds = wait_seconds):
-            self.refresh_info()
-            self.refresh_namespaces()
-            self.refresh_contents()
-            self.timer.reset()
+        """
+        Fetch fresh data and publish it as a new snapshot.
+
+        The data is fetched once and the namespaces, contents and indexes are derived from it.
+        The snapshot holds every row; namespaces and filters select rows through the indexes.
+        The snapshot is replaced in a single assignment so readers on other threads
+        always see a consistent info, namespaces and contents.
+
+        Refreshes are serialized, e.g. a cached model revisited while the refresh started
+        by its previous refresher is still running.
+        """
+        with self._refresh_lock:
+            if self.timer.has_elapsed(seconds=wait_seconds):
+                fetch_start = time.perf_counter()
+                items = self.fetch()
+                fetch_duration = time.perf_counter() - fetch_start
+
+                rows = self.get_rows(items)
+                keys = [self.get_key(row) for row in rows]
+                row_ids_by_namespace = self.namespace_index.update(keys)
+                contents = self.get_contents(rows)
+                self.snapshot = ModelSnapshot(
+                    info=MappingProxyType(self.get_info(fetch_duration)),
+                    namespaces=MappingProxyType(self.get_namespaces()),
+                    contents=contents,
+                    created_at=time.time(),
+                    fetch_duration=fetch_duration,
+                    index=SearchIndex(keys),
+                    row_ids_by_namespace=MappingProxyType(row_ids_by_namespace),
+                )
+                self.timer.reset()
+
+    def close(self) -> None:
+        """Release the pooled admin client of this model."""
+        if self.client:
+            self.client.close()
 
 class TopicModel(BaseModel):
     def __init__(self, admin_client_config: Dict[str, str], timeout: int = 10) -> None:
         super().__init__(admin_client_config, timeout=timeout)
         
         self.name = "Topic"
+        self.headers = ["TOPIC", "PARTITIONS"]
         self.client = Topic(admin_client_config=admin_client_config, timeout=timeout)
         self.update_controls()
 
-    def refresh_namespaces(self) -> None:
-        topics = self.client.list(show_internal=self.input.get("show_internal"))
-        topic_names = [topic["name"] for topic in topics]
-        top_namespaces = ["all"] + list(helper.get_top_prefixes(topic_names).keys())
-        self.namespaces = dict(enumerate(top_namespaces))
+    def fetch(self) -> List[Dict[str, Any]]:
+        return self.client.list(show_internal=self.input.get("show_internal"))
 
     def update_controls(self) -> None:
         self.controls.update({
@@ -70,38 +205,29 @@ class TopicModel(BaseModel):
             "i": "Show Internal",
         })
 
-    def refresh_contents(self) -> None:
-        topics = self.client.list(show_internal=self.input.get("show_internal"))
-        headers = ["TOPIC", "PARTITIONS"]
-        lines = [[topic["name"], topic["partitions"]] for topic in topics]
-        tabulated_lines = tabulate(lines, headers=headers, tablefmt="plain", numalign="left", stralign="left").splitlines()
-        header = tabulated_lines[0]
+    def get_key(self, topic: Dict[str, Any]) -> str:
+        return topic["name"]
 
-        for k, ns in self.namespaces.items():
-            if int(self.input["namespace"]) == 0:
-                self.contents = [header] + sorted(tabulated_lines[1:])
-            elif int(k) == int(self.input["namespace"]):
-                self.contents = [header] + sorted([line for line in tabulated_lines if line.lower().startswith(ns) or line.lower().startswith(f"_{ns}") or line.lower().startswith(f"__{ns}")])
+    def get_record(self, topic: Dict[str, Any]) -> Tuple:
+        return (topic["name"], topic["partitions"])
 
 class ConsumerGroupModel(BaseModel):
     def __init__(self, admin_client_config: Dict[str, str], timeout: int = 10) -> None:
         super().__init__(admin_client_config, timeout=timeout)
         
         self.name = "ConsumerGroup"
+        self.headers = ["ID", "TYPE", "STATE"]
         self.client = ConsumerGroup(admin_client_config=admin_client_config, timeout=timeout)
         self.update_controls()
 
-    # def refresh_info(self) -> None:
-    #     self.info = {"context": None, "cluster": self.bootstrap_servers, "user": None}
+    # def get_info(self, fetch_duration: Optional[float] = None) -> Dict[str, Any]:
+    #     return {"context": None, "cluster": self.bootstrap_servers, "user": None}
 
-    def refresh_namespaces(self) -> None:
-        groups = self.client.list(
+    def fetch(self) -> List[Dict[str, Any]]:
+        return self.client.list(
             show_empty=self.input.get("show_empty"),
             show_simple=self.input.get("show_simple")
         )
-        group_ids = [group["id"] for group in groups]
-        top_namespaces = ["all"] + list(helper.get_top_prefixes(group_ids).keys())
-        self.namespaces = dict(enumerate(top_namespaces))
 
     def update_controls(self) -> None:
         self.controls.update({
@@ -110,18 +236,103 @@ class ConsumerGroupModel(BaseModel):
             "s": "Show Simple",
         })
 
-    def refresh_contents(self) -> None:
-        groups = self.client.list(
-            show_empty=self.input.get("show_empty"),
-            show_simple=self.input.get("show_simple")
+    def get_key(self, group: Dict[str, Any]) -> str:
+        return group["id"]
+
+    def get_record(self, group: Dict[str, Any]) -> Tuple:
+        return (group["id"], group["type"].upper(), group["state"])
+
+
+class ConsumerGroupLagModel(BaseModel):
+    """
+    The offset lag of each partition of a single consumer group, and how fast it changes.
+
+    Each refresh takes a sample of the committed and log end offsets, so the rates cover the
+    last capacity refreshes and build up while the model is shown or cached.
+    """
+
+    def __init__(
+        self,
+        admin_client_config: Dict[str, str],
+        group_id: str,
+        timeout: int = 10,
+        capacity: int = 60,
+    ) -> None:
+        self.group_id = group_id
+        self.sampler = None
+        super().__init__(admin_client_config, timeout=timeout)
+
+        self.name = "Partition"
+        self.headers = [
+            "TOPIC",
+            "PARTITION",
+            "OFFSET",
+            "LOG END",
+            "LAG",
+            "CONSUME/S",
+            "PRODUCE/S",
+            "TREND/S",
+            "ETA(S)",
+        ]
+        self.client = ConsumerGroup(admin_client_config=admin_client_config, timeout=timeout)
+        self.sampler = LagSampler(self.client, group_ids=[group_id], capacity=capacity)
+        self.update_controls()
+
+    def get_info(self, fetch_duration: Optional[float] = None) -> Dict[str, Any]:
+        info = super().get_info(fetch_duration)
+        info["group"] = self.group_id
+
+        stats = self.sampler.get_group_stats(self.group_id) if self.sampler else None
+        if stats:
+            trend = "" if stats["lag_trend"] is None else f" ({stats['lag_trend']:+.1f}/s)"
+            info["lag"] = f"{stats['lag']}{trend}"
+            info["eta"] = self.format_eta(stats["eta"])
+        return info
+
+    @staticmethod
+    def format_eta(eta: Optional[float]) -> str:
+        """Returns the time until a lag is consumed, e.g. "2m30s", or "-" if the lag is not shrinking."""
+        if eta is None:
+            return "-"
+        minutes, seconds = divmod(round(eta), 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours:
+            return f"{hours}h{minutes:02d}m"
+        return f"{minutes}m{seconds:02d}s" if minutes else f"{seconds}s"
+
+    def fetch(self) -> List[Dict[str, Any]]:
+        self.sampler.sample()
+        return self.sampler.get_partition_stats(self.group_id)
+
+    def update_controls(self) -> None:
+        # The partitions of a group are only browsed, so the resource controls do not apply
+        self.controls = {
+            "esc": "Back",
+            "/": "Filter",
+            "o": "Sort",
+            "shift-o": "Reverse",
+            "?": "Help",
+        }
+
+    def get_key(self, partition: Dict[str, Any]) -> str:
+        # A topic has a row per partition, the key is unique so each row is counted in its namespace
+        return f"{partition['topic']}/{partition['partition']}"
+
+    def get_rows(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return sorted(items, key=lambda partition: (partition["topic"], partition["partition"]))
+
+    def get_record(self, partition: Dict[str, Any]) -> Tuple:
+        def rate(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value, 1)
+
+        return (
+            partition["topic"],
+            partition["partition"],
+            partition["committed_offset"],
+            partition["log_end_offset"],
+            partition["lag"],
+            rate(partition["consume_rate"]),
+            rate(partition["produce_rate"]),
+            rate(partition["lag_trend"]),
+            None if partition["eta"] is None else round(partition["eta"]),
         )
-        headers = ["ID", "TYPE", "STATE"]
-        lines = [[g["id"], g["type"].upper(), g["state"]] for g in groups]
-        tabulated_lines = tabulate(lines, headers=headers, tablefmt="plain", numalign="left", stralign="left").splitlines()
-        header = tabulated_lines[0]
-
-        for k, ns in self.namespaces.items():
-            if int(self.input["namespace"]) == 0:
-                self.contents = [header] + sorted(tabulated_lines[1:])
-            elif int(k) == int(self.input["namespace"]):
-                self.contents = [header] + sorted([line for line in tabulated_lines if line.lower().startswith(ns) or line.lower().startswith(f"_{ns}") or line.lower().startswith(f"__{ns}")])
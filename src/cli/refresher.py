@@ -0,0 +1,61 @@
+from typing import Any, Optional
+from kafka_wrapper.background import BackgroundLoop
+
+import time
+
+
+class Refresher:
+    """Refreshes a model on a background thread so the UI never waits on Kafka."""
+
+    def __init__(self, model: Any, interval: float = 10) -> None:
+        """
+        Args:
+            model: The model to refresh. Each refresh publishes a new model snapshot.
+            interval (float): The number of seconds between refreshes.
+        """
+        self.model = model
+        self.interval = interval
+        self.error: Optional[Exception] = None
+        self._is_refreshing = False
+        self._refresh_loop = BackgroundLoop(name=f"k4-refresh-{model.name}")
+
+    @property
+    def is_refreshing(self) -> bool:
+        return self._is_refreshing
+
+    @property
+    def refreshed_at(self) -> Optional[float]:
+        """Returns the time the latest snapshot was taken, or None before the first refresh."""
+        return self.model.snapshot.created_at
+
+    def is_stale(self) -> bool:
+        """Returns True if the latest refresh failed or the snapshot is older than two intervals."""
+        if self.error:
+            return True
+        if self.refreshed_at is None:
+            return False
+        return time.time() - self.refreshed_at > 2 * self.interval
+
+    def start(self) -> "Refresher":
+        """Start refreshing. The first refresh runs immediately."""
+        self._refresh_loop.start(self._refresh, self.interval)
+        return self
+
+    def request_refresh(self) -> None:
+        """Refresh as soon as possible, e.g. after the user changed the model input."""
+        self._refresh_loop.wake()
+
+    def stop(self) -> None:
+        """Stop refreshing."""
+        self._refresh_loop.stop()
+
+    def _refresh(self) -> None:
+        self._is_refreshing = True
+        try:
+            self.model.refresh()
+            self.error = None
+        except Exception as e:
+            # Keep showing the last snapshot and retry on the next interval
+            self.error = e
+        finally:
+            self._is_refreshing = False
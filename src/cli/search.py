@@ -0,0 +1,132 @@
+from array import array
+from collections import Counter, defaultdict
+from operator import itemgetter
+from typing import Dict, List, Optional, Sequence
+from . import helper
+
+import heapq
+
+
+class SearchIndex:
+    """
+    A trigram index over row keys, e.g. topic names or group ids, for case-insensitive substring search.
+
+    The index is built once per model snapshot so filtering as the user types only checks the
+    rows that share a trigram with the query instead of scanning every row.
+    """
+
+    def __init__(self, keys: Sequence[str]) -> None:
+        """
+        Args:
+            keys (Sequence[str]): The key of each row. Search results are indices into this sequence.
+        """
+        self.keys = [key.lower() for key in keys]
+        self._row_ids_by_trigram: Dict[str, array] = defaultdict(lambda: array("I"))
+        for row_id, key in enumerate(self.keys):
+            for trigram in {key[i : i + 3] for i in range(len(key) - 2)}:
+                self._row_ids_by_trigram[trigram].append(row_id)
+
+        self._last_query = None
+        self._last_row_ids = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _get_candidates(self, terms: List[str]) -> Sequence[int]:
+        """Returns the row ids of the shortest posting list among the trigrams of the terms."""
+        postings = [
+            self._row_ids_by_trigram.get(term[i : i + 3], ())
+            for term in terms
+            for i in range(len(term) - 2)
+        ]
+        if not postings:
+            # Terms shorter than a trigram are checked against every row
+            return range(len(self.keys))
+        return min(postings, key=len)
+
+    def search(self, query: str) -> Sequence[int]:
+        """
+        Returns the ids of the rows whose key contains every whitespace separated term of the query, in row order.
+
+        Args:
+            query (str): The filter typed by the user.
+
+        Example:
+            >>> index = SearchIndex(["alpha.orders", "beta.orders", "alpha.users"])
+            >>> list(index.search("alpha ord"))
+            [0]
+        """
+        query = query.lower()
+        terms = query.split()
+        if not terms:
+            return range(len(self.keys))
+
+        # Typing extends the previous query, which can only narrow its results
+        if self._last_query is not None and query.startswith(self._last_query):
+            candidates = self._last_row_ids
+        else:
+            candidates = self._get_candidates(terms)
+
+        keys = self.keys
+        row_ids = candidates
+        for term in terms:
+            row_ids = [row_id for row_id in row_ids if term in keys[row_id]]
+
+        self._last_query, self._last_row_ids = query, row_ids
+        return row_ids
+
+
+class NamespaceIndex:
+    """
+    Groups row keys by namespace, i.e. the prefix returned by helper.get_prefix().
+
+    The prefix of each key is remembered between refreshes, so an update only parses the keys that
+    were added and forgets the keys that were removed instead of matching every key again.
+    """
+
+    def __init__(self, max_namespaces: int = 9) -> None:
+        """
+        Args:
+            max_namespaces (int): The maximum number of top namespaces returned by get_top_namespaces().
+        """
+        self.max_namespaces = max_namespaces
+        self._prefix_by_key: Dict[str, Optional[str]] = {}
+        self._counts: Counter = Counter()
+
+    def update(self, keys: Sequence[str]) -> Dict[str, array]:
+        """
+        Update the index with the keys of a new snapshot.
+
+        Args:
+            keys (Sequence[str]): The key of each row, in row order.
+
+        Returns:
+            Dict[str, array]: The ids of the rows in each namespace.
+        """
+        prefix_by_key = self._prefix_by_key
+        counts = self._counts
+
+        for key in prefix_by_key.keys() - set(keys):
+            prefix = prefix_by_key.pop(key)
+            if prefix:
+                counts[prefix] -= 1
+                if not counts[prefix]:
+                    del counts[prefix]
+
+        row_ids_by_prefix = defaultdict(lambda: array("I"))
+        for row_id, key in enumerate(keys):
+            if key in prefix_by_key:
+                prefix = prefix_by_key[key]
+            else:
+                prefix = prefix_by_key[key] = helper.get_prefix(key)
+                if prefix:
+                    counts[prefix] += 1
+
+            if prefix:
+                row_ids_by_prefix[prefix].append(row_id)
+
+        return dict(row_ids_by_prefix)
+
+    def get_top_namespaces(self) -> Dict[str, int]:
+        """Returns the most common namespaces and the number of keys in each."""
+        return dict(heapq.nlargest(self.max_namespaces, self._counts.items(), key=itemgetter(1)))
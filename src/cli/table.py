@@ -0,0 +1,248 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
+
+import itertools
+
+
+class StrColumn(Sequence):
+    """
+    The string values of a column, UTF-8 encoded in a single buffer.
+
+    Each value costs its encoded length plus a 4-byte offset instead of a str object and a pointer.
+    """
+
+    def __init__(self) -> None:
+        self._data = bytearray()
+        self._ends = array("I")
+
+    @staticmethod
+    def accepts(value: Any) -> bool:
+        return isinstance(value, str)
+
+    def append(self, value: str) -> None:
+        self._data += value.encode()
+        self._ends.append(len(self._data))
+
+    def try_extend(self, values: Sequence[str]) -> bool:
+        """Appends the values at once. Returns False and appends nothing if a value is not a string."""
+        try:
+            text = "".join(values)
+        except TypeError:
+            return False
+
+        data = text.encode()
+        if len(data) == len(text):
+            # ASCII, so the byte lengths are the string lengths
+            lengths = map(len, values)
+        else:
+            lengths = (len(value.encode()) for value in values)
+        self._ends.extend(
+            itertools.islice(itertools.accumulate(lengths, initial=len(self._data)), 1, None)
+        )
+        self._data += data
+        return True
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self._ends)
+        start = self._ends[index - 1] if index else 0
+        return self._data[start : self._ends[index]].decode()
+
+    def __iter__(self):
+        data, start = self._data, 0
+        for end in self._ends:
+            yield data[start:end].decode()
+            start = end
+
+
+class IntColumn(Sequence):
+    """The integer values of a column in an 8-byte array, e.g. partition counts."""
+
+    def __init__(self) -> None:
+        self._values = array("q")
+
+    @staticmethod
+    def accepts(value: Any) -> bool:
+        return type(value) is int and -(2**63) <= value < 2**63
+
+    def append(self, value: int) -> None:
+        self._values.append(value)
+
+    def try_extend(self, values: Sequence[int]) -> bool:
+        """Appends the values at once. Returns False and appends nothing if a value is not an integer that fits."""
+        if any(type(value) is not int for value in values):
+            return False
+        try:
+            self._values.extend(array("q", values))
+        except OverflowError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> int:
+        return self._values[index]
+
+
+class ListColumn(list):
+    """The values of a column that has values of other types, e.g. None."""
+
+    @staticmethod
+    def accepts(value: Any) -> bool:
+        return True
+
+    def try_extend(self, values: Sequence) -> bool:
+        self.extend(values)
+        return True
+
+
+def format_value(value: Any) -> str:
+    """Returns the text of a value, "-" for a missing value such as a rate that is not known yet."""
+    return "-" if value is None else str(value)
+
+
+class Rows(Sequence):
+    """The rows of a table as tuples, built from the columns when they are indexed."""
+
+    def __init__(self, table: "Table") -> None:
+        self._table = table
+
+    def __len__(self) -> int:
+        return self._table.row_count
+
+    def __getitem__(self, index: int) -> Tuple:
+        return tuple(column[index] for column in self._table.columns)
+
+
+class Table(Sequence):
+    """
+    Rows of typed column values, e.g. a topic name and its partition count.
+
+    As a sequence, the table is the header line followed by one line per row. Lines are aligned
+    like tabulate's "plain" format but only formatted when they are indexed, so the view formats
+    the visible rows instead of the whole table. Column widths are updated as rows are appended.
+
+    Values are stored per column in compact arrays, see StrColumn and IntColumn, instead of a
+    tuple and an object per value, so a snapshot of many rows stays small.
+    """
+
+    SEPARATOR = "  "
+
+    def __init__(self, headers: Sequence[str], rows: Iterable[Tuple] = ()) -> None:
+        """
+        Args:
+            headers (Sequence[str]): The column headers.
+            rows (Iterable[Tuple]): The rows, one value per column.
+        """
+        self.headers = tuple(headers)
+        self.widths = [len(header) for header in self.headers]
+        self.columns: List[Sequence] = []
+        self.row_count = 0
+        self.rows = Rows(self)
+        self._sorted: Dict[Tuple[int, bool], Tuple[List[int], array]] = {}
+        self.extend(rows)
+
+    @staticmethod
+    def _new_column(value: Any) -> Sequence:
+        for column_type in (StrColumn, IntColumn):
+            if column_type.accepts(value):
+                return column_type()
+        return ListColumn()
+
+    def append(self, row: Tuple) -> None:
+        if not self.columns:
+            self.columns = [self._new_column(value) for value in row]
+
+        columns = self.columns
+        widths = self.widths
+        for column, value in enumerate(row):
+            if not columns[column].accepts(value):
+                # Fall back to a list for the values that do not fit the column, e.g. None
+                columns[column] = ListColumn(columns[column])
+            columns[column].append(value)
+
+            width = len(format_value(value))
+            if width > widths[column]:
+                widths[column] = width
+        self.row_count += 1
+
+    def extend(self, rows: Iterable[Tuple]) -> None:
+        """Appends the rows one column at a time, which is faster than appending them one by one."""
+        rows = list(rows)
+        if not rows:
+            return
+        if not self.columns:
+            self.columns = [self._new_column(value) for value in rows[0]]
+
+        columns = self.columns
+        widths = self.widths
+        for column, values in enumerate(zip(*rows)):
+            if not columns[column].try_extend(values):
+                columns[column] = ListColumn(columns[column])
+                columns[column].try_extend(values)
+
+            width = max(map(len, map(format_value, values)))
+            if width > widths[column]:
+                widths[column] = width
+        self.row_count += len(rows)
+
+    def format(self, values: Sequence) -> str:
+        """Returns the values aligned to the column widths. The last column is not padded."""
+        last = len(values) - 1
+        return self.SEPARATOR.join(
+            format_value(value)
+            if column == last
+            else format_value(value).ljust(self.widths[column])
+            for column, value in enumerate(values)
+        )
+
+    def __len__(self) -> int:
+        return self.row_count + 1 if self.headers else 0
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+
+        return self.format(self.rows[index - 1]) if index else self.format(self.headers)
+
+    def get_sorted_row_ids(self, column: int, reverse: bool = False) -> List[int]:
+        """
+        Returns the row ids ordered by the values of a column. Ties keep the row order and
+        missing values come first in ascending order.
+
+        The order is computed once per column and direction, so toggling the sort column only
+        sorts the typed values, e.g. partition counts are sorted as numbers.
+        """
+        return self._get_sorted(column, reverse)[0]
+
+    def sort_row_ids(self, row_ids: Sequence[int], column: int, reverse: bool = False) -> List[int]:
+        """Returns a subset of the row ids, e.g. the rows matching a filter, ordered by the values of a column."""
+        ranks = self._get_sorted(column, reverse)[1]
+        return sorted(row_ids, key=ranks.__getitem__)
+
+    def _get_sorted(self, column: int, reverse: bool) -> Tuple[List[int], array]:
+        sort_key = (column, reverse)
+        if sort_key not in self._sorted:
+            # The sort is stable, so ties keep the row order in both directions
+            column_values = self.columns[column] if self.columns else []
+            values = list(column_values)
+            if isinstance(column_values, ListColumn):
+                # Missing values are ordered before the others instead of failing to compare
+                values = [(False,) if value is None else (True, value) for value in values]
+            row_ids = sorted(range(self.row_count), key=values.__getitem__, reverse=reverse)
+
+            ranks = array("I", [0]) * self.row_count
+            for rank, row_id in enumerate(row_ids):
+                ranks[row_id] = rank
+            self._sorted[sort_key] = (row_ids, ranks)
+
+        return self._sorted[sort_key]
@@ -1,12 +1,24 @@
 from .color import curses_color_pair
-from curses_wrapper import ScrollManager, textbox
+from curses_wrapper import ScrollManager, LazyRows, textbox
 from .timer import Timer
 from . import helper
 
 import curses
+import curses.ascii
 import curses.textpad
+import functools
 import itertools
-import json
+import time
+
+
+# The effect of a key action, which decides the work done after the key is handled
+REPAINT = 1  # redraw the latest snapshot, e.g. after scrolling
+REFILTER = 2  # select the rows of the latest snapshot again, e.g. after typing a filter
+REFRESH = 3  # fetch the data again because the model input changed, e.g. show internal topics
+COMMAND = 4  # read a ":" command
+DESCRIBE = 5  # show the details of the selected row, e.g. the partitions of a consumer group
+BACK = 6  # go back from the details to the list they were opened from
+PRODUCE = 7  # produce messages to the selected topic
 
 
 class BaseView:
@@ -36,8 +48,21 @@ class BaseView:
         self.input = {}
         self._last_input = self.input
 
+        # The "/" filter, the sort order and the rows they select in the latest snapshot
+        self.filter = ""
+        self.is_filtering = False
+        self.sort_column = 0
+        self.reverse = False
+        self._selection = None
+        self._row_ids = None
+
+        # The action of each key, rebuilt when the controls or namespaces of the model change
+        self._keymap = {}
+        self._keymap_source = None
+
     def handle_resize(self):
         self.window.clear()
+        self.invalidate()
 
         # Set window height and y-position book-keeping
         self.max_y, self.max_x = self.window.getmaxyx()
@@ -82,10 +107,32 @@ class BaseView:
         # Create the bottom window
         self.bottom_win = self.window.subwin(1, self.max_x, self.bottom_y, 0)
 
+    def invalidate(self):
+        """Forget what was drawn so the next display repaints every window."""
+        # The content each window was last drawn from, keyed by window name
+        self._drawn = {}
+        self.scroll_manager.invalidate()
+
+    def is_damaged(self, name, content):
+        """Returns True and records the content if the named window was last drawn from different content."""
+        if self._drawn.get(name) == content:
+            return False
+        self._drawn[name] = content
+        return True
+
     def display_top_win(self, model):
         if not self.top_win or self.top_h < 0:
             return
-        
+
+        controls = model.get_sorted_controls()
+        content = (
+            tuple(model.info.items()),
+            tuple(model.namespaces.items()),
+            tuple(controls.items()),
+        )
+        if not self.is_damaged("top", content):
+            return
+
         # erase window before redrawing
         self.top_win.erase()
 
@@ -157,7 +204,7 @@ class BaseView:
 
         # Display controls
         controls_x = namespaces_x
-        chunked_controls = helper.chunk_dict(model.get_sorted_controls())
+        chunked_controls = helper.chunk_dict(controls)
         for controls in chunked_controls:
             max_k = max(len(str(k)) + len(" ") for k in controls.keys())
             max_v = max(len(str(v)) + len(" ") for v in controls.values())
@@ -196,22 +243,33 @@ class BaseView:
                 y, x, line, max_x, curses_color_pair["ORANGE_ON_BLACK"] | curses.A_BOLD
             )
 
-        self.top_win.refresh()
+        self.top_win.noutrefresh()
 
     def display_middle_win(self, model):
         if not self.middle_win:
             return
 
+        row_ids = self.get_row_ids(model)
+        if row_ids is None:
+            row_count = max(len(model.contents) - 1, 0)  # do not count header
+        else:
+            row_count = len(row_ids)
+        selection = str(model.namespaces.get(self.get_namespace(), "all"))
+        if self.filter:
+            selection += f"/{self.filter}"
+        if not self.is_damaged("middle", (model.name, row_count, selection)):
+            return
+
         # box in case the banner length changes
         self.middle_win.box()
 
         # Display banner
-        banner_line = f" {model.name}s({len(model.contents) - 1}) "
+        banner_line = f" {model.name}s({selection})[{row_count}] "
         banner_1 = f" {model.name}s"
         banner_2 = "("
-        banner_3 = "all"
+        banner_3 = selection
         banner_4 = ")["
-        banner_5 = f"{len(model.contents) - 1}"  # do not count header
+        banner_5 = f"{row_count}"
         banner_6 = f"] "
         center_x = max(self.max_x // 2 - len(banner_line) // 2 - 2, 0)
 
@@ -225,56 +283,242 @@ class BaseView:
             self.middle_win.addstr(banner_4, curses_color_pair["CYAN_ON_BLACK"])
             self.middle_win.addstr(banner_5, curses_color_pair["WHITE_ON_BLACK"] | curses.A_BOLD)
             self.middle_win.addstr(banner_6, curses_color_pair["CYAN_ON_BLACK"])
-        
-        self.middle_win.refresh()
+
+        self.middle_win.noutrefresh()
 
     def display_middle_scroll_win(self, model):
         if self.middle_scroll_win:
-
-            scroll_manager_items = []
-            for y, line in enumerate(model.contents):
-
-                # Colorize header line
-                if y == 0:
-                    item = {
-                        "line": line,
-                        "color_pair_id": curses_color_pair["WHITE_ON_BLACK"],
-                    }
-                    scroll_manager_items.append(item)
-
-                # Colorize BLACK lines
-                else:
-                    item = {
-                        "line": line,
-                        "color_pair_id": curses_color_pair["LIGHT_SKY_BLUE_ON_BLACK"],
-                    }
-                    scroll_manager_items.append(item)
-            
-            self.scroll_manager.items = scroll_manager_items
+            contents = model.contents
+            header_color_pair_id = curses_color_pair["WHITE_ON_BLACK"]
+            line_color_pair_id = curses_color_pair["LIGHT_SKY_BLUE_ON_BLACK"]
+
+            header = contents[0] if contents else ""
+            sort_column = self.get_sort_column(model)
+            if contents and (sort_column or self.reverse):
+                # Mark the sort column and direction in the header line
+                headers = list(contents.headers)
+                headers[sort_column] += "↓" if self.reverse else "↑"
+                header = contents.format(headers)
+
+            row_ids = self.get_row_ids(model)
+            if row_ids is None:
+                length = len(contents)
+                get_line = lambda y: contents[y] if y else header
+            else:
+                # Keep the header line and show the selected rows below it
+                length = len(row_ids) + 1 if contents else 0
+                get_line = lambda y: contents[row_ids[y - 1] + 1] if y else header
+
+            # Only the visible lines are materialized by the scroll manager
+            self.scroll_manager.items = LazyRows(
+                length,
+                get_line,
+                lambda y: header_color_pair_id if y == 0 else line_color_pair_id,
+            )
             self.scroll_manager.display()
 
-    def display_bottom_win(self, model):
+    def get_namespace(self):
+        return int(self.input.get("namespace", 0))
+
+    def set_namespace(self, namespace):
+        if namespace != self.input.get("namespace"):
+            self.input.update({"namespace": namespace})
+            self.scroll_manager.reset()
+
+    def get_sort_column(self, model):
+        return self.sort_column % len(model.headers) if model.headers else 0
+
+    def get_row_ids(self, model):
+        """Returns the ordered ids of the content rows in the namespace matching the filter, or None when every row is selected."""
+        # Select again only when the selection changed or a refresh published a new snapshot
+        selection = (
+            model.snapshot,
+            self.get_namespace(),
+            self.filter,
+            self.get_sort_column(model),
+            self.reverse,
+        )
+        if selection != self._selection:
+            self._row_ids = model.get_row_ids(*selection[1:])
+            self._selection = selection
+        return self._row_ids
+
+    def get_selected_key(self, model):
+        """Returns the key, i.e. the first value, of the row under the cursor, or None if the cursor is not on a row."""
+        contents = model.contents
+        row_ids = self.get_row_ids(model)
+        row_count = contents.row_count if row_ids is None else len(row_ids)
+
+        # The first line is the header
+        line = self.scroll_manager.top + self.scroll_manager.current
+        if not 0 < line <= row_count:
+            return None
+
+        row_id = line - 1 if row_ids is None else row_ids[line - 1]
+        return contents.rows[row_id][0] if row_id < contents.row_count else None
+
+    def set_filter(self, query):
+        if query != self.filter:
+            self.filter = query
+            self.scroll_manager.reset()
+
+    def handle_filter_input(self, ch):
+        """
+        Edit the filter as the user types. Enter keeps the filter and escape clears it.
+
+        Returns the effect of the key, or None if the key is not a filter key, e.g. an arrow key.
+        """
+        if ch in (curses.KEY_ENTER, ord("\n"), ord("\r")):
+            self.is_filtering = False
+            return REPAINT
+        if ch == textbox.KEY_ESCAPE:
+            self.is_filtering = False
+            self.set_filter("")
+            return REFILTER
+        if ch in (curses.ascii.BS, curses.KEY_BACKSPACE, curses.ascii.DEL):
+            self.set_filter(self.filter[:-1])
+            return REFILTER
+        if curses.ascii.isprint(ch):
+            self.set_filter(self.filter + chr(ch))
+            return REFILTER
+        return None
+
+    def get_refresh_status(self, refresher):
+        """Returns the footer text describing the freshness of the displayed snapshot."""
+        if refresher.is_refreshing:
+            return " refreshing… "
+
+        # A failed first refresh has no snapshot to be stale
+        if refresher.refreshed_at is None:
+            return " refresh failed " if refresher.error else ""
+
+        refreshed_at = time.strftime("%H:%M:%S", time.localtime(refresher.refreshed_at))
+        if refresher.is_stale():
+            return f" stale since {refreshed_at} "
+        return f" updated {refreshed_at} "
+
+    def display_bottom_win(self, model, refresher=None):
+        status = self.get_refresh_status(refresher) if refresher else ""
+        is_stale = bool(refresher) and refresher.is_stale()
+        if not self.is_damaged(
+            "bottom", (model.name, status, is_stale, self.filter, self.is_filtering)
+        ):
+            return
+
+        self.bottom_win.erase()
+
         # Display footer
         self.bottom_win.addnstr(
             0, 1, f" <{model.name.lower()}> ", self.max_x - 2,  curses_color_pair["ORANGE_ON_BLACK"]
             | curses.A_REVERSE | curses.A_BOLD
         )
 
-    def display(self, model):
+        # Display filter
+        if self.filter or self.is_filtering:
+            x = len(model.name) + 6
+            cursor = "_" if self.is_filtering else ""
+            n = self.max_x - x - 1
+            if n > 0:
+                self.bottom_win.addnstr(
+                    0,
+                    x,
+                    f"/{self.filter}{cursor}",
+                    n,
+                    curses_color_pair["FUCHSIA_ON_BLACK"] | curses.A_BOLD,
+                )
+
+        # Display refresh status
+        x = self.max_x - len(status) - 2
+        if status and x > len(model.name) + 6:
+            color_pair = "ORANGE_RED_ON_BLACK" if is_stale else "GRAY_ON_BLACK"
+            self.bottom_win.addnstr(0, x, status, len(status), curses_color_pair[color_pair])
+
+        self.bottom_win.noutrefresh()
+
+    def display(self, model, refresher=None):
+        """Repaint the windows whose content changed and flush them to the terminal at once."""
         self.display_top_win(model)
         self.display_middle_win(model)
         self.display_middle_scroll_win(model)
-        self.display_bottom_win(model)
-        self.window.refresh()
+        self.display_bottom_win(model, refresher)
+        self.window.noutrefresh()
+        curses.doupdate()
 
 
     def select_item_line(self):
        return self.scroll_manager.select_item_line()
     
     def get_ch(self):
-        ch = self.window.getch()
-        self.scroll_manager.handle_input(ch)
-        return ch
+        return self.window.getch()
+
+    def get_bindings(self):
+        """Returns the action of each key bound by the view as a (handler, effect) pair. Handlers are called with the key."""
+        bindings = {
+            ord(":"): (None, COMMAND),
+            ord("/"): (self.start_filter, REPAINT),
+            ord("o"): (self.next_sort_column, REFILTER),
+            ord("O"): (self.toggle_reverse, REFILTER),
+            curses.KEY_RESIZE: (lambda ch: self.handle_resize(), REPAINT),
+        }
+        for ch in (curses.KEY_UP, curses.KEY_DOWN, curses.KEY_LEFT, curses.KEY_RIGHT):
+            bindings[ch] = (self.scroll_manager.handle_input, REPAINT)
+        return bindings
+
+    def get_keymap(self, model):
+        """Returns the action of each key. Number keys select the namespaces of the latest snapshot."""
+        controls, namespaces = model.controls, model.namespaces
+        if (
+            self._keymap_source is None
+            or self._keymap_source[0] is not controls
+            or self._keymap_source[1] is not namespaces
+        ):
+            keymap = self.get_bindings()
+            for number in namespaces:
+                keymap[ord(str(number))] = (self.select_namespace, REFILTER)
+            self._keymap = keymap
+            self._keymap_source = (controls, namespaces)
+        return self._keymap
+
+    def dispatch(self, ch, model):
+        """
+        Run the action of a key.
+
+        Returns the effect of the action, or None if the key is not bound, so the
+        caller only redraws, filters or refreshes when the key asks for it.
+        """
+        # Keys edit the filter until the user presses enter or escape
+        if self.is_filtering:
+            effect = self.handle_filter_input(ch)
+            if effect:
+                return effect
+
+        action = self.get_keymap(model).get(ch)
+        if action is None:
+            return None
+
+        handler, effect = action
+        if handler:
+            handler(ch)
+        return effect
+
+    def start_filter(self, ch):
+        self.is_filtering = True
+
+    def select_namespace(self, ch):
+        self.set_namespace(chr(ch))
+
+    # Sorting orders the rows of the latest snapshot without a refresh
+    def next_sort_column(self, ch):
+        self.sort_column += 1
+        self.scroll_manager.reset()
+
+    def toggle_reverse(self, ch):
+        self.reverse = not self.reverse
+        self.scroll_manager.reset()
+
+    def toggle_input(self, name, ch):
+        """Toggle a boolean model input, e.g. show_internal."""
+        self.input.update({name: not self.input.get(name)})
 
     def get_command(self, model, prompt=" > "):
         # Set command window height
@@ -289,6 +533,7 @@ class BaseView:
             self.middle_win.mvwin(self.command_y + self.command_h, 0)
             self.middle_win.box()
             self.middle_win.refresh()
+            self._drawn.pop("middle", None)
             self.display_middle_win(model)
 
         # Create the command window
@@ -322,32 +567,12 @@ class TopicView(BaseView):
             "show_internal": False
         }
 
-    def get_ch(self):
-        ch = super().get_ch()
-
-        if ch in range(int(ord("0")), int(ord("9")) + 1):
-            self.input.update({"namespace": chr(ch)})
-        elif ch == ord("c"):
-            pass
-        elif ch == ord("C"): # shift-c
-            self.window.addstr(self.max_y -1, self.max_x // 2, chr(ch))
-        elif ch == curses.ascii.EOT: # ctrl-d
-            self.window.addstr(self.max_y -1, self.max_x // 2, chr(ch))
-        elif ch == ord("d"):
-            pass
-        elif ch == ord("e"):
-            pass
-        elif ch == ord("i"):
-            show_internal = not self.input.get("show_internal")
-            self.input.update({"show_internal": show_internal})
-        elif ch == ord("P"):
-            pass
-        elif ch == ord("?"):
-            pass
-        
-        self.window.addstr(self.max_y-1, self.max_x // 2, str(json.dumps(self.input["namespace"])))
-        
-        return ch
+    def get_bindings(self):
+        return {
+            **super().get_bindings(),
+            ord("i"): (functools.partial(self.toggle_input, "show_internal"), REFRESH),
+            ord("p"): (None, PRODUCE),
+        }
 
 
 class ConsumerGroupView(BaseView):
@@ -359,28 +584,24 @@ class ConsumerGroupView(BaseView):
             "show_simple": False
         }
     
-    def get_ch(self):
-        ch = super().get_ch()
-
-        if ch in range(int(ord("0")), int(ord("9")) + 1):
-            self.input.update({"namespace": chr(ch)})
-        elif ch == ord("c"):
-            pass
-        elif ch == curses.ascii.EOT: # ctrl-d
-            self.window.addstr(self.max_y-1, self.max_x // 2, 'ctrl-d')
-        elif ch == ord("d"):
-            pass
-        elif ch == ord("e"):
-            pass
-        elif ch == ord("E"):
-            show_empty = not self.input.get("show_empty")
-            self.input.update({"show_empty": show_empty})
-        elif ch == ord("s"):
-            show_simple = not self.input.get("show_simple")
-            self.input.update({"show_simple": show_simple})
-        elif ch == ord("?"):
-            pass
-
-        self.window.addstr(self.max_y-1, self.max_x // 2, str(json.dumps(self.input["namespace"])))
-        
-        return ch
\ No newline at end of file
+    def get_bindings(self):
+        return {
+            **super().get_bindings(),
+            ord("E"): (functools.partial(self.toggle_input, "show_empty"), REFRESH),
+            ord("s"): (functools.partial(self.toggle_input, "show_simple"), REFRESH),
+            ord("d"): (None, DESCRIBE),
+        }
+
+
+class ConsumerGroupLagView(BaseView):
+    def __init__(self, window):
+        super().__init__(window)
+        self.input = {
+            "namespace": 0,
+        }
+
+    def get_bindings(self):
+        return {
+            **super().get_bindings(),
+            textbox.KEY_ESCAPE: (None, BACK),
+        }
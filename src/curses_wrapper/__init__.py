@@ -1,3 +1,3 @@
 from .color import CursesColor, CursesColorPair
-from .scroll_manager import ScrollManager
+from .scroll_manager import ScrollManager, LazyRows
 from . import textbox
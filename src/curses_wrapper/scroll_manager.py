@@ -1,7 +1,49 @@
-from typing import List, Dict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 import curses
 
 
+class LazyRows(Sequence):
+    """
+    A lazy source of scroll items.
+
+    Rows are only materialized when they are indexed, so the scroll manager can page through
+    very large lists while only building the items in the visible window.
+    """
+
+    def __init__(
+        self,
+        length: int,
+        get_line: Callable[[int], str],
+        get_color_pair_id: Optional[Callable[[int], int]] = None,
+    ) -> None:
+        """
+        Args:
+            length (int): The number of rows.
+            get_line (Callable[[int], str]): Returns the line of the row at an index.
+            get_color_pair_id (Callable[[int], int]): Returns the color pair id of the row at an index.
+        """
+        self._length = length
+        self._get_line = get_line
+        self._get_color_pair_id = get_color_pair_id
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, str], List[Dict[str, str]]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("row index out of range")
+
+        item = {"line": self._get_line(index)}
+        if self._get_color_pair_id:
+            item["color_pair_id"] = self._get_color_pair_id(index)
+        return item
+
+
 class ScrollManager:
     UP = -1
     DOWN = 1
@@ -33,6 +75,7 @@ class ScrollManager:
         """
         self.window = window
         self.color_pair_id = color_pair_id
+        self.cursor_start_position = cursor_start_position
         self.has_fixed_header_line = has_fixed_header_line
 
         self.max_y, self.max_x = self.window.getmaxyx()
@@ -42,6 +85,9 @@ class ScrollManager:
         self.__items = []
         self.current_item = {}
 
+        # The lines drawn by the last display, used to repaint only the damaged lines
+        self._drawn_lines = None
+
         # Maximum visible line count for window
         self.max_lines = self.max_y
 
@@ -63,11 +109,17 @@ class ScrollManager:
         return self.__items
 
     @items.setter
-    def items(self, items: List[Dict[str, str]]):
+    def items(self, items: Sequence[Dict[str, str]]):
+        """Set the scroll items. Any sequence is accepted, e.g. a list of items or LazyRows."""
         # Update scroll book-keeping given the items
         self.__items = items
         self.bottom = len(self.__items)
 
+    def reset(self) -> None:
+        """Move the cursor back to the first item, e.g. after the items were filtered."""
+        self.top = 0
+        self.current = self.cursor_start_position
+
     def scroll(self, direction: int) -> None:
         """Scrolling the window when pressing up/down arrow keys"""
         # next cursor position after scrolling
@@ -144,60 +196,95 @@ class ScrollManager:
         """Return the line color pair id from the current item."""
         return int(self.current_item.get("color_pair_id", self.color_pair_id))
 
-    def display(self, should_highlight_max_x: bool = True) -> None:
-        """Display a scrollable list of items."""
-        # Erase the window to prevent streaking on scroll
-        self.window.erase()
+    def _pad(self, line: str, should_highlight_max_x: bool) -> str:
+        """Pad the line to the window width so the highlight spans the whole row."""
+        return line.ljust(self.max_x) if should_highlight_max_x else line
 
-        for y, item in enumerate(self.__items[self.top: self.top + self.max_lines]):
+    def invalidate(self) -> None:
+        """Forget what was drawn so the next display repaints every line."""
+        self._drawn_lines = None
 
-            line = item["line"]
-            color_pair_id = item.get("color_pair_id", self.color_pair_id)
+    def _render(self, should_highlight_max_x: bool) -> List[Tuple[str, int]]:
+        """Returns the (line, attributes) pair of each visible row and updates the current item."""
+        visible_items = self.__items[self.top : self.top + self.max_lines]
+        lines = []
 
-            if should_highlight_max_x:
-                spaces = " " * (self.max_x - len(line))
-                line += spaces
+        # Lock header line
+        if self.has_fixed_header_line and visible_items:
+            header_item = self.__items[0]
+            header_line = self._pad(header_item["line"], should_highlight_max_x)
+            header_color_pair = header_item.get("color_pair_id", self.color_pair_id)
 
-            try:
-                # Lock header line
-                if self.has_fixed_header_line:
-                    header_line = self.__items[0]["line"]
-                    header_color_pair = self.__items[0].get("color_pair_id", self.color_pair_id)
-
-                    if should_highlight_max_x:
-                        spaces = " " * (self.max_x - len(header_line))
-                        header_line += spaces
-
-                    # Ensure cursor is always on the window
-                    self.current = min(self.current, self.max_lines - 1) 
-
-                    # Highlight the current cursor header line
-                    if y == self.current == 0:
-                        self.window.addnstr(y, 0, header_line, self.max_x, header_color_pair | curses.A_REVERSE | curses.A_BOLD)
-                        self.current_item = item
-                    
-                    # Highlight the current cursor line
-                    elif y == self.current and y > 0 and y != self.max_lines:
-                        self.window.addnstr(y, 0, line, self.max_x, color_pair_id | curses.A_REVERSE | curses.A_BOLD)
-                        self.current_item = item
-
-                    # Draw fixed header line
-                    elif y == 0:
-                        self.window.addnstr(y, 0, header_line, self.max_x, header_color_pair)
-
-                    # Draw other lines
-                    elif self.max_y > 0 and y != 0:
-                        self.window.addnstr(y, 0, line, self.max_x, color_pair_id)
+            # Ensure cursor is always on the window
+            self.current = min(self.current, self.max_lines - 1)
 
+        for y, item in enumerate(visible_items):
+
+            color_pair_id = item.get("color_pair_id", self.color_pair_id)
+
+            if self.has_fixed_header_line:
+                # Highlight the current cursor header line
+                if y == self.current == 0:
+                    lines.append(
+                        (header_line, header_color_pair | curses.A_REVERSE | curses.A_BOLD)
+                    )
+                    self.current_item = item
+
+                # Highlight the current cursor line
+                elif y == self.current and y > 0 and y != self.max_lines:
+                    line = self._pad(item["line"], should_highlight_max_x)
+                    lines.append((line, color_pair_id | curses.A_REVERSE | curses.A_BOLD))
+                    self.current_item = item
+
+                # Draw fixed header line
+                elif y == 0:
+                    lines.append((header_line, header_color_pair))
+
+                # Draw other lines
+                else:
+                    lines.append((item["line"], color_pair_id))
+
+            else:
+                if y == self.current:
+                    line = self._pad(item["line"], should_highlight_max_x)
+                    lines.append((line, color_pair_id | curses.A_REVERSE | curses.A_BOLD))
+                    self.current_item = item
                 else:
-                    if y == self.current:
-                        self.window.addnstr(y, 0, line, self.max_x, color_pair_id | curses.A_REVERSE | curses.A_BOLD)
-                        self.current_item = item
-                    elif self.max_lines > 0:
-                        self.window.addnstr(y, 0, line, self.max_x, color_pair_id)
+                    lines.append((item["line"], color_pair_id))
+
+        return lines
+
+    def display(self, should_highlight_max_x: bool = True) -> None:
+        """
+        Display a scrollable list of items.
+
+        Only the items in the visible window are materialized, and only the lines that changed
+        since the last display are repainted, e.g. the old and new cursor lines when scrolling.
+        The window is staged with noutrefresh(); call curses.doupdate() to flush the frame.
+        """
+        lines = self._render(should_highlight_max_x)
+
+        if self._drawn_lines is None:
+            # Erase the window to prevent streaking after a resize or a full invalidation
+            self.window.erase()
+            drawn_lines = []
+        else:
+            drawn_lines = self._drawn_lines
+
+        for y in range(max(len(lines), len(drawn_lines))):
+            line = lines[y] if y < len(lines) else None
+            if y < len(drawn_lines) and drawn_lines[y] == line:
+                continue
 
+            try:
+                if y < len(drawn_lines):
+                    self.window.move(y, 0)
+                    self.window.clrtoeol()
+                if line:
+                    self.window.addnstr(y, 0, line[0], self.max_x, line[1])
             except curses.error:
                 # Do not crash when user scrolls to the last line of the window.
                 continue
 
-        self.window.refresh()
+        self._drawn_lines = lines
+        self.window.noutrefresh()
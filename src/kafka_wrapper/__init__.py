@@ -1,4 +1,13 @@
+from .client_pool import AdminClientPool, admin_client_pool
+from .watermark_cache import WatermarkCache
+from .watermarks import list_watermarks
 from .kafka_resource import KafkaResource
 from .broker import Broker
 from .topic import Topic
 from .consumer_group import ConsumerGroup
+from .lag_sampler import LagSampler
+from .producer import Producer
+from .async_kafka_resource import AsyncKafkaResource
+from .async_broker import AsyncBroker
+from .async_topic import AsyncTopic
+from .async_consumer_group import AsyncConsumerGroup
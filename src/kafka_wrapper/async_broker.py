@@ -0,0 +1,53 @@
+from confluent_kafka.admin import ConfigResource, ResourceType
+from .async_kafka_resource import AsyncKafkaResource
+from .broker import Broker
+from .consumer_group import ConsumerGroup
+
+import asyncio
+
+
+class AsyncBroker(AsyncKafkaResource):
+    """The asyncio variant of the Kafka Broker wrapper class."""
+
+    resource_class = Broker
+
+    async def list(self):
+        """
+        List Kafka Brokers.
+        """
+        return list(Broker._format_brokers(await self._list_topics()))
+
+    async def describe(self):
+        """
+        Describe one or many Kafka Brokers.
+        """
+        # Fetch the cluster metadata and the consumer groups concurrently
+        groups_future = self._admin_client.list_consumer_groups(
+            states=ConsumerGroup._get_states(), request_timeout=self._timeout
+        )
+        metadata, groups = await asyncio.gather(
+            self._list_topics(), asyncio.wrap_future(groups_future)
+        )
+
+        # Stable high-level consumer groups only
+        groups = ConsumerGroup._format_groups(groups)
+        counts = Broker._count_topics(metadata)
+        return Broker._format_description(metadata, counts, groups)
+
+    async def describe_configs(self, broker_id=None, dynamic_only=False):
+        """
+        Describe one Kafka Broker configurations.
+        """
+        if broker_id:
+            resource = ConfigResource(ResourceType.BROKER, str(broker_id))
+        else:
+            resource = await self._run(self._resource._get_config_resource)
+
+        # Only one ConfigResource of type BROKER is allowed per call
+        future = self._admin_client.describe_configs([resource], request_timeout=self._timeout)
+
+        results = {}
+        for config_entries in (await self._gather(future)).values():
+            results.update(Broker._format_config_entries(config_entries, dynamic_only=dynamic_only))
+
+        return results
@@ -0,0 +1,77 @@
+import asyncio
+
+from .async_kafka_resource import AsyncKafkaResource
+from .consumer_group import ConsumerGroup
+
+
+class AsyncConsumerGroup(AsyncKafkaResource):
+    """The asyncio variant of the Consumer Group wrapper class."""
+
+    resource_class = ConsumerGroup
+
+    async def list(self, show_empty=False, show_simple=False):
+        """
+        List Kafka Consumer Groups.
+        """
+        future = self._admin_client.list_consumer_groups(
+            states=ConsumerGroup._get_states(show_empty), request_timeout=self._timeout
+        )
+        groups = await asyncio.wrap_future(future)
+        return ConsumerGroup._format_groups(groups, show_simple=show_simple)
+
+    async def does_exist(self, group_id):
+        return any([g for g in await self.list() if g["id"] == group_id])
+
+    async def describe(self, group_ids=[], include_offset_lag=True, show_empty=False):
+        # Default to listing all group ids
+        if not group_ids:
+            group_ids = [group["id"] for group in await self.list(show_empty=show_empty)]
+
+        # There are no group ids on the cluster
+        if not group_ids:
+            return {}
+
+        future = self._admin_client.describe_consumer_groups(
+            group_ids, request_timeout=self._timeout
+        )
+        groups_metadata = await self._gather(future)
+
+        offsets = {}
+        if include_offset_lag:
+            offsets = await self.get_groups_offset_lag(
+                ConsumerGroup._get_groups_topic_partitions(groups_metadata)
+            )
+
+        return {
+            group_id: ConsumerGroup._format_group(
+                group_id, group_metadata, offsets.get(group_id, {})
+            )
+            for group_id, group_metadata in groups_metadata.items()
+        }
+
+    async def get_groups_offset_lag(self, group_topic_partitions, max_staleness_ms=None):
+        """
+        Get the offset lag for all partitions of many Consumer Groups at once, see
+        ConsumerGroup.get_groups_offset_lag().
+
+        The committed offsets are awaited on the loop. The watermark cache blocks while another
+        caller fetches the same partitions, so only the watermarks are looked up on the executor.
+        """
+        futures = self._resource._list_committed_offsets(group_topic_partitions)
+        committed = self._resource._format_committed_offsets(await self._gather(futures))
+
+        watermarks = {}
+        if committed:
+            watermarks = await self._run(
+                self._resource._get_watermarks,
+                [key for offsets in committed.values() for key in offsets],
+                max_staleness_ms,
+            )
+
+        return ConsumerGroup._format_groups_offset_lag(
+            group_topic_partitions, committed, watermarks
+        )
+
+    async def delete(self, group_ids):
+        future = self._admin_client.delete_consumer_groups(group_ids, request_timeout=self._timeout)
+        await self._gather(future)
@@ -0,0 +1,90 @@
+import asyncio
+import functools
+
+
+class AsyncKafkaResource:
+    """
+    A base class for the asyncio variants of the Kafka resource wrappers.
+
+    The AdminClient returns concurrent.futures.Future objects which are bridged into awaitables,
+    so independent requests run concurrently on the event loop. Calls that only exist in a
+    blocking form (e.g. list_topics) run on the loop's executor.
+    """
+
+    resource_class = None
+
+    def __init__(
+        self,
+        admin_client_config=None,
+        timeout=10,
+        log_level=None,
+        admin_client_pool=None,
+        executor=None,
+    ):
+        """
+        Args:
+            admin_client_config (dict): The Kafka AdminClient configuration.
+            timeout (int): The timeout for kafka operations.
+            log_level (str): The logging level to use for the logger and console handler. Defaults to "NOTSET".
+            admin_client_pool (AdminClientPool): The pool to share AdminClients from. Defaults to the global pool.
+            executor (concurrent.futures.Executor): Runs blocking calls. Defaults to the loop's default executor.
+        """
+        self._resource = self.resource_class(
+            admin_client_config=admin_client_config,
+            timeout=timeout,
+            log_level=log_level,
+            admin_client_pool=admin_client_pool,
+        )
+        self._executor = executor
+
+    def __str__(self):
+        return f"Async{self._resource}"
+
+    @property
+    def resource(self):
+        """Returns the wrapped synchronous resource."""
+        return self._resource
+
+    @property
+    def admin_client(self):
+        return self._resource.admin_client
+
+    @admin_client.setter
+    def admin_client(self, value):
+        self._resource.admin_client = value
+
+    @property
+    def _admin_client(self):
+        return self._resource._admin_client
+
+    @property
+    def _timeout(self):
+        return self._resource._timeout
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking call on the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _list_topics(self):
+        """Returns the cluster metadata. Only a fetch runs on the executor, a fresh snapshot is returned at once."""
+        metadata = self._resource.metadata_cache.peek()
+        if metadata is None:
+            metadata = await self._run(self._resource._list_topics)
+        return metadata
+
+    @staticmethod
+    async def _gather(futures):
+        """Await a mapping of AdminClient futures and return a mapping of their results."""
+        keys = list(futures.keys())
+        values = await asyncio.gather(*(asyncio.wrap_future(futures[k]) for k in keys))
+        return dict(zip(keys, values))
+
+    def close(self):
+        self._resource.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,75 @@
+from confluent_kafka.admin import NewTopic, ConfigResource
+from .async_kafka_resource import AsyncKafkaResource
+from .topic import Topic
+
+
+class AsyncTopic(AsyncKafkaResource):
+    """The asyncio variant of the Kafka Topic wrapper class."""
+
+    resource_class = Topic
+
+    async def list(self, show_internal=False):
+        metadata = await self._list_topics()
+        return list(Topic._format_topics(metadata.topics, show_internal=show_internal))
+
+    async def does_exist(self, topic_name):
+        # Metadata of a single topic is only requested in a blocking call
+        return await self._run(self._resource.does_exist, topic_name)
+
+    async def create(self, topic_name, num_partitions, replication_factor, config={}):
+        new_topic = NewTopic(
+            topic_name,
+            num_partitions=num_partitions,
+            replication_factor=replication_factor,
+            config=config,
+        )
+        future = self._admin_client.create_topics([new_topic], request_timeout=self._timeout)
+
+        # Invalidate once the operation completed, a fetch in between would cache the old metadata
+        try:
+            results = await self._gather(future)
+        finally:
+            self._resource.metadata_cache.invalidate()
+        return results[topic_name]
+
+    async def describe(self, topic_names=[], show_internal=False):
+        if topic_names:
+            topics_metadata = await self._run(self._resource._list_topics_by_name, topic_names)
+        else:
+            topics_metadata = (await self._list_topics()).topics
+
+        return dict(Topic._format_descriptions(topics_metadata))
+
+    async def describe_configs(self, topic_names=[]):
+        """
+        Describe one or many Kafka Topic configurations.
+        """
+        resources = await self._run(self._resource._get_config_resources, topic_names)
+        future = self._admin_client.describe_configs(resources)
+
+        results = await self._gather(future)
+        return {
+            topic.name: self._resource._format_config_entries(config_entries)
+            for topic, config_entries in results.items()
+        }
+
+    async def alter(self, topic_name, config, overwrite=True):
+        resource = ConfigResource("topic", topic_name)
+        for k, v in config.items():
+            resource.set_config(k, v, overwrite=overwrite)
+
+        future = self._admin_client.alter_configs([resource])
+
+        try:
+            results = await self._gather(future)
+        finally:
+            self._resource.metadata_cache.invalidate()
+        return next(iter(results.values()), None)
+
+    async def delete(self, topic_names):
+        future = self._admin_client.delete_topics(topic_names, operation_timeout=self._timeout)
+
+        try:
+            await self._gather(future)
+        finally:
+            self._resource.metadata_cache.invalidate()
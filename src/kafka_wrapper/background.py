@@ -0,0 +1,74 @@
+import threading
+import time
+
+
+class BackgroundLoop:
+    """
+    Calls a function every interval seconds on a daemon thread, e.g. to refresh a cache or take samples.
+
+    stop() does not wait for a call that is running. Each start() gets new events and joins the
+    thread of the previous start, so a restarted loop never shares its events with an old thread.
+    """
+
+    def __init__(self, name):
+        """
+        Args:
+            name (str): The name of the thread.
+        """
+        self.name = name
+        self._thread = None
+        self._stopped = None
+        self._wake = None
+
+    @property
+    def is_running(self):
+        return self._thread is not None and not self._stopped.is_set()
+
+    def start(self, target, interval, delay_first=False):
+        """
+        Start calling the target. Does nothing if the loop is running.
+
+        Args:
+            target (callable): Called without arguments. It handles its own errors.
+            interval (float): The number of seconds between the start of calls. A call that
+                takes longer delays the next one instead of piling up.
+            delay_first (bool): Wait an interval before the first call instead of calling at once.
+        """
+        if self.is_running:
+            return
+
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+
+        self._stopped, self._wake = threading.Event(), threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(target, self._stopped, self._wake, interval, delay_first),
+            name=self.name,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def wake(self):
+        """Call the target as soon as possible instead of at the next interval."""
+        if self._wake:
+            self._wake.set()
+
+    def stop(self):
+        """Stop calling the target. A call that is running is not waited for."""
+        if self._stopped:
+            self._stopped.set()
+            self._wake.set()
+
+    def _run(self, target, stopped, wake, interval, delay_first):
+        delay = interval if delay_first else 0
+        while True:
+            if delay > 0:
+                wake.wait(delay)
+            wake.clear()
+            if stopped.is_set():
+                break
+
+            start = time.perf_counter()
+            target()
+            delay = interval - (time.perf_counter() - start)
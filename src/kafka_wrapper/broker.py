@@ -1,20 +1,33 @@
+from concurrent.futures import wait, FIRST_COMPLETED
 from confluent_kafka.admin import ConfigResource, ConfigSource, ResourceType
 from .kafka_resource import KafkaResource
 from .consumer_group import ConsumerGroup
 
+import time
+
+# The default maximum number of outstanding per-broker requests
+MAX_IN_FLIGHT = 10
+
 
 class Broker(KafkaResource):
-    def __init__(self, admin_client_config, timeout=10, log_level=None):
+    def __init__(
+        self, admin_client_config=None, timeout=10, log_level=None, admin_client_pool=None
+    ):
         """
         The Kafka Broker wrapper class.
         Args:
             admin_client_config (dict): The Kafka AdminClient configuration.
             timeout (int): The timeout for kafka operations.
             log_level (str): The logging level to use for the logger and console handler. Defaults to "NOTSET".
+            admin_client_pool (AdminClientPool): The pool to share AdminClients from. Defaults to the global pool.
         """
         super().__init__(
-            admin_client_config=admin_client_config, timeout=timeout, log_level=log_level
+            admin_client_config=admin_client_config,
+            timeout=timeout,
+            log_level=log_level,
+            admin_client_pool=admin_client_pool,
         )
+        self._consumer_group = None
 
     def __str__(self):
         return "Broker"
@@ -23,19 +36,22 @@ class Broker(KafkaResource):
         """
         List Kafka Brokers.
         """
-        metadata = self._admin_client.list_topics(timeout=self._timeout)
+        return list(self.iter_list())
 
-        brokers = []
-        for broker_id, broker_metadata in metadata.brokers.items():
-            brokers.append(
-                {
-                    "name": broker_id,
-                    "type": "controller" if broker_id == metadata.controller_id else "worker",
-                    "endpoint": f"{broker_metadata.host}:{broker_metadata.port}",
-                }
-            )
+    def iter_list(self):
+        """
+        List Kafka Brokers and yield each broker as it is formatted, so a caller can stream them.
+        """
+        yield from self._format_brokers(self._list_topics())
 
-        return brokers
+    @staticmethod
+    def _format_brokers(metadata):
+        for broker_id, broker_metadata in metadata.brokers.items():
+            yield {
+                "name": broker_id,
+                "type": "controller" if broker_id == metadata.controller_id else "worker",
+                "endpoint": f"{broker_metadata.host}:{broker_metadata.port}",
+            }
 
     def create(self):
         """
@@ -47,34 +63,45 @@ class Broker(KafkaResource):
         """
         Describe one or many Kafka Brokers.
         """
-        metadata = self._admin_client.list_topics(timeout=self._timeout)
+        metadata = self._list_topics()
+        counts = self._count_topics(metadata)
 
-        results = {}
-        topics = []
-        partitions = []
-        replicas = []
-        groups = []
+        if not isinstance(consumer_group, ConsumerGroup):
+            if not self._consumer_group:
+                # Shares the pooled AdminClient of this broker
+                self._consumer_group = ConsumerGroup(
+                    self._admin_client_config,
+                    timeout=self._timeout,
+                    admin_client_pool=self._admin_client_pool,
+                )
+            consumer_group = self._consumer_group
 
-        for topic_name, topic in metadata.topics.items():
-            topics.append(topic)
+        # Stable high-level consumer groups only
+        groups = consumer_group.list()
 
-            for partition in topic.partitions.values():
-                partitions.append(partition)
+        return self._format_description(metadata, counts, groups)
 
-                for broker in partition.replicas:
-                    replicas.append(replicas)
+    @staticmethod
+    def _count_topics(metadata):
+        """Returns the number of topics, partitions and replicas in the cluster metadata."""
+        topics = 0
+        partitions = 0
+        replicas = 0
 
-        if isinstance(consumer_group, ConsumerGroup):
-            self._consumer_group = consumer_group
-        else:
-            self._consumer_group = ConsumerGroup(self._admin_client_config, timeout=self._timeout)
+        for topic_name, topic in metadata.topics.items():
+            topics += 1
 
-        groups = self._consumer_group.list(only_stable=True, only_high_level=True)
+            for partition in topic.partitions.values():
+                partitions += 1
+                replicas += len(partition.replicas)
 
+        return {"topics": topics, "partitions": partitions, "replicas": replicas}
+
+    @staticmethod
+    def _format_description(metadata, counts, groups):
+        results = {}
         results["brokers"] = len(metadata.brokers.values())
-        results["topics"] = len(topics)
-        results["partitions"] = len(partitions)
-        results["replicas"] = len(replicas)
+        results.update(counts)
         results["consumer_groups"] = len(groups)
 
         return results
@@ -83,62 +110,180 @@ class Broker(KafkaResource):
         """
         Describe one Kafka Broker configurations.
         """
-        metadata = self._admin_client.list_topics(timeout=self._timeout)
-
-        if broker_id:
-            resource = ConfigResource(ResourceType.BROKER, str(broker_id))
-        else:
-            resource = ConfigResource(ResourceType.BROKER, str(metadata.controller_id))
+        resource = self._get_config_resource(broker_id)
 
         # Only one ConfigResource of type BROKER is allowed per call
         future = self._admin_client.describe_configs([resource], request_timeout=self._timeout)
 
         results = {}
         for res, f in future.items():
-            config_entries = f.result()
+            results.update(self._format_config_entries(f.result(), dynamic_only=dynamic_only))
+
+        return results
 
-            for config_entry in config_entries.values():
+    def _get_config_resource(self, broker_id=None):
+        """Returns the config resource of the broker, defaulting to the controller."""
+        if not broker_id:
+            broker_id = self._list_topics().controller_id
 
-                # https://docs.confluent.io/platform/current/kafka/dynamic-config.html
-                if dynamic_only and (config_entry.is_read_only or not config_entry.value):
-                    continue
+        return ConfigResource(ResourceType.BROKER, str(broker_id))
 
-                # https://docs.confluent.io/platform/current/kafka/dynamic-config.html#updating-ssl-trust-store-of-an-existing-listener
-                if dynamic_only and (
-                    config_entry.name in ["ssl.keystore.type", "ssl.truststore.type"]
-                ):
-                    continue
+    @staticmethod
+    def _format_config_entries(config_entries, dynamic_only=False):
+        results = {}
+        for config_entry in config_entries.values():
 
-                results[config_entry.name] = config_entry.value
+            # https://docs.confluent.io/platform/current/kafka/dynamic-config.html
+            if dynamic_only and (config_entry.is_read_only or not config_entry.value):
+                continue
+
+            # https://docs.confluent.io/platform/current/kafka/dynamic-config.html#updating-ssl-trust-store-of-an-existing-listener
+            if dynamic_only and (config_entry.name in ["ssl.keystore.type", "ssl.truststore.type"]):
+                continue
+
+            results[config_entry.name] = config_entry.value
 
         return results
 
-    def alter(self, config, broker_ids=[], overwrite=True):
+    def describe_all_configs(self, broker_ids=[], dynamic_only=False, max_in_flight=MAX_IN_FLIGHT):
         """
-        Alter configuration for all brokers in the Kafka Cluster atomically, replacing non-specified configuration properties with the cluster default values.
+        Describe the configurations of many Kafka Brokers in parallel.
+
+        Args:
+            broker_ids (list): The brokers to describe. Defaults to all brokers in the cluster.
+            dynamic_only (bool): Only include the dynamically updatable configurations.
+            max_in_flight (int): The maximum number of outstanding describe requests.
+        Returns:
+            dict: A mapping of broker id to {"status": "OK", "configs": {...}} or {"status": "ERROR", "error": "..."}.
         """
-        metadata = self._admin_client.list_topics(timeout=self._timeout)
 
-        if broker_ids:
-            resources = [
-                ConfigResource(ResourceType.BROKER, str(broker_id)) for broker_id in broker_ids
-            ]
-        else:
-            # get all kafka broker ids
-            resources = [
-                ConfigResource(ResourceType.BROKER, str(broker_id))
-                for broker_id, md in metadata.brokers.items()
-            ]
+        def describe_configs(broker_id):
+            # Only one ConfigResource of type BROKER is allowed per call
+            resource = ConfigResource(ResourceType.BROKER, str(broker_id))
+            return self._admin_client.describe_configs([resource], request_timeout=self._timeout)
+
+        results = {}
+        for broker_id, (config_entries, error) in self._fan_out(
+            broker_ids or self._get_broker_ids(), describe_configs, max_in_flight
+        ).items():
+            if error:
+                results[broker_id] = {"status": "ERROR", "error": str(error)}
+            else:
+                results[broker_id] = {
+                    "status": "OK",
+                    "configs": self._format_config_entries(config_entries or {}, dynamic_only),
+                }
 
-        for resource in resources:
+        return results
+
+    def alter(
+        self,
+        config,
+        broker_ids=[],
+        overwrite=True,
+        max_in_flight=MAX_IN_FLIGHT,
+        rolling=False,
+        wave_delay=0,
+    ):
+        """
+        Alter configuration for all brokers in the Kafka Cluster atomically, replacing non-specified configuration properties with the cluster default values.
+
+        Args:
+            config (dict): The configuration properties to set.
+            broker_ids (list): The brokers to alter. Defaults to all brokers in the cluster.
+            overwrite (bool): Overwrite the existing configuration properties.
+            max_in_flight (int): The maximum number of outstanding alter requests.
+            rolling (bool): Alter the brokers in waves of max_in_flight brokers, waiting for each wave to complete.
+            wave_delay (float): The number of seconds to wait between waves in rolling mode.
+        Returns:
+            dict: A mapping of broker id to {"status": "OK"} or {"status": "ERROR", "error": "..."}.
+                A broker that fails does not raise, so the other brokers are still altered.
+        """
+
+        def alter_configs(broker_id):
+            resource = ConfigResource(ResourceType.BROKER, str(broker_id))
             for k, v in config.items():
                 resource.set_config(k, v, overwrite=overwrite)
 
             # Only one ConfigResource of type BROKER is allowed per call
-            future = self._admin_client.alter_configs([resource])
+            return self._admin_client.alter_configs([resource])
+
+        results = {}
+        for broker_id, (_, error) in self._fan_out(
+            broker_ids or self._get_broker_ids(),
+            alter_configs,
+            max_in_flight,
+            rolling=rolling,
+            wave_delay=wave_delay,
+        ).items():
+            if error:
+                results[broker_id] = {"status": "ERROR", "error": str(error)}
+            else:
+                results[broker_id] = {"status": "OK"}
+
+        self._metadata_cache.invalidate()
+
+        return results
 
-            for res, f in future.items():
-                f.result()
+    def _get_broker_ids(self):
+        # get all kafka broker ids
+        return [broker_id for broker_id, md in self._list_topics().brokers.items()]
+
+    @staticmethod
+    def _fan_out(broker_ids, request, max_in_flight, rolling=False, wave_delay=0):
+        """
+        Issue one request per broker while keeping at most max_in_flight requests outstanding.
+
+        Args:
+            broker_ids (list): The brokers to send a request to.
+            request (callable): Sends the request for a broker id and returns the AdminClient futures.
+            max_in_flight (int): The maximum number of outstanding requests.
+            rolling (bool): Send the requests in waves, waiting for each wave to complete.
+            wave_delay (float): The number of seconds to wait between waves in rolling mode.
+        Returns:
+            dict: A mapping of broker id to a (result, error) tuple. Errors are recorded, not raised.
+        """
+        max_in_flight = max(1, max_in_flight)
+        results = {}
+        in_flight = {}
+
+        def collect(futures):
+            for f in futures:
+                broker_id = in_flight.pop(f)
+                try:
+                    results[broker_id] = (f.result(), None)
+                except Exception as e:
+                    results[broker_id] = (None, e)
+
+        for i, broker_id in enumerate(broker_ids):
+            if rolling and i and i % max_in_flight == 0:
+                # Wait for the whole wave before starting the next one
+                collect(list(in_flight))
+                time.sleep(wave_delay)
+            elif len(in_flight) >= max_in_flight:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                collect(done)
+
+            # A request that fails before it is sent is recorded without abandoning the requests in flight
+            try:
+                futures = request(broker_id)
+            except Exception as e:
+                results[broker_id] = (None, e)
+                continue
+
+            results[broker_id] = (None, None)
+            for res, f in futures.items():
+                in_flight[f] = broker_id
+
+        collect(list(in_flight))
+
+        return results
 
     def delete(self):
         raise NotImplemented
+
+    def close(self):
+        """Release the pooled AdminClients of this broker and its consumer group."""
+        if self._consumer_group:
+            self._consumer_group.close()
+        super().close()
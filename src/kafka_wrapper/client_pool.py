@@ -0,0 +1,154 @@
+from collections.abc import Hashable
+from confluent_kafka.admin import AdminClient
+from .metadata_cache import MetadataCache
+from .watermark_cache import WatermarkCache
+from .watermarks import list_watermarks
+
+import threading
+
+
+# Looking up a topic by name, e.g. Topic.does_exist(), must not create it on brokers with
+# auto.create.topics.enable, which the AdminClient allows by default
+DEFAULT_CONFIG = {
+    "allow.auto.create.topics": False,
+}
+
+
+class AdminClientPool:
+    """A registry of Kafka AdminClients shared by every resource with the same configuration."""
+
+    def __init__(
+        self,
+        client_factory=AdminClient,
+        metadata_ttl=5,
+        watermark_max_staleness=1,
+        watermark_refresh_interval=0,
+    ):
+        """
+        Initialize a new, empty pool.
+        Args:
+            client_factory (callable): Creates a new client from an AdminClient configuration.
+            metadata_ttl (float): The number of seconds the cluster metadata of a pooled client is reused.
+            watermark_max_staleness (float): The default number of seconds the partition watermarks of a pooled client are reused.
+            watermark_refresh_interval (float): The number of seconds between background refreshes of the
+                watermarks that readers of a pooled client keep reading, see WatermarkCache.start().
+                Zero, the default, disables the refresh.
+        """
+        self._client_factory = client_factory
+        self._metadata_ttl = metadata_ttl
+        self._watermark_max_staleness = watermark_max_staleness
+        self._watermark_refresh_interval = watermark_refresh_interval
+        self._clients = {}
+        self._metadata_caches = {}
+        self._watermark_caches = {}
+        self._ref_counts = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(admin_client_config):
+        """
+        Returns the pool key for an AdminClient configuration.
+
+        Unhashable values (e.g. callbacks) are keyed by identity.
+        """
+        return tuple(
+            sorted(
+                (k, v if isinstance(v, Hashable) else id(v)) for k, v in admin_client_config.items()
+            )
+        )
+
+    def acquire(self, admin_client_config):
+        """
+        Returns the pooled AdminClient for the configuration, creating it on first use.
+        The client is created with DEFAULT_CONFIG unless the configuration overrides it.
+        Every acquire should be paired with a release.
+        """
+        key = self.key(admin_client_config)
+
+        with self._lock:
+            if key not in self._clients:
+                client = self._clients[key] = self._client_factory(
+                    {**DEFAULT_CONFIG, **admin_client_config}
+                )
+                self._metadata_caches[key] = MetadataCache(ttl=self._metadata_ttl)
+                self._watermark_caches[key] = self._new_watermark_cache(client)
+                self._ref_counts[key] = 0
+
+            self._ref_counts[key] += 1
+            return self._clients[key]
+
+    def release(self, admin_client_config):
+        """
+        Releases one reference to the pooled AdminClient for the configuration.
+        The client stays warm in the pool until it is pruned or the pool is closed.
+        """
+        key = self.key(admin_client_config)
+
+        with self._lock:
+            if self._ref_counts.get(key, 0) > 0:
+                self._ref_counts[key] -= 1
+
+    def metadata_cache(self, admin_client_config):
+        """Returns the cluster metadata cache shared by the users of the pooled AdminClient."""
+        key = self.key(admin_client_config)
+
+        with self._lock:
+            if key not in self._metadata_caches:
+                self._metadata_caches[key] = MetadataCache(ttl=self._metadata_ttl)
+            return self._metadata_caches[key]
+
+    def watermark_cache(self, admin_client_config):
+        """Returns the partition watermark cache shared by the users of the pooled AdminClient."""
+        key = self.key(admin_client_config)
+
+        with self._lock:
+            if key not in self._watermark_caches:
+                self._watermark_caches[key] = self._new_watermark_cache(self._clients.get(key))
+            return self._watermark_caches[key]
+
+    def _new_watermark_cache(self, client):
+        watermark_cache = WatermarkCache(max_staleness=self._watermark_max_staleness)
+
+        # Readers that read the same partitions more often than max_staleness, e.g. a lag view
+        # refreshed every second, find them in the cache instead of waiting on the broker
+        if client is not None and self._watermark_refresh_interval:
+            watermark_cache.start(
+                lambda topic_partitions: list_watermarks(client, topic_partitions),
+                interval=self._watermark_refresh_interval,
+            )
+        return watermark_cache
+
+    def ref_count(self, admin_client_config):
+        """Returns the number of unreleased references to the pooled AdminClient."""
+        return self._ref_counts.get(self.key(admin_client_config), 0)
+
+    def prune(self):
+        """Drops every pooled AdminClient that is no longer referenced."""
+        with self._lock:
+            for key in [k for k, count in self._ref_counts.items() if count == 0]:
+                del self._clients[key]
+                del self._ref_counts[key]
+                self._metadata_caches.pop(key, None)
+                watermark_cache = self._watermark_caches.pop(key, None)
+                if watermark_cache:
+                    watermark_cache.stop()
+
+    def close(self):
+        """Drops every pooled AdminClient. The broker connections are closed once the clients are garbage collected."""
+        with self._lock:
+            self._clients.clear()
+            self._ref_counts.clear()
+            self._metadata_caches.clear()
+            for watermark_cache in self._watermark_caches.values():
+                watermark_cache.stop()
+            self._watermark_caches.clear()
+
+    def __contains__(self, admin_client_config):
+        return self.key(admin_client_config) in self._clients
+
+    def __len__(self):
+        return len(self._clients)
+
+
+# The pool shared by every KafkaResource unless another pool is provided
+admin_client_pool = AdminClientPool()
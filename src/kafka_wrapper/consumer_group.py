@@ -1,20 +1,32 @@
-from confluent_kafka import ConsumerGroupState, Consumer, OFFSET_INVALID
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from confluent_kafka import (
+    ConsumerGroupState,
+    ConsumerGroupTopicPartitions,
+    TopicPartition,
+    OFFSET_INVALID,
+)
 from confluent_kafka import KafkaException, KafkaError
 from .kafka_resource import KafkaResource
 from .topic import Topic
 
 
 class ConsumerGroup(KafkaResource):
-    def __init__(self, admin_client_config=None, timeout=10, log_level=None):
+    def __init__(
+        self, admin_client_config=None, timeout=10, log_level=None, admin_client_pool=None
+    ):
         """
         The Consumer Group wrapper class.
         Args:
             admin_client_config (dict): The Kafka AdminClient configuration.
             timeout (int): The timeout for kafka operations.
             log_level (str): The logging level to use for the logger and console handler. Defaults to "NOTSET".
+            admin_client_pool (AdminClientPool): The pool to share AdminClients from. Defaults to the global pool.
         """
         super().__init__(
-            admin_client_config=admin_client_config, timeout=timeout, log_level=log_level
+            admin_client_config=admin_client_config,
+            timeout=timeout,
+            log_level=log_level,
+            admin_client_pool=admin_client_pool,
         )
 
     def __str__(self):
@@ -40,6 +52,13 @@ class ConsumerGroup(KafkaResource):
         """
         List Kafka Consumer Groups.
         """
+        future = self._admin_client.list_consumer_groups(
+            states=self._get_states(show_empty), request_timeout=self._timeout
+        )
+        return self._format_groups(future.result(), show_simple=show_simple)
+
+    @staticmethod
+    def _get_states(show_empty=False):
         states = set()
 
         states.add(ConsumerGroupState.STABLE)
@@ -47,11 +66,10 @@ class ConsumerGroup(KafkaResource):
         if show_empty:
             states.add(ConsumerGroupState.EMPTY)
 
-        future = self._admin_client.list_consumer_groups(
-            states=states, request_timeout=self._timeout
-        )
-        groups = future.result()
+        return states
 
+    @staticmethod
+    def _format_groups(groups, show_simple=False):
         consumer_groups = []
         for group in groups.valid:
 
@@ -118,54 +136,194 @@ class ConsumerGroup(KafkaResource):
 
         consumer.subscribe(topics)
 
-    def get_offset_lag(self, topic_partitions, consumer=None):
+    def get_offset_lag(
+        self, topic_partitions, consumer=None, *, group_id="k4", max_staleness_ms=None
+    ):
+        """
+        Get the offset lag of the given partitions for a Consumer Group.
+        Args:
+            topic_partitions (list): The TopicPartitions to get the offset lag of.
+            consumer (Consumer): A consumer whose group's committed offsets are used instead of
+                those of group_id. The consumer is closed afterwards.
+            group_id (str): The group whose committed offsets are compared to the high watermarks.
+            max_staleness_ms (float): The age up to which cached watermarks are used. Defaults to the cache setting.
+        Returns:
+            dict: A mapping of topic to partition to offset lag.
+        """
+        if consumer is None:
+            results = self.get_groups_offset_lag({group_id: topic_partitions}, max_staleness_ms)
+            return results[group_id]
+
+        try:
+            committed = consumer.committed(topic_partitions, timeout=self._timeout)
+        finally:
+            consumer.close()
+
+        watermarks = self._get_watermarks(
+            ((tp.topic, tp.partition) for tp in committed), max_staleness_ms
+        )
+
         result = {}
+        for tp in committed:
+            result.setdefault(tp.topic, {})[tp.partition] = self._format_offset_lag(
+                tp.offset, *watermarks[(tp.topic, tp.partition)]
+            )
 
-        if not consumer:
-            # TODO will need to revisit this when we add authentication.
+        return result
 
-            # This consumer will not join the group, but the group.id is required by
-            # committed() to know which group to get offsets for.
-            consumer_config = {
-                "bootstrap.servers": self._admin_client_config["bootstrap.servers"],
-                "group.id": "k4",
-            }
-            consumer = Consumer(consumer_config)
+    def get_committed_offsets(self, group_topic_partitions):
+        """
+        Get the committed offsets of many Consumer Groups at once.
 
-        # Query committed offsets for this group and the given partitions
-        committed = consumer.committed(topic_partitions, timeout=self._timeout)
+        The offsets are listed through the AdminClient, so the security settings of the admin
+        configuration apply. The API takes one group per request, and the requests of every
+        group are sent before waiting on any of them so the groups are fetched concurrently.
 
-        for partition in committed:
-            # Get the partitions low and high watermark offsets.
-            (lo, hi) = consumer.get_watermark_offsets(
-                partition, timeout=self._timeout, cached=False
+        Args:
+            group_topic_partitions (dict): A mapping of group id to a list of TopicPartitions,
+                or to None for every partition the group committed an offset for.
+        Returns:
+            dict: A mapping of group id to (topic, partition) to the committed offset. The
+                partitions whose offset could not be fetched are left out.
+        """
+        futures = self._list_committed_offsets(group_topic_partitions)
+        return self._format_committed_offsets(
+            {group_id: f.result() for group_id, f in futures.items()}
+        )
+
+    def _list_committed_offsets(self, group_topic_partitions):
+        """Send the committed offsets request of every group and return a mapping of group id to its future."""
+        futures = {}
+        for group_id, topic_partitions in group_topic_partitions.items():
+            if topic_partitions is None:
+                request = ConsumerGroupTopicPartitions(group_id)
+                futures.update(
+                    self._admin_client.list_consumer_group_offsets(
+                        [request], request_timeout=self._timeout
+                    )
+                )
+                continue
+
+            # Members of the same group can not share partitions, but deduplicate in case
+            # the caller passed overlapping lists.
+            keys = dict.fromkeys((tp.topic, tp.partition) for tp in topic_partitions)
+            if not keys:
+                continue
+
+            request = ConsumerGroupTopicPartitions(
+                group_id, [TopicPartition(t, p) for t, p in keys]
             )
+            futures.update(
+                self._admin_client.list_consumer_group_offsets(
+                    [request], request_timeout=self._timeout
+                )
+            )
+
+        return futures
+
+    def _format_committed_offsets(self, groups):
+        """Returns a mapping of group id to (topic, partition) to the committed offset of listed ConsumerGroupTopicPartitions."""
+        results = {}
+        for group_id, group in groups.items():
+            results[group_id] = {}
+            for tp in group.topic_partitions:
+                # The offset of a partition that failed is not a committed offset
+                if tp.error:
+                    self.logger.warning(
+                        "Skipping the committed offset of %s for %s [%d]: %s",
+                        group_id,
+                        tp.topic,
+                        tp.partition,
+                        tp.error,
+                    )
+                    continue
+                results[group_id][(tp.topic, tp.partition)] = tp.offset
+
+        return results
+
+    def get_group_offsets(self, group_ids, max_staleness_ms=None):
+        """
+        Get the committed offset and the log end offset of every partition Consumer Groups committed to.
+
+        Partitions without a committed offset or a known log end offset are left out.
+
+        Args:
+            group_ids (list): The groups to get the offsets of.
+            max_staleness_ms (float): The age up to which cached watermarks are used. Defaults to the cache setting.
+        Returns:
+            dict: A mapping of group id to (topic, partition) to the (committed, log end) offsets.
+        """
+        committed = self.get_committed_offsets(dict.fromkeys(group_ids))
+        watermarks = self._get_watermarks(
+            (key for offsets in committed.values() for key in offsets), max_staleness_ms
+        )
 
-            if partition.offset == OFFSET_INVALID:
-                current_offset = "-"
-            else:
-                current_offset = "%d" % (partition.offset)
-
-            if hi < 0:
-                lag = "no hwmark"  # Unlikely
-            elif partition.offset < 0:
-                # No committed offset, show total message count as lag.
-                # The actual message count may be lower due to compaction
-                # and record deletions.
-                lag = "%d" % (hi - lo)
-            else:
-                lag = "%d" % (hi - partition.offset)
-
-            result[partition.topic] = {}
-            result[partition.topic][partition.partition] = {
-                "current_offset": current_offset,
-                "log_end_offset": hi,
-                "lag": lag,
+        return {
+            group_id: {
+                key: (offset, watermarks[key][1])
+                for key, offset in offsets.items()
+                if offset >= 0 and watermarks[key][1] >= 0
             }
+            for group_id, offsets in committed.items()
+        }
 
-        consumer.close()
+    def get_groups_offset_lag(self, group_topic_partitions, max_staleness_ms=None):
+        """
+        Get the offset lag for all partitions of many Consumer Groups at once.
 
-        return result
+        The watermarks come from the shared watermark cache, so the watermarks of a partition are
+        fetched once however many groups read it, e.g. 500 groups reading the same 200 partitions
+        cost 200 watermark lookups.
+
+        Args:
+            group_topic_partitions (dict): A mapping of group id to a list of TopicPartitions.
+            max_staleness_ms (float): The age up to which cached watermarks are used. Defaults to the cache setting.
+        Returns:
+            dict: A mapping of group id to topic to partition to offset lag.
+        """
+        committed = self.get_committed_offsets(group_topic_partitions)
+
+        watermarks = {}
+        if committed:
+            watermarks = self._get_watermarks(
+                (key for offsets in committed.values() for key in offsets), max_staleness_ms
+            )
+
+        return self._format_groups_offset_lag(group_topic_partitions, committed, watermarks)
+
+    @staticmethod
+    def _format_groups_offset_lag(group_ids, committed, watermarks):
+        results = {group_id: {} for group_id in group_ids}
+        for group_id, offsets in committed.items():
+            for (topic, partition), offset in offsets.items():
+                results[group_id].setdefault(topic, {})[
+                    partition
+                ] = ConsumerGroup._format_offset_lag(offset, *watermarks[(topic, partition)])
+
+        return results
+
+    @staticmethod
+    def _format_offset_lag(offset, lo, hi):
+        if offset == OFFSET_INVALID:
+            current_offset = "-"
+        else:
+            current_offset = "%d" % (offset)
+
+        if hi < 0:
+            lag = "no hwmark"  # Unlikely
+        elif offset < 0:
+            # No committed offset, show total message count as lag.
+            # The actual message count may be lower due to compaction
+            # and record deletions.
+            lag = "%d" % (hi - lo)
+        else:
+            lag = "%d" % (hi - offset)
+
+        return {
+            "current_offset": current_offset,
+            "log_end_offset": hi,
+            "lag": lag,
+        }
 
     def describe(self, group_ids=[], include_offset_lag=True, show_empty=False):
         results = {}
@@ -176,88 +334,146 @@ class ConsumerGroup(KafkaResource):
 
         # There are no group ids on the cluster
         if not group_ids:
-            results
+            return results
 
         future = self._admin_client.describe_consumer_groups(
             group_ids, request_timeout=self._timeout
         )
 
+        groups_metadata = {group_id: f.result() for group_id, f in future.items()}
+
+        # Compute the offset lag for every assigned partition of every group in one batch
+        offsets = {}
+        if include_offset_lag:
+            offsets = self.get_groups_offset_lag(self._get_groups_topic_partitions(groups_metadata))
 
         # Describe consumer groups
-        for group_id, f in future.items():
-            group_metadata = f.result()
-            members = []
+        for group_id, group_metadata in groups_metadata.items():
+            results[group_id] = self._format_group(
+                group_id, group_metadata, offsets.get(group_id, {})
+            )
+
+        return results
+
+    def iter_describe(self, group_ids=[], include_offset_lag=True, show_empty=False, max_workers=8):
+        """
+        Describe Kafka Consumer Groups and yield each group as soon as it is described.
+
+        Unlike describe(), groups are yielded in the order they complete, so a caller can stream the
+        first groups while the offset lag of the others is still being fetched.
+        Args:
+            group_ids (list): The group ids to describe. Defaults to all groups.
+            include_offset_lag (bool): Whether to fetch the offset lag of the assigned partitions.
+            show_empty (bool): Whether to include empty groups when listing all groups.
+            max_workers (int): The maximum number of groups whose offset lag is fetched concurrently.
+        Yields:
+            tuple: The group id and its description.
+        """
+        # Default to listing all group ids
+        if not group_ids:
+            group_ids = [group["id"] for group in self.list(show_empty=show_empty)]
+
+        # There are no group ids on the cluster
+        if not group_ids:
+            return
+
+        future = self._admin_client.describe_consumer_groups(
+            group_ids, request_timeout=self._timeout
+        )
+        group_ids_by_future = {f: group_id for group_id, f in future.items()}
+
+        # Groups described concurrently share the watermarks of the partitions they all read
+        # through the watermark cache
+        def describe_group(group_id, group_metadata):
+            group_topic_partitions = self._get_groups_topic_partitions({group_id: group_metadata})
+            offsets = self.get_groups_offset_lag(group_topic_partitions)
+            return self._format_group(group_id, group_metadata, offsets[group_id])
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Wait on the describe futures and the offset lag futures of described groups together
+            describe_futures = set(group_ids_by_future)
+            pending = set(describe_futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for f in done:
+                    group_id = group_ids_by_future[f]
+
+                    if f in describe_futures:
+                        if include_offset_lag:
+                            lag_future = executor.submit(describe_group, group_id, f.result())
+                            group_ids_by_future[lag_future] = group_id
+                            pending.add(lag_future)
+                        else:
+                            yield group_id, self._format_group(group_id, f.result(), {})
+                    else:
+                        yield group_id, f.result()
+
+    @staticmethod
+    def _get_groups_topic_partitions(groups_metadata):
+        """Returns a mapping of group id to the topic partitions assigned to its members."""
+        return {
+            group_id: [
+                tp
+                for m in group_metadata.members
+                if m.assignment
+                for tp in m.assignment.topic_partitions
+            ]
+            for group_id, group_metadata in groups_metadata.items()
+        }
+
+    @staticmethod
+    def _format_group(group_id, group_metadata, group_offsets):
+        members = []
+
+        if not group_metadata.members:
+            # Group is empty
+            member = {
+                "id": group_id,
+                "host": "-",
+                "client_id": "-",
+                "group_instance_id": "-",
+                "assignments": [],
+            }
+            members.append(member)
+        else:
+            for m in group_metadata.members:
+
+                topic_partitions = []
+                if m.assignment:
+
+                    for tp in m.assignment.topic_partitions:
+                        offset_lag = group_offsets.get(tp.topic, {}).get(tp.partition, {})
+
+                        topic_partitions.append(
+                            {
+                                "topic": tp.topic,
+                                "partition": tp.partition,
+                                "current_offset": offset_lag.get("current_offset", "-"),
+                                "log_end_offset": offset_lag.get("log_end_offset", "-"),
+                                "lag": offset_lag.get("lag", "-"),
+                            }
+                        )
 
-            if not group_metadata.members:
-                # Group is empty
                 member = {
-                    "id": group_id,
-                    "host": "-",
-                    "client_id": "-",
-                    "group_instance_id": "-",
-                    "assignments": [],
+                    "id": m.member_id,
+                    "host": m.host,
+                    "client_id": m.client_id,
+                    "group_instance_id": m.group_instance_id,
+                    "assignments": topic_partitions,
                 }
                 members.append(member)
-            else:
-                for m in group_metadata.members:
-
-                    topic_partitions = []
-                    offsets = []
-                    if m.assignment:
-
-                        for tp in m.assignment.topic_partitions:
-
-                            if include_offset_lag:
-                                #
-                                offsets = self.get_offset_lag([tp])
-                            else:
-                                offsets = {}
-
-                            current_offset = (
-                                offsets.get(tp.topic, {})
-                                .get(tp.partition, {})
-                                .get("current_offset", "-")
-                            )
-                            log_end_offset = (
-                                offsets.get(tp.topic, {})
-                                .get(tp.partition, {})
-                                .get("log_end_offset", "-")
-                            )
-                            lag = offsets.get(tp.topic, {}).get(tp.partition, {}).get("lag", "-")
-
-                            topic_partitions.append(
-                                {
-                                    "topic": tp.topic,
-                                    "partition": tp.partition,
-                                    "current_offset": current_offset,
-                                    "log_end_offset": log_end_offset,
-                                    "lag": lag,
-                                }
-                            )
-
-                    member = {
-                        "id": m.member_id,
-                        "host": m.host,
-                        "client_id": m.client_id,
-                        "group_instance_id": m.group_instance_id,
-                        "assignments": topic_partitions,
-                    }
-                    members.append(member)
-                
-
-            results[group_id] = {
-                "is_simple_consumer_group": group_metadata.is_simple_consumer_group,
-                "state": group_metadata.state.name,
-                "partition_assignor": group_metadata.partition_assignor,
-                "coordinator": {
-                    "id": group_metadata.coordinator.id,
-                    "host": group_metadata.coordinator.host,
-                    "port": group_metadata.coordinator.port,
-                },
-                "members": members,
-            }
 
-        return results
+        return {
+            "is_simple_consumer_group": group_metadata.is_simple_consumer_group,
+            "state": group_metadata.state.name,
+            "partition_assignor": group_metadata.partition_assignor,
+            "coordinator": {
+                "id": group_metadata.coordinator.id,
+                "host": group_metadata.coordinator.host,
+                "port": group_metadata.coordinator.port,
+            },
+            "members": members,
+        }
 
     def alter(self):
         raise NotImplemented
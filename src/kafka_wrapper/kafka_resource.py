@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from confluent_kafka.admin import AdminClient
+from .client_pool import admin_client_pool as default_admin_client_pool
+from .metadata_cache import MetadataCache
+from .watermark_cache import WatermarkCache
+from .watermarks import list_watermarks
 
 import logging
 
@@ -36,31 +39,87 @@ def get_logger(log_level="NOTSET"):
 class KafkaResource(ABC):
     """An abstract class for a Kafka resource."""
 
-    def __init__(self, admin_client_config=None, timeout=10, log_level=None):
+    def __init__(
+        self, admin_client_config=None, timeout=10, log_level=None, admin_client_pool=None
+    ):
         """
         Initialize a new instance of the Consumer Group wrapper class.
         Args:
             admin_client_config (dict): The Kafka AdminClient configuration.
             timeout (int): The timeout for kafka operations.
             log_level (str): The logging level to use for the logger and console handler. Defaults to "NOTSET".
+            admin_client_pool (AdminClientPool): The pool to share AdminClients from. Defaults to the global pool.
         """
         if not admin_client_config:
             admin_client_config = {"bootstrap.servers": "localhost:9092"}
 
         self._admin_client_config = admin_client_config
 
-        self._admin_client = AdminClient(admin_client_config)
+        # Share warm broker connections with every resource using the same config
+        if admin_client_pool is None:
+            admin_client_pool = default_admin_client_pool
+
+        self._admin_client_pool = admin_client_pool
+        self._admin_client = self._admin_client_pool.acquire(admin_client_config)
+        self._metadata_cache = self._admin_client_pool.metadata_cache(admin_client_config)
+        self._watermark_cache = self._admin_client_pool.watermark_cache(admin_client_config)
+        self._is_pooled = True
+
         log_level = "NOTSET" if not log_level else log_level
         self.logger = get_logger(log_level)
         self._timeout = timeout
 
     @property
     def admin_client(self):
-        self._admin_client
+        return self._admin_client
 
     @admin_client.setter
     def admin_client(self, value):
+        # The resource no longer uses the pooled client or its metadata
+        self._release_admin_client()
         self._admin_client = value
+        self._metadata_cache = MetadataCache(ttl=self._metadata_cache.ttl)
+        self._watermark_cache = WatermarkCache(max_staleness=self._watermark_cache.max_staleness)
+
+    @property
+    def metadata_cache(self):
+        return self._metadata_cache
+
+    @property
+    def watermark_cache(self):
+        return self._watermark_cache
+
+    def _list_topics(self):
+        """Returns the cluster metadata, reusing the cached snapshot while it is fresh."""
+        return self._metadata_cache.get(
+            lambda: self._admin_client.list_topics(timeout=self._timeout)
+        )
+
+    def _get_watermarks(self, topic_partitions, max_staleness_ms=None):
+        """
+        Returns the (low, high) watermarks of the (topic, partition) tuples.
+
+        Cached watermarks are reused up to max_staleness_ms old, see WatermarkCache.get().
+        """
+        return self._watermark_cache.get(topic_partitions, self._list_watermarks, max_staleness_ms)
+
+    def _list_watermarks(self, topic_partitions):
+        return list_watermarks(self._admin_client, topic_partitions, timeout=self._timeout)
+
+    def _release_admin_client(self):
+        if self._is_pooled:
+            self._admin_client_pool.release(self._admin_client_config)
+            self._is_pooled = False
+
+    def close(self):
+        """Release the pooled AdminClient. The client stays warm in the pool for other resources."""
+        self._release_admin_client()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     @property
     def timeout(self, value):
@@ -0,0 +1,236 @@
+from array import array
+from .background import BackgroundLoop
+
+import threading
+import time
+
+
+class OffsetRing:
+    """
+    The latest offset samples of a partition in fixed-size arrays.
+
+    Each sample is the time it was taken, the committed offset of the group and the log end
+    offset of the partition. Once the ring is full a new sample overwrites the oldest one, so a
+    partition costs 24 bytes per sample however long the sampler runs.
+    """
+
+    def __init__(self, capacity):
+        """
+        Args:
+            capacity (int): The maximum number of samples kept.
+        """
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2 to compute rates")
+
+        self.capacity = capacity
+        self.sampled_at = array("d", [0.0]) * capacity
+        self.committed_offsets = array("q", [0]) * capacity
+        self.log_end_offsets = array("q", [0]) * capacity
+        self._next = 0
+        self._count = 0
+
+    def append(self, sampled_at, committed_offset, log_end_offset):
+        i = self._next
+        self.sampled_at[i] = sampled_at
+        self.committed_offsets[i] = committed_offset
+        self.log_end_offsets[i] = log_end_offset
+        self._next = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        """Returns the (sampled at, committed offset, log end offset) of a sample, oldest first."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("sample index out of range")
+
+        i = (self._next - self._count + index) % self.capacity
+        return self.sampled_at[i], self.committed_offsets[i], self.log_end_offsets[i]
+
+    def get_stats(self):
+        """
+        Returns the offsets of the latest sample and the rates over the samples in the ring.
+
+        The consume and produce rates are the average number of messages per second committed and
+        appended between the oldest and the latest sample. The lag trend is the least-squares slope
+        of the lag over every sample, in messages per second, and is negative while the group catches
+        up. The ETA is the number of seconds until the lag is zero at that trend, or None if the lag
+        is not shrinking. Rates are None until two samples were taken at different times.
+        """
+        sampled_at, committed_offset, log_end_offset = self[-1]
+        lag = max(log_end_offset - committed_offset, 0)
+        stats = {
+            "committed_offset": committed_offset,
+            "log_end_offset": log_end_offset,
+            "lag": lag,
+            "consume_rate": None,
+            "produce_rate": None,
+            "lag_trend": None,
+            "eta": 0.0 if lag == 0 else None,
+        }
+
+        first_sampled_at, first_committed_offset, first_log_end_offset = self[0]
+        elapsed = sampled_at - first_sampled_at
+        if elapsed <= 0:
+            return stats
+
+        stats["consume_rate"] = (committed_offset - first_committed_offset) / elapsed
+        stats["produce_rate"] = (log_end_offset - first_log_end_offset) / elapsed
+        stats["lag_trend"] = self._get_lag_trend()
+        if lag and stats["lag_trend"] < 0:
+            stats["eta"] = lag / -stats["lag_trend"]
+        return stats
+
+    def _get_lag_trend(self):
+        samples = [self[i] for i in range(self._count)]
+        mean_t = sum(t for t, _, _ in samples) / len(samples)
+        mean_lag = sum(e - c for _, c, e in samples) / len(samples)
+
+        covariance = sum((t - mean_t) * (e - c - mean_lag) for t, c, e in samples)
+        variance = sum((t - mean_t) ** 2 for t, _, _ in samples)
+        return covariance / variance
+
+
+class LagSampler:
+    """
+    Periodically samples the committed offset and the log end offset of every partition
+    Consumer Groups committed to, and derives how fast each group consumes and whether it is
+    falling behind.
+
+    The samples of each (group, topic, partition) are kept in an OffsetRing of the latest
+    capacity samples, so the rates cover the last capacity * interval seconds. Partitions that
+    are no longer committed to by a sampled group are forgotten at the next sample.
+    """
+
+    def __init__(
+        self,
+        consumer_group,
+        group_ids=None,
+        capacity=60,
+        max_staleness_ms=None,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            consumer_group (ConsumerGroup): The resource used to get the offsets.
+            group_ids (list): The groups to sample. Defaults to every stable group listed at each sample.
+            capacity (int): The number of samples kept per partition.
+            max_staleness_ms (float): The age up to which cached watermarks are used. Defaults to the cache setting.
+            clock (callable): Returns the current time in seconds.
+        """
+        self.consumer_group = consumer_group
+        self.group_ids = group_ids
+        self.capacity = capacity
+        self.max_staleness_ms = max_staleness_ms
+        self.clock = clock
+        self.sampled_at = None
+        self.error = None
+
+        # group id -> (topic, partition) -> OffsetRing
+        self._rings = {}
+        self._lock = threading.Lock()
+        self._sample_loop = BackgroundLoop(name="k4-lag-sampler")
+
+    def sample(self):
+        """Take a sample of every partition of the sampled groups. Returns the number of partitions sampled."""
+        group_ids = self.group_ids
+        if group_ids is None:
+            group_ids = [group["id"] for group in self.consumer_group.list()]
+
+        group_offsets = self.consumer_group.get_group_offsets(group_ids, self.max_staleness_ms)
+        sampled_at = self.clock()
+
+        with self._lock:
+            rings = {}
+            for group_id, offsets in group_offsets.items():
+                group_rings = self._rings.get(group_id, {})
+                rings[group_id] = {}
+                for key, (committed_offset, log_end_offset) in offsets.items():
+                    ring = group_rings.get(key) or OffsetRing(self.capacity)
+                    ring.append(sampled_at, committed_offset, log_end_offset)
+                    rings[group_id][key] = ring
+
+            self._rings = rings
+            self.sampled_at = sampled_at
+
+        return sum(len(offsets) for offsets in group_offsets.values())
+
+    def get_group_ids(self):
+        """Returns the ids of the sampled groups."""
+        with self._lock:
+            return sorted(self._rings)
+
+    def get_samples(self, group_id, topic, partition):
+        """Returns the (sampled at, committed offset, log end offset) samples of a partition, oldest first."""
+        with self._lock:
+            ring = self._rings.get(group_id, {}).get((topic, partition))
+            return list(ring) if ring else []
+
+    def get_partition_stats(self, group_id):
+        """
+        Returns the offsets, rates and ETA of each partition of a group, see OffsetRing.get_stats().
+
+        Returns:
+            list: A dict per partition ordered by topic and partition.
+        """
+        with self._lock:
+            group_rings = self._rings.get(group_id, {})
+            return [
+                {"topic": topic, "partition": partition, **ring.get_stats()}
+                for (topic, partition), ring in sorted(group_rings.items())
+            ]
+
+    def get_group_stats(self, group_id):
+        """
+        Returns the total lag and rates of a group, or None if the group was not sampled.
+
+        The rates and the lag trend are summed over the partitions that have rates, and the ETA is
+        the time until the total lag is zero at the total trend.
+        """
+        partition_stats = self.get_partition_stats(group_id)
+        if not partition_stats:
+            return None
+
+        stats = {
+            "group_id": group_id,
+            "partitions": len(partition_stats),
+            "lag": sum(p["lag"] for p in partition_stats),
+            "consume_rate": None,
+            "produce_rate": None,
+            "lag_trend": None,
+        }
+
+        with_rates = [p for p in partition_stats if p["lag_trend"] is not None]
+        if with_rates:
+            for name in ("consume_rate", "produce_rate", "lag_trend"):
+                stats[name] = sum(p[name] for p in with_rates)
+
+        stats["eta"] = 0.0 if stats["lag"] == 0 else None
+        if stats["lag"] and stats["lag_trend"] is not None and stats["lag_trend"] < 0:
+            stats["eta"] = stats["lag"] / -stats["lag_trend"]
+        return stats
+
+    def start(self, interval=10):
+        """
+        Take a sample every interval seconds on a background thread. A failed sample is kept
+        in error and sampling goes on.
+
+        Args:
+            interval (float): The number of seconds between samples.
+        """
+        self._sample_loop.start(self._sample_in_background, interval)
+        return self
+
+    def stop(self):
+        """Stop the background sampling."""
+        self._sample_loop.stop()
+
+    def _sample_in_background(self):
+        try:
+            self.sample()
+            self.error = None
+        except Exception as e:
+            self.error = e
@@ -0,0 +1,66 @@
+import threading
+import time
+
+
+class MetadataCache:
+    """A thread-safe TTL cache for the cluster metadata returned by AdminClient.list_topics()."""
+
+    def __init__(self, ttl=5, clock=time.monotonic):
+        """
+        Initialize a new, empty cache.
+        Args:
+            ttl (float): The number of seconds a metadata snapshot is reused. Zero disables caching.
+            clock (callable): Returns the current time in seconds.
+        """
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._metadata = None
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def _is_fresh(self):
+        return (
+            self._metadata is not None
+            and self.ttl > 0
+            and self.clock() - self._fetched_at < self.ttl
+        )
+
+    def get(self, fetch):
+        """
+        Returns the cached metadata snapshot, or fetches and caches a new one when it is stale.
+        Args:
+            fetch (callable): Fetches the full cluster metadata, e.g. AdminClient.list_topics.
+        """
+        # Concurrent callers wait for one fetch instead of each fetching the cluster metadata
+        with self._lock:
+            if self._is_fresh():
+                self.hits += 1
+                return self._metadata
+
+            self.misses += 1
+            metadata = fetch()
+            self._metadata = metadata
+            self._fetched_at = self.clock()
+            return metadata
+
+    def peek(self):
+        """Returns the cached metadata snapshot if it is still fresh, otherwise None."""
+        with self._lock:
+            return self._metadata if self._is_fresh() else None
+
+    def invalidate(self):
+        """Drop the cached snapshot so the next call fetches fresh metadata."""
+        with self._lock:
+            self._metadata = None
+            self._fetched_at = None
+
+    @property
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Returns the cache hit and miss counters."""
+        return {"hits": self.hits, "misses": self.misses, "hit_ratio": self.hit_ratio}
@@ -1 +1,325 @@
-raise NotImplemented
+from array import array
+from confluent_kafka import Producer as KafkaProducer
+
+import functools
+import json
+import os
+import struct
+import threading
+import time
+
+
+# Batch many small messages per request and compress the batches, see Producer
+DEFAULT_CONFIG = {
+    "linger.ms": 50,
+    "batch.size": 1_000_000,
+    "compression.type": "lz4",
+}
+
+# The length of a null key or value in the binary format
+NULL_LENGTH = -1
+LENGTH = struct.Struct(">i")
+
+
+def _encode(value):
+    """Returns the bytes of a key or value. Strings are UTF-8 encoded and other values are JSON encoded."""
+    if value is None or isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode()
+    return json.dumps(value).encode()
+
+
+def read_ndjson(stream):
+    """
+    Read messages from lines of JSON.
+
+    A line that is an object with a "value" is a message with an optional "key", "partition" and
+    "headers". Any other line is the value of a message without a key.
+
+    Args:
+        stream: A binary file, e.g. sys.stdin.buffer.
+    Yields:
+        dict: The keyword arguments of Producer.produce() without the topic.
+    """
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+
+        message = json.loads(line)
+        if not isinstance(message, dict) or "value" not in message:
+            yield {"key": None, "value": line}
+            continue
+
+        record = {"key": _encode(message.get("key")), "value": _encode(message["value"])}
+        if message.get("partition") is not None:
+            record["partition"] = message["partition"]
+        if message.get("headers"):
+            record["headers"] = {k: _encode(v) for k, v in message["headers"].items()}
+        yield record
+
+
+def read_delimited(stream, delimiter=b"\t"):
+    """
+    Read messages from lines of a key and a value separated by the delimiter. A line without the delimiter is a value without a key.
+
+    Args:
+        stream: A binary file, e.g. sys.stdin.buffer.
+        delimiter (bytes): The separator of the key and the value. Only the first one splits the line.
+    Yields:
+        dict: The keyword arguments of Producer.produce() without the topic.
+    """
+    for line in stream:
+        line = line.rstrip(b"\r\n")
+        if not line:
+            continue
+
+        key, separator, value = line.partition(delimiter)
+        yield {"key": key, "value": value} if separator else {"key": None, "value": line}
+
+
+def read_length_prefixed(stream):
+    """
+    Read messages from a binary stream of length-prefixed keys and values.
+
+    Each message is the key length as a big-endian 32-bit integer, the key, the value length and
+    the value. A length of -1 is a null key or value.
+
+    Args:
+        stream: A binary file, e.g. sys.stdin.buffer.
+    Yields:
+        dict: The keyword arguments of Producer.produce() without the topic.
+    """
+
+    def read_field(prefix=b""):
+        prefix += _read_exactly(stream, LENGTH.size - len(prefix))
+        length = LENGTH.unpack(prefix)[0]
+        return None if length == NULL_LENGTH else _read_exactly(stream, length)
+
+    # The end of the stream is only expected before the key of a message
+    while prefix := stream.read(LENGTH.size):
+        key = read_field(prefix)
+        yield {"key": key, "value": read_field()}
+
+
+def _read_exactly(stream, size):
+    data = stream.read(size) if size else b""
+    if len(data) != size:
+        raise ValueError(f"Truncated message: expected {size} bytes but read {len(data)}.")
+    return data
+
+
+READERS = {
+    "ndjson": read_ndjson,
+    "delimited": read_delimited,
+    "binary": read_length_prefixed,
+}
+
+
+def guess_format(path):
+    """Returns the format of a file from its extension, defaulting to key/value delimited lines."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".ndjson", ".jsonl", ".json"):
+        return "ndjson"
+    if extension in (".bin", ".dat"):
+        return "binary"
+    return "delimited"
+
+
+class DeliveryStats:
+    """The number of delivered and failed messages and the delivery latency of each message."""
+
+    def __init__(self):
+        self.messages = 0
+        self.bytes = 0
+        self.errors = 0
+        self.last_error = None
+        self.started_at = None
+        self.finished_at = None
+
+        # Seconds from produce() to the delivery report, 8 bytes per message
+        self.latencies = array("d")
+
+    def record(self, latency, size, error=None):
+        if error is None:
+            self.messages += 1
+            self.bytes += size
+            self.latencies.append(latency)
+        else:
+            self.errors += 1
+            self.last_error = str(error)
+
+    def get_percentile(self, percentile):
+        """Returns the delivery latency in seconds under which the percentile of the messages were delivered, or None."""
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        rank = max(int(round(percentile / 100 * len(latencies))) - 1, 0)
+        return latencies[min(rank, len(latencies) - 1)]
+
+    def report(self):
+        """Returns the throughput, the p50 and p99 delivery latency in milliseconds and the errors."""
+        elapsed = (
+            (self.finished_at or time.perf_counter()) - self.started_at if self.started_at else 0.0
+        )
+
+        def per_second(count):
+            return count / elapsed if elapsed > 0 else 0.0
+
+        def milliseconds(seconds):
+            return None if seconds is None else seconds * 1000
+
+        return {
+            "messages": self.messages,
+            "bytes": self.bytes,
+            "errors": self.errors,
+            "seconds": elapsed,
+            "messages_per_second": per_second(self.messages),
+            "bytes_per_second": per_second(self.bytes),
+            "p50_latency_ms": milliseconds(self.get_percentile(50)),
+            "p99_latency_ms": milliseconds(self.get_percentile(99)),
+            "last_error": self.last_error,
+        }
+
+
+class Producer:
+    """
+    A producer for loading many messages at once.
+
+    Messages are batched per partition for up to linger.ms and compressed, and their deliveries
+    are reported asynchronously to callbacks that are served by a dedicated poll thread. The
+    bytes of the messages waiting for a delivery report are bounded by max_in_flight_bytes, so
+    loading a large file does not buffer it in memory.
+    """
+
+    def __init__(
+        self,
+        producer_config=None,
+        max_in_flight_bytes=64 * 1024 * 1024,
+        poll_interval=0.1,
+        producer_factory=KafkaProducer,
+    ):
+        """
+        Args:
+            producer_config (dict): The Kafka Producer configuration, e.g. the AdminClient configuration.
+                It overrides DEFAULT_CONFIG, e.g. {"compression.type": "zstd"}.
+            max_in_flight_bytes (int): The maximum number of key and value bytes waiting for a delivery report.
+            poll_interval (float): The maximum number of seconds the poll thread waits for delivery reports.
+            producer_factory (callable): Creates the Kafka Producer from its configuration.
+        """
+        if not producer_config:
+            producer_config = {"bootstrap.servers": "localhost:9092"}
+
+        self.config = {**DEFAULT_CONFIG, **producer_config}
+        self.max_in_flight_bytes = max_in_flight_bytes
+        self.poll_interval = poll_interval
+        self.stats = DeliveryStats()
+
+        self._producer = producer_factory(self.config)
+        self._in_flight = 0
+        self._in_flight_bytes = 0
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._poll_thread = threading.Thread(target=self._run, name="k4-producer-poll", daemon=True)
+        self._poll_thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._producer.poll(self.poll_interval)
+
+    def produce(self, topic, value=None, key=None, partition=None, headers=None):
+        """
+        Send a message asynchronously. Blocks while the in-flight limit is reached.
+
+        Args:
+            topic (str): The topic to produce to.
+            value (bytes): The message value.
+            key (bytes): The message key, which selects the partition unless one is given.
+            partition (int): The partition to produce to.
+            headers (dict): The message headers.
+        """
+        size = len(key or b"") + len(value or b"")
+        with self._condition:
+            if self.stats.started_at is None:
+                self.stats.started_at = time.perf_counter()
+
+            # A message larger than the limit is sent on its own
+            while self._in_flight and self._in_flight_bytes + size > self.max_in_flight_bytes:
+                self._condition.wait()
+            self._in_flight += 1
+            self._in_flight_bytes += size
+
+        kwargs = {"key": key, "headers": headers}
+        if partition is not None:
+            kwargs["partition"] = partition
+
+        sent_at = time.perf_counter()
+        on_delivery = functools.partial(self._on_delivery, sent_at, size)
+        while True:
+            try:
+                self._producer.produce(topic, value, on_delivery=on_delivery, **kwargs)
+                return
+            except BufferError:
+                # The local queue of the Kafka producer is full until the poll thread serves deliveries
+                with self._condition:
+                    self._condition.wait(self.poll_interval)
+            except Exception:
+                self._release(size)
+                raise
+
+    def _on_delivery(self, sent_at, size, err, msg):
+        with self._condition:
+            self.stats.record(time.perf_counter() - sent_at, size, err)
+        self._release(size)
+
+    def _release(self, size):
+        with self._condition:
+            self._in_flight -= 1
+            self._in_flight_bytes -= size
+            self._condition.notify_all()
+
+    def produce_all(self, topic, records, timeout=None):
+        """
+        Send every message and wait for their delivery reports.
+
+        Args:
+            topic (str): The topic to produce to.
+            records (iterable): The keyword arguments of produce() per message, e.g. from read_ndjson().
+            timeout (float): The maximum number of seconds to wait for the deliveries after the last message is sent.
+        Returns:
+            dict: The delivery report, see DeliveryStats.report().
+        """
+        for record in records:
+            self.produce(topic, **record)
+
+        self.flush(timeout)
+        return self.stats.report()
+
+    def flush(self, timeout=None):
+        """Wait for the delivery reports of every sent message. Returns the number of messages still in flight."""
+        remaining = self._producer.flush(-1 if timeout is None else timeout)
+        self.stats.finished_at = time.perf_counter()
+        return remaining
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    @property
+    def in_flight_bytes(self):
+        return self._in_flight_bytes
+
+    def close(self, timeout=None):
+        """Wait for the pending deliveries and stop the poll thread."""
+        try:
+            self.flush(timeout)
+        finally:
+            self._stopped.set()
+            self._poll_thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,9 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+from confluent_kafka import KafkaError
 from confluent_kafka.admin import NewTopic, ConfigResource
 from .kafka_resource import KafkaResource
 
 
 class Topic(KafkaResource):
-    def __init__(self, admin_client_config=None, timeout=10, log_level=None):
+    def __init__(
+        self, admin_client_config=None, timeout=10, log_level=None, admin_client_pool=None
+    ):
         """
         The Kafka Topic wrapper class.
 
@@ -11,42 +15,93 @@ class Topic(KafkaResource):
             admin_client_config (dict): The Kafka AdminClient configuration.
             timeout (int): The timeout for kafka operations.
             log_level (str): The logging level to use for the logger and console handler. Defaults to "NOTSET".
+            admin_client_pool (AdminClientPool): The pool to share AdminClients from. Defaults to the global pool.
         """
         super().__init__(
-            admin_client_config=admin_client_config, timeout=timeout, log_level=log_level
+            admin_client_config=admin_client_config,
+            timeout=timeout,
+            log_level=log_level,
+            admin_client_pool=admin_client_pool,
         )
 
     def __str__(self):
         return "Topic"
 
     def list(self, show_internal=False):
-        topics_metadata = self._admin_client.list_topics(timeout=self._timeout)
+        return list(self.iter_list(show_internal=show_internal))
 
-        results = [
-            {
+    def iter_list(self, show_internal=False):
+        """
+        List Kafka Topics and yield each topic as it is formatted, so a caller can stream them.
+        Args:
+            show_internal (bool): Whether to include internal topics.
+        Yields:
+            dict: The name and the number of partitions of a topic.
+        """
+        yield from self._format_topics(self._list_topics().topics, show_internal=show_internal)
+
+    @staticmethod
+    def _format_topics(topics_metadata, show_internal=False):
+        for topic in topics_metadata.values():
+            t = {
                 "name": str(topic),
                 "partitions": len(topic.partitions),
             }
-            for topic in topics_metadata.topics.values()
-        ]
-
-        if not show_internal:
-            results = [
-                t
-                for t in results
-                if not (
-                    t["name"].startswith("_") or t["name"].startswith("__")
-                    or (t["name"].startswith("connect") and t["name"].endswith("offsets"))
-                    or (t["name"].startswith("connect") and t["name"].endswith("configs"))
-                    or (t["name"].startswith("connect") and t["name"].endswith("status"))
-                    or t["name"].startswith("_confluent") or (t["name"] == "schemas")
-                )
-            ]
 
-        return results
+            if not show_internal and Topic._is_internal(t["name"]):
+                continue
+
+            yield t
+
+    @staticmethod
+    def _is_internal(name):
+        return (
+            name.startswith("_")
+            or name.startswith("__")
+            or (name.startswith("connect") and name.endswith("offsets"))
+            or (name.startswith("connect") and name.endswith("configs"))
+            or (name.startswith("connect") and name.endswith("status"))
+            or name.startswith("_confluent")
+            or (name == "schemas")
+        )
+
+    def _list_topics_by_name(self, topic_names, max_workers=8):
+        """
+        Returns the metadata of the named topics only. Topics that do not exist are omitted.
+
+        A fresh cached snapshot of the whole cluster is reused when available. Otherwise metadata
+        is requested for each named topic, in parallel when many names are given.
+        """
+        topic_names = list(dict.fromkeys(topic_names))
+
+        metadata = self._metadata_cache.peek()
+        if metadata is not None:
+            return {n: metadata.topics[n] for n in topic_names if n in metadata.topics}
+
+        def list_topic(topic_name):
+            topics = self._admin_client.list_topics(topic=topic_name, timeout=self._timeout).topics
+            topic_metadata = topics[topic_name] if topic_name in topics else None
+
+            if topic_metadata is not None and topic_metadata.error is not None:
+                if topic_metadata.error.code() == KafkaError.UNKNOWN_TOPIC_OR_PART:
+                    return None
+
+            return topic_metadata
+
+        if len(topic_names) == 1:
+            topics_metadata = [list_topic(topic_names[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(topic_names))) as executor:
+                topics_metadata = list(executor.map(list_topic, topic_names))
+
+        return {
+            topic_name: topic_metadata
+            for topic_name, topic_metadata in zip(topic_names, topics_metadata)
+            if topic_metadata is not None
+        }
 
     def does_exist(self, topic_name):
-        return any([t for t in self.list() if t["name"] == topic_name])
+        return topic_name in self._list_topics_by_name([topic_name])
 
     def create(self, topic_name, num_partitions, replication_factor, config={}):
         new_topic = NewTopic(
@@ -57,29 +112,39 @@ class Topic(KafkaResource):
         )
         future = self._admin_client.create_topics([new_topic], request_timeout=self._timeout)
 
-        for topic, f in future.items():
-            return f.result()
+        # Invalidate once the operation completed, a fetch in between would cache the old metadata
+        try:
+            for topic, f in future.items():
+                return f.result()
+        finally:
+            self._metadata_cache.invalidate()
 
     def describe(self, topic_names=[], show_internal=False):
+        return dict(self.iter_describe(topic_names=topic_names))
 
+    def iter_describe(self, topic_names=[]):
+        """
+        Describe Kafka Topics and yield each topic as soon as it is described, so a caller can
+        stream the first topics without holding the description of every topic.
+        Args:
+            topic_names (list): The topics to describe. Defaults to all topics.
+        Yields:
+            tuple: The topic name and its description.
+        """
         # List all topics metadata when the topics argument is not set
         if topic_names:
-            topics_metadata = {
-                topic_name: metadata
-                for topic_name, metadata in self._admin_client.list_topics(
-                    show_internal=show_internal,
-                    timeout=self._timeout
-                ).topics.items()
-                if topic_name in topic_names
-            }
+            topics_metadata = self._list_topics_by_name(topic_names)
         else:
-            topics_metadata = self._admin_client.list_topics(timeout=self._timeout).topics
+            topics_metadata = self._list_topics().topics
+
+        yield from self._format_descriptions(topics_metadata)
 
+    @staticmethod
+    def _format_descriptions(topics_metadata):
         # Get topic description(s)
-        results = {}
         for topic_name, topic_metadata in topics_metadata.items():
-            results[topic_name] = {}
             partitions = []
+            replicas = []
 
             # Loop over all partitions of this topic.
             for partition in topic_metadata.partitions.values():
@@ -111,11 +176,11 @@ class Topic(KafkaResource):
                     }
                 )
 
-            results[topic_name]["partitions"] = len(partitions)
-            results[topic_name]["replicas"] = len(replicas)
-            results[topic_name]["availability"] = partitions
-
-        return results
+            yield topic_name, {
+                "partitions": len(partitions),
+                "replicas": len(replicas),
+                "availability": partitions,
+            }
 
     def describe_configs(self, topic_names=[]):
         """
@@ -123,17 +188,19 @@ class Topic(KafkaResource):
         """
         results = {}
 
+        future = self._admin_client.describe_configs(self._get_config_resources(topic_names))
+        for topic, f in future.items():
+            results[topic.name] = self._format_config_entries(f.result())
+
+        return results
+
+    def _get_config_resources(self, topic_names=[]):
+        """Returns a config resource for each existing topic, or every topic when no names are given."""
         if topic_names:
             # assert the topics exists
-            response_metadata = {
-                topic: metadata
-                for topic, metadata in self._admin_client.list_topics(
-                    timeout=self._timeout
-                ).topics.items()
-                if topic in topic_names
-            }
+            response_metadata = self._list_topics_by_name(topic_names)
         else:
-            response_metadata = self._admin_client.list_topics(timeout=self._timeout).topics
+            response_metadata = self._list_topics().topics
 
         # Get the topic config(s)
         resources = [ConfigResource("topic", t) for t in response_metadata.keys()]
@@ -143,16 +210,14 @@ class Topic(KafkaResource):
                 err_msg += f" The provided topics did not exist: {', '.join(topic_names)}"
             raise ValueError(err_msg)
 
-        future = self._admin_client.describe_configs(resources)
-        for topic, f in future.items():
-            response_metadata = f.result()
-            results[topic.name] = {}
-            results[topic.name] = {
-                m.name: m.value if m.value != "" and m.value != None else "-"
-                for m in response_metadata.values()
-            }
+        return resources
 
-        return results
+    @staticmethod
+    def _format_config_entries(config_entries):
+        return {
+            m.name: m.value if m.value != "" and m.value != None else "-"
+            for m in config_entries.values()
+        }
 
     def alter(self, topic_name, config, overwrite=True):
         resource = ConfigResource("topic", topic_name)
@@ -161,11 +226,17 @@ class Topic(KafkaResource):
 
         future = self._admin_client.alter_configs([resource])
 
-        for res, f in future.items():
-            return f.result()
+        try:
+            for res, f in future.items():
+                return f.result()
+        finally:
+            self._metadata_cache.invalidate()
 
     def delete(self, topic_names, timeout=30):
         future = self._admin_client.delete_topics(topic_names, operation_timeout=self._timeout)
 
-        for topic, f in future.items():
-            return f.result()
+        try:
+            for topic, f in future.items():
+                return f.result()
+        finally:
+            self._metadata_cache.invalidate()
@@ -0,0 +1,198 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from .background import BackgroundLoop
+from .watermarks import UNKNOWN
+
+import threading
+import time
+
+
+class WatermarkCache:
+    """
+    A thread-safe cache of partition watermarks keyed by (topic, partition).
+
+    The watermarks are shared by every feature that needs them, e.g. group lag and topic
+    message counts. Callers choose how stale a cached watermark may be. The missing and
+    stale partitions are fetched in batches, and a caller asking for a partition that is
+    already being fetched waits for that fetch. At most max_partitions watermarks are kept,
+    the least recently used are evicted first.
+    """
+
+    def __init__(
+        self, max_staleness=1, max_partitions=100_000, batch_size=1000, clock=time.monotonic
+    ):
+        """
+        Initialize a new, empty cache.
+        Args:
+            max_staleness (float): The default number of seconds a cached watermark is reused.
+            max_partitions (int): The maximum number of partitions whose watermarks are kept.
+            batch_size (int): The maximum number of partitions fetched per request.
+            clock (callable): Returns the current time in seconds.
+        """
+        self.max_staleness = max_staleness
+        self.max_partitions = max_partitions
+        self.batch_size = batch_size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+
+        # (topic, partition) -> (low, high, fetched at), least recently used first
+        self._watermarks = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+        # The cached partitions read again since their last background refresh
+        self._read = set()
+        self._refresh_loop = BackgroundLoop(name="k4-watermarks")
+
+    def get(self, topic_partitions, fetch, max_staleness_ms=None):
+        """
+        Returns the watermarks of partitions, fetching the partitions that are missing or too stale.
+
+        A partition is a hit when its watermarks are not fetched for the caller, i.e. they are
+        cached or already being fetched by another caller.
+
+        Args:
+            topic_partitions (iterable): The (topic, partition) tuples to get the watermarks of.
+            fetch (callable): Fetches the watermarks of a list of partitions, e.g. list_watermarks.
+            max_staleness_ms (float): The age in milliseconds up to which a cached watermark is
+                accepted. Defaults to max_staleness. Zero always fetches.
+        Returns:
+            dict: A mapping of (topic, partition) to the (low, high) watermark offsets.
+        """
+        max_staleness = self.max_staleness if max_staleness_ms is None else max_staleness_ms / 1000
+        keys = list(dict.fromkeys(topic_partitions))
+
+        results, futures, missing = {}, {}, []
+        with self._lock:
+            now = self.clock()
+            for key in keys:
+                cached = self._watermarks.get(key)
+                if cached is not None and now - cached[2] < max_staleness:
+                    self._watermarks.move_to_end(key)
+                    results[key] = cached[:2]
+                    if self._refresh_loop.is_running:
+                        self._read.add(key)
+                elif key in self._in_flight:
+                    futures[key] = self._in_flight[key]
+                else:
+                    futures[key] = self._in_flight[key] = Future()
+                    missing.append(key)
+
+            self.misses += len(missing)
+            self.hits += len(keys) - len(missing)
+
+        if missing:
+            self._fetch(missing, fetch)
+
+        results.update((key, f.result()) for key, f in futures.items())
+
+        # A background refresh that failed leaves its partitions to the readers waiting on it
+        refetch = [key for key in keys if results[key] is None]
+        if refetch:
+            results.update(self.get(refetch, fetch, max_staleness_ms))
+        return {key: results[key] for key in keys}
+
+    def _fetch(self, keys, fetch, is_background=False):
+        """
+        Fetch the watermarks of in-flight partitions in batches and resolve their futures.
+
+        The futures of a failed fetch get its exception, or None for a background refresh, so the
+        readers waiting on it fetch the partitions themselves instead of failing.
+        """
+        for i in range(0, len(keys), self.batch_size):
+            batch = keys[i : i + self.batch_size]
+            try:
+                watermarks = fetch(batch)
+            except Exception as e:
+                with self._lock:
+                    for key in keys[i:]:
+                        future = self._in_flight.pop(key)
+                        if is_background:
+                            future.set_result(None)
+                        else:
+                            future.set_exception(e)
+                raise
+
+            fetched_at = self.clock()
+            with self._lock:
+                for key in batch:
+                    low, high = watermarks.get(key, UNKNOWN)
+                    self._watermarks[key] = (low, high, fetched_at)
+                    self._watermarks.move_to_end(key)
+                    self._in_flight.pop(key).set_result((low, high))
+
+                while len(self._watermarks) > self.max_partitions:
+                    self._watermarks.popitem(last=False)
+
+    def peek(self, topic_partition):
+        """Returns the cached (low, high) watermarks of a partition regardless of their age, or None."""
+        with self._lock:
+            cached = self._watermarks.get(topic_partition)
+            return cached[:2] if cached else None
+
+    def invalidate(self, topic_partitions=None):
+        """Drop the cached watermarks of the partitions, or of every partition, so the next call fetches them."""
+        with self._lock:
+            if topic_partitions is None:
+                self._watermarks.clear()
+            else:
+                for key in topic_partitions:
+                    self._watermarks.pop(key, None)
+
+    def start(self, fetch, interval=None):
+        """
+        Refresh the watermarks that are read again while cached in batches on a background thread,
+        so readers find them in the cache instead of waiting on the broker.
+
+        Only the partitions that expire before the next refresh are fetched. Partitions read
+        once, or less often than max_staleness, are left to their readers.
+
+        Args:
+            fetch (callable): Fetches the watermarks of a list of partitions, e.g. list_watermarks.
+            interval (float): The number of seconds between refreshes. Defaults to half of max_staleness.
+        """
+        interval = self.max_staleness / 2 if interval is None else interval
+        self._refresh_loop.start(lambda: self._refresh(fetch, interval), interval, delay_first=True)
+
+    def stop(self):
+        """Stop the background refresh."""
+        self._refresh_loop.stop()
+
+    def _refresh(self, fetch, interval):
+        with self._lock:
+            # The partitions fetched at or before this time expire before the next refresh
+            expires_before = self.clock() + interval - self.max_staleness
+            keys = []
+            for key in list(self._read):
+                cached = self._watermarks.get(key)
+                if cached is None or key in self._in_flight:
+                    self._read.discard(key)
+                elif cached[2] <= expires_before:
+                    self._read.discard(key)
+                    self._in_flight[key] = Future()
+                    keys.append(key)
+
+        if keys:
+            try:
+                self._fetch(keys, fetch, is_background=True)
+            except Exception:
+                # Readers fetch the stale partitions themselves until the next refresh succeeds
+                pass
+
+    def __len__(self):
+        return len(self._watermarks)
+
+    @property
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """Returns the cache hit and miss counters and the number of cached partitions."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "partitions": len(self),
+        }
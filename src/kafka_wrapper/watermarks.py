@@ -0,0 +1,45 @@
+from confluent_kafka import TopicPartition, KafkaException
+from confluent_kafka.admin import OffsetSpec
+
+
+# The watermarks of a partition that could not be fetched, e.g. a deleted topic
+UNKNOWN = (-1, -1)
+
+
+def list_watermarks(admin_client, topic_partitions, timeout=10):
+    """
+    Fetch the low and high watermark offsets of partitions through the AdminClient.
+
+    Every partition is listed in the same two requests, one for the earliest and one for
+    the latest offsets, instead of a round trip per partition.
+
+    Args:
+        admin_client (AdminClient): The client used to list the partition offsets.
+        topic_partitions (list): The (topic, partition) tuples to get the watermarks of.
+        timeout (int): The timeout for kafka operations.
+    Returns:
+        dict: A mapping of (topic, partition) to the (low, high) watermark offsets.
+    """
+    tps = [TopicPartition(topic, partition) for topic, partition in topic_partitions]
+    low = _list_offsets(admin_client, tps, OffsetSpec.earliest(), timeout)
+    high = _list_offsets(admin_client, tps, OffsetSpec.latest(), timeout)
+    return {
+        key: (low.get(key, UNKNOWN[0]), high.get(key, UNKNOWN[1]))
+        for key in dict.fromkeys(topic_partitions)
+    }
+
+
+def _list_offsets(admin_client, topic_partitions, offset_spec, timeout):
+    """Returns a mapping of (topic, partition) to the offset matching the spec."""
+    futures = admin_client.list_offsets(
+        {tp: offset_spec for tp in topic_partitions}, request_timeout=timeout
+    )
+
+    offsets = {}
+    for tp, f in futures.items():
+        try:
+            offsets[(tp.topic, tp.partition)] = f.result().offset
+        except KafkaException:
+            # Leave the partition unknown instead of failing every other partition
+            pass
+    return offsets
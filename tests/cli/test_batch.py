@@ -0,0 +1,163 @@
+from unittest.mock import MagicMock, patch
+from click.testing import CliRunner
+from confluent_kafka import KafkaError, KafkaException
+from cli.main import cli
+
+import json
+import pytest
+
+
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+def mock_resource(mock_class):
+    resource = MagicMock()
+    mock_class.return_value.__enter__.return_value = resource
+    return resource
+
+
+def test_batch_topics_list(runner):
+    with patch("kafka_wrapper.Topic") as mock_topic:
+        topic = mock_resource(mock_topic)
+        topic.iter_list.return_value = [
+            {"name": "topic1", "partitions": 3},
+            {"name": "topic2", "partitions": 1},
+        ]
+
+        result = runner.invoke(cli, ["-b", "mock:9092", "topics", "list", "--show-internal"])
+
+    assert result.exit_code == 0
+    mock_topic.assert_called_once_with(admin_client_config={"bootstrap.servers": "mock:9092"})
+    topic.iter_list.assert_called_once_with(show_internal=True)
+    assert [json.loads(line) for line in result.output.splitlines()] == topic.iter_list.return_value
+
+
+def test_batch_topics_list_csv(runner):
+    with patch("kafka_wrapper.Topic") as mock_topic:
+        topic = mock_resource(mock_topic)
+        topic.iter_list.return_value = [{"name": "topic1", "partitions": 3}]
+
+        result = runner.invoke(cli, ["topics", "list", "-o", "csv"])
+
+    assert result.output.splitlines() == ["name,partitions", "topic1,3"]
+
+
+def test_batch_groups_describe_lag_csv(runner):
+    description = {
+        "state": "STABLE",
+        "members": [
+            {
+                "id": "member1",
+                "client_id": "client1",
+                "host": "host1",
+                "assignments": [
+                    {
+                        "topic": "topic1",
+                        "partition": 0,
+                        "current_offset": "1",
+                        "log_end_offset": 2,
+                        "lag": "1",
+                    },
+                ],
+            }
+        ],
+    }
+    with patch("kafka_wrapper.ConsumerGroup") as mock_consumer_group:
+        consumer_group = mock_resource(mock_consumer_group)
+        consumer_group.iter_describe.return_value = iter([("group1", description)])
+
+        result = runner.invoke(cli, ["groups", "describe", "group1", "--lag", "-o", "csv"])
+
+    consumer_group.iter_describe.assert_called_once_with(
+        group_ids=["group1"], include_offset_lag=True, show_empty=False
+    )
+    assert result.output.splitlines() == [
+        "group,state,member,client_id,host,topic,partition,current_offset,log_end_offset,lag",
+        "group1,STABLE,member1,client1,host1,topic1,0,1,2,1",
+    ]
+
+
+def test_batch_brokers_describe_kafka_error(runner):
+    with patch("kafka_wrapper.Broker") as mock_broker:
+        broker = mock_resource(mock_broker)
+        broker.describe.side_effect = KafkaException("broker transport failure")
+
+        result = runner.invoke(cli, ["brokers", "describe"])
+
+    assert result.exit_code == 1
+    assert "broker transport failure" in result.output
+
+
+def test_batch_topics_describe_writes_each_topic_as_described(runner):
+    description = {
+        "partitions": 1,
+        "replicas": 1,
+        "availability": [{"id": 0, "leader": 1, "replicas": [1], "isrs": [1], "status": "HEALTHY"}],
+    }
+
+    def iter_describe(topic_names):
+        yield "topic1", description
+        raise KafkaException("broker transport failure")
+
+    with patch("kafka_wrapper.Topic") as mock_topic:
+        topic = mock_resource(mock_topic)
+        topic.iter_describe.side_effect = iter_describe
+
+        result = runner.invoke(cli, ["topics", "describe"])
+
+    # the described topic is written before the failure
+    assert result.exit_code == 1
+    assert json.loads(result.output.splitlines()[0]) == {"name": "topic1", **description}
+    assert "broker transport failure" in result.output
+
+
+def test_batch_brokers_list_future_error(runner):
+    with patch("kafka_wrapper.Broker") as mock_broker:
+        broker = mock_resource(mock_broker)
+        broker.iter_list.side_effect = Exception(KafkaError(KafkaError._TRANSPORT))
+
+        result = runner.invoke(cli, ["brokers", "list"])
+
+    assert result.exit_code == 1
+    assert "Error: Local: Broker transport failure" in result.output
+
+
+def test_batch_produce_from_stdin(runner):
+    report = {"messages": 2, "errors": 0, "last_error": None}
+    with patch("kafka_wrapper.producer.Producer") as mock_producer:
+        producer = mock_resource(mock_producer)
+        records = []
+        producer.produce_all.side_effect = lambda topic, rows: records.extend(rows) or report
+
+        result = runner.invoke(
+            cli,
+            ["-b", "mock:9092", "produce", "topic1", "--compression", "zstd"],
+            input="k1\tv1\nv2\n",
+        )
+
+    assert result.exit_code == 0
+    assert mock_producer.call_args.args[0] == {
+        "bootstrap.servers": "mock:9092",
+        "linger.ms": 50,
+        "batch.size": 1_000_000,
+        "compression.type": "zstd",
+    }
+    assert records == [{"key": b"k1", "value": b"v1"}, {"key": None, "value": b"v2"}]
+    assert json.loads(result.output) == {"topic": "topic1", **report}
+
+
+def test_batch_produce_fails_on_delivery_errors(runner):
+    with patch("kafka_wrapper.producer.Producer") as mock_producer:
+        producer = mock_resource(mock_producer)
+        producer.produce_all.return_value = {
+            "messages": 0,
+            "errors": 1,
+            "last_error": "Broker: Unknown topic",
+        }
+
+        result = runner.invoke(cli, ["produce", "topic1", "-F", "ndjson"], input='{"value": 1}\n')
+
+    assert result.exit_code == 1
+    assert "1 messages were not delivered: Broker: Unknown topic" in result.output
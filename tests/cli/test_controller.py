@@ -0,0 +1,145 @@
+from unittest.mock import MagicMock, patch
+from cli.controller import Controller, Navigation
+from cli.view import COMMAND, REPAINT
+
+import curses
+import pytest
+
+
+@pytest.fixture
+def navigation():
+    navigation = Navigation(max_cached_focuses=2)
+    navigation.focuses = {
+        focus: {
+            "view": MagicMock(side_effect=lambda window: MagicMock()),
+            "model": MagicMock(side_effect=lambda config: MagicMock()),
+        }
+        for focus in ("topics", "consumergroups", "brokers")
+    }
+    return navigation
+
+
+def test_navigation_get_current_focus_reuses_cached_view_and_model(navigation):
+    view, model = navigation.get_current_focus(MagicMock(), {})
+    navigation.navigate("groups")
+    navigation.get_current_focus(MagicMock(), {})
+    navigation.navigate("topics")
+
+    assert navigation.get_current_focus(MagicMock(), {}) == (view, model)
+    assert navigation.focuses["topics"]["model"].call_count == 1
+    view.handle_resize.assert_called_once()
+    model.close.assert_not_called()
+
+
+def test_navigation_get_current_focus_closes_least_recently_used(navigation):
+    _, topic_model = navigation.get_current_focus(MagicMock(), {})
+    navigation.navigate("groups")
+    _, group_model = navigation.get_current_focus(MagicMock(), {})
+    navigation.navigate("topics")
+    navigation.get_current_focus(MagicMock(), {})
+    navigation.navigate("brokers")
+    _, broker_model = navigation.get_current_focus(MagicMock(), {})
+
+    group_model.close.assert_called_once()
+    topic_model.close.assert_not_called()
+
+    navigation.close()
+    topic_model.close.assert_called_once()
+    broker_model.close.assert_called_once()
+
+
+def test_navigation_describe_and_back(navigation):
+    navigation.focuses["consumergroups"]["describe"] = "consumergroup"
+    navigation.focuses["consumergroup"] = {
+        "view": MagicMock(side_effect=lambda window: MagicMock()),
+        "model": MagicMock(side_effect=lambda config, key: MagicMock()),
+        "parent": "consumergroups",
+    }
+
+    # topics have no details
+    assert not navigation.describe("topic1")
+    assert not navigation.back()
+
+    navigation.navigate("groups")
+    assert not navigation.describe(None)
+    assert navigation.describe("group1")
+    _, group1_model = navigation.get_current_focus(MagicMock(), {})
+    navigation.focuses["consumergroup"]["model"].assert_called_once_with({}, "group1")
+
+    assert navigation.back()
+    assert (navigation.current_focus, navigation.current_key) == ("consumergroups", None)
+
+    # the details are cached per key
+    navigation.describe("group1")
+    assert navigation.get_current_focus(MagicMock(), {})[1] is group1_model
+    navigation.back()
+    navigation.describe("group2")
+    assert navigation.get_current_focus(MagicMock(), {})[1] is not group1_model
+
+
+def test_navigation_navigate_unknown_command(navigation):
+    navigation.current_focus, navigation.current_key = "consumergroup", "group1"
+
+    for command in ("", "bogus"):
+        assert not navigation.navigate(command)
+        assert (navigation.current_focus, navigation.current_key) == ("consumergroup", "group1")
+
+    assert navigation.navigate("topics")
+    assert (navigation.current_focus, navigation.current_key) == ("topics", None)
+
+
+def test_controller_run_unknown_command_in_lag_view(navigation):
+    lag_view = MagicMock()
+    lag_view.get_command.side_effect = ["", "bogus", "q"]
+    navigation.focuses["consumergroup"] = {
+        "view": MagicMock(return_value=lag_view),
+        "model": MagicMock(side_effect=lambda config, key: MagicMock()),
+        "parent": "consumergroups",
+    }
+    navigation.current_focus, navigation.current_key = "consumergroup", "group1"
+
+    controller = Controller.__new__(Controller)
+    controller.screen = MagicMock()
+    controller.refresh_interval = 10
+    controller.input_timeout_ms = 100
+    controller.frame_interval = 1 / 30
+    controller.navigation = navigation
+    controller.cleanup = MagicMock()
+    controller.read_input = MagicMock(return_value={COMMAND})
+
+    with patch("cli.controller.Refresher"):
+        assert controller.run({}) is None
+
+    # ":" and ":bogus" keep the lag view of the group until ":q"
+    assert lag_view.get_command.call_count == 3
+    navigation.focuses["consumergroup"]["model"].assert_called_once_with({}, "group1")
+
+
+def test_controller_read_input_drains_pending_keys():
+    controller = Controller.__new__(Controller)
+    controller.screen = MagicMock()
+    controller.frame_interval = 1 / 30
+
+    view = MagicMock()
+    view.get_ch.side_effect = [curses.KEY_DOWN, curses.KEY_DOWN, ord("x"), ord(":"), ord("q"), -1]
+    view.dispatch.side_effect = lambda ch, model: {curses.KEY_DOWN: REPAINT, ord(":"): COMMAND}.get(
+        ch
+    )
+
+    assert controller.read_input(view, MagicMock()) == {REPAINT, COMMAND}
+
+    # the keys typed after ":" are left to the command line
+    assert view.get_ch.call_count == 4
+    controller.screen.timeout.assert_called_once_with(0)
+
+
+def test_controller_read_input_without_keys():
+    controller = Controller.__new__(Controller)
+    controller.screen = MagicMock()
+    controller.frame_interval = 1 / 30
+
+    view = MagicMock()
+    view.get_ch.return_value = -1
+
+    assert controller.read_input(view, MagicMock()) == set()
+    view.dispatch.assert_not_called()
@@ -0,0 +1,145 @@
+from unittest.mock import MagicMock, patch
+from cli.exporter import Collector, MetricSet, create_server
+
+import threading
+import urllib.error
+import urllib.request
+import pytest
+
+
+@pytest.fixture
+def collector():
+    collector = Collector({"bootstrap.servers": "mock:9092"}, max_series=2)
+    collector._broker = MagicMock()
+    collector._broker.describe.return_value = {
+        "brokers": 3,
+        "topics": 2,
+        "partitions": 4,
+        "replicas": 12,
+        "consumer_groups": 1,
+    }
+    collector._topic = MagicMock()
+    collector._topic.describe.return_value = {
+        "topic1": {"partitions": 1, "availability": [{"status": "UNDER-REPLICATED"}]},
+        "topic2": {"partitions": 3, "availability": [{"status": "HEALTHY"}] * 3},
+    }
+    collector._consumer_group = MagicMock()
+    collector._lag_sampler = MagicMock()
+    collector._lag_sampler.get_group_ids.return_value = ["group1"]
+    collector._lag_sampler.get_partition_stats.return_value = [
+        {"topic": "topic2", "partition": p, "lag": p * 10, "committed_offset": 100}
+        for p in range(3)
+    ]
+    collector._lag_sampler.get_group_stats.return_value = {
+        "lag": 30,
+        "consume_rate": 2.5,
+        "lag_trend": -1.0,
+    }
+    return collector
+
+
+def get_samples(text):
+    return [line for line in text.splitlines() if not line.startswith("#")]
+
+
+def test_metric_set_render():
+    metrics = MetricSet()
+    metrics.add("k4_brokers", 3)
+    metrics.add("k4_topic_partitions", 6, topic='a"b\\c')
+    metrics.add("k4_consumergroup_lag_trend", -0.5, group="group1")
+
+    assert metrics.render().splitlines() == [
+        "# HELP k4_brokers The number of brokers in the cluster.",
+        "# TYPE k4_brokers gauge",
+        "k4_brokers 3",
+        "# HELP k4_topic_partitions The number of partitions of a topic.",
+        "# TYPE k4_topic_partitions gauge",
+        'k4_topic_partitions{topic="a\\"b\\\\c"} 6',
+        "# HELP k4_consumergroup_lag_trend The change of the lag of a consumer group in messages per second.",
+        "# TYPE k4_consumergroup_lag_trend gauge",
+        'k4_consumergroup_lag_trend{group="group1"} -0.5',
+    ]
+
+
+def test_metric_set_limits_series_per_metric():
+    metrics = MetricSet(max_series=2)
+    for partition in range(5):
+        metrics.add(
+            "k4_consumergroup_lag", partition, group="group1", topic="topic1", partition=partition
+        )
+
+    samples = get_samples(metrics.render())
+    assert len([s for s in samples if s.startswith("k4_consumergroup_lag{")]) == 2
+    assert 'k4_exporter_dropped_series{metric="k4_consumergroup_lag"} 3' in samples
+
+
+def test_collector_collect(collector):
+    assert collector.text == ""
+    collector.collect()
+
+    samples = get_samples(collector.text)
+    assert "k4_brokers 3" in samples
+    assert 'k4_topic_under_replicated_partitions{topic="topic1"} 1' in samples
+    assert 'k4_topic_under_replicated_partitions{topic="topic2"} 0' in samples
+    assert 'k4_consumergroup_lag{group="group1",topic="topic2",partition="1"} 10' in samples
+    assert 'k4_consumergroup_lag_sum{group="group1"} 30' in samples
+    assert 'k4_consumergroup_consume_rate{group="group1"} 2.5' in samples
+
+    # the third partition is over the cardinality limit
+    assert 'k4_exporter_dropped_series{metric="k4_consumergroup_lag"} 1' in samples
+    for name in ("brokers", "topics", "consumergroups"):
+        assert f'k4_exporter_collection_success{{collector="{name}"}} 1' in samples
+        assert any(
+            s.startswith(f'k4_exporter_collection_duration_seconds{{collector="{name}"}}')
+            for s in samples
+        )
+
+
+def test_collector_collect_fails_per_collector(collector):
+    collector._topic.describe.side_effect = RuntimeError("timed out")
+    collector.collect()
+
+    samples = get_samples(collector.text)
+    assert 'k4_exporter_collection_success{collector="topics"} 0' in samples
+    assert 'k4_exporter_collection_success{collector="brokers"} 1' in samples
+    assert "k4_brokers 3" in samples
+    assert not any(s.startswith("k4_topic_partitions") for s in samples)
+
+
+def test_collector_start_collects_in_the_background(collector):
+    collected = threading.Event()
+    collector._broker.describe.side_effect = lambda **kwargs: collected.set() or {
+        "brokers": 1,
+        "topics": 0,
+        "partitions": 0,
+        "replicas": 0,
+        "consumer_groups": 0,
+    }
+
+    collector.start(interval=60)
+    try:
+        assert collected.wait(5)
+    finally:
+        collector.stop()
+
+
+def test_server_serves_the_latest_collection_without_collecting(collector):
+    collector.text = "k4_brokers 3\n"
+    server = create_server(collector, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            assert response.status == 200
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert response.read() == b"k4_brokers 3\n"
+
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(f"{url}/other")
+        assert e.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # scrapes never call Kafka
+    collector._broker.describe.assert_not_called()
@@ -0,0 +1,139 @@
+from unittest.mock import MagicMock
+from cli.model import TopicModel, ConsumerGroupModel, ConsumerGroupLagModel
+
+import pytest
+
+
+@pytest.fixture
+def topic_model():
+    model = TopicModel({"bootstrap.servers": "mock:9092"})
+    model.client = MagicMock()
+    model.client.list.return_value = [
+        {"name": "alpha.topic.1", "partitions": 3},
+        {"name": "alpha.topic.2", "partitions": 1},
+        {"name": "beta.topic.1", "partitions": 6},
+    ]
+    model.update_input({"namespace": 0, "show_internal": False})
+    return model
+
+
+@pytest.fixture
+def consumer_group_model():
+    model = ConsumerGroupModel({"bootstrap.servers": "mock:9092"})
+    model.client = MagicMock()
+    model.client.list.return_value = [
+        {"id": "alpha.group", "type": "high-level", "state": "STABLE"},
+        {"id": "beta.group", "type": "high-level", "state": "STABLE"},
+    ]
+    model.update_input({"namespace": 0, "show_empty": False, "show_simple": False})
+    return model
+
+
+def test_topic_model_refresh_fetches_once(topic_model):
+    topic_model.refresh()
+
+    topic_model.client.list.assert_called_once_with(show_internal=False)
+    assert dict(topic_model.namespaces) == {0: "all", 1: "alpha", 2: "beta"}
+    assert len(topic_model.contents) == 4  # header and three topics
+    assert topic_model.fetch_duration is not None
+    assert "fetch" in topic_model.info
+
+
+def test_topic_model_get_row_ids(topic_model):
+    topic_model.refresh()
+
+    # namespaces are selected from the snapshot without fetching again
+    assert topic_model.get_row_ids(0) is None
+    assert [
+        topic_model.contents[row_id + 1].split()[0] for row_id in topic_model.get_row_ids(2)
+    ] == ["beta.topic.1"]
+    assert list(topic_model.get_row_ids(1, "2")) == [1]
+    assert list(topic_model.get_row_ids(9)) == []
+    topic_model.client.list.assert_called_once()
+
+
+def test_consumer_group_model_refresh_fetches_once(consumer_group_model):
+    consumer_group_model.refresh()
+
+    consumer_group_model.client.list.assert_called_once_with(show_empty=False, show_simple=False)
+    assert len(consumer_group_model.contents) == 3
+
+
+def test_topic_model_refresh_builds_search_index(topic_model):
+    topic_model.refresh()
+
+    row_ids = topic_model.index.search("topic.1")
+    assert [topic_model.contents[row_id + 1].split()[0] for row_id in row_ids] == [
+        "alpha.topic.1",
+        "beta.topic.1",
+    ]
+
+
+def test_topic_model_get_row_ids_sorted(topic_model):
+    topic_model.refresh()
+
+    assert list(topic_model.get_row_ids(sort_column=1, reverse=True)) == [2, 0, 1]
+    assert list(topic_model.get_row_ids(1, sort_column=1)) == [1, 0]
+
+
+def test_consumer_group_lag_model_refresh_samples_offsets():
+    model = ConsumerGroupLagModel({"bootstrap.servers": "mock:9092"}, "alpha.group")
+    model.client = MagicMock()
+    model.sampler.consumer_group = model.client
+    model.sampler.clock = MagicMock(return_value=0)
+    model.client.get_group_offsets.return_value = {
+        "alpha.group": {("beta.topic", 0): (100, 300), ("alpha.topic", 1): (50, 50)},
+    }
+    model.update_input({"namespace": 0})
+
+    model.refresh()
+    assert model.contents[1].split() == ["alpha.topic", "1", "50", "50", "0", "-", "-", "-", "0"]
+    assert model.info["lag"] == "200"
+
+    # the rates are known from the second sample
+    model.sampler.clock.return_value = 10
+    model.client.get_group_offsets.return_value = {
+        "alpha.group": {("beta.topic", 0): (400, 400), ("alpha.topic", 1): (50, 50)},
+    }
+    model.refresh()
+    assert model.contents[2].split() == [
+        "beta.topic",
+        "0",
+        "400",
+        "400",
+        "0",
+        "30.0",
+        "10.0",
+        "-20.0",
+        "0",
+    ]
+    assert model.info["group"] == "alpha.group"
+    assert model.info["lag"] == "0 (-20.0/s)"
+    assert model.info["eta"] == "0s"
+
+
+def test_consumer_group_lag_model_counts_partitions_per_namespace():
+    model = ConsumerGroupLagModel({"bootstrap.servers": "mock:9092"}, "alpha.group")
+    model.client = MagicMock()
+    model.sampler.consumer_group = model.client
+    model.client.get_group_offsets.return_value = {
+        "alpha.group": {
+            ("beta.topic", 0): (1, 1),
+            ("alpha.topic", 10): (1, 1),
+            ("alpha.topic", 2): (1, 1),
+            ("alpha.topic", 0): (1, 1),
+        },
+    }
+    model.update_input({"namespace": 0})
+    model.refresh()
+
+    assert model.namespace_index.get_top_namespaces() == {"alpha": 3, "beta": 1}
+    assert [row.split()[1] for row in model.contents[1:4]] == ["0", "2", "10"]
+    assert list(model.get_row_ids(1)) == [0, 1, 2]
+
+
+def test_consumer_group_lag_model_format_eta():
+    assert ConsumerGroupLagModel.format_eta(None) == "-"
+    assert ConsumerGroupLagModel.format_eta(42.4) == "42s"
+    assert ConsumerGroupLagModel.format_eta(150) == "2m30s"
+    assert ConsumerGroupLagModel.format_eta(7260) == "2h01m"
@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock
+from cli.refresher import Refresher
+
+import threading
+import time
+
+
+def wait_for(predicate, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def mock_model():
+    model = MagicMock()
+    model.name = "Topic"
+    model.snapshot.created_at = None
+    return model
+
+
+def test_refresher_refreshes_immediately_on_start():
+    model = mock_model()
+    refresher = Refresher(model, interval=60).start()
+    assert wait_for(lambda: model.refresh.call_count == 1)
+    refresher.stop()
+
+
+def test_refresher_request_refresh():
+    model = mock_model()
+    refresher = Refresher(model, interval=60).start()
+    assert wait_for(lambda: model.refresh.call_count == 1)
+
+    refresher.request_refresh()
+    assert wait_for(lambda: model.refresh.call_count == 2)
+    refresher.stop()
+
+
+def test_refresher_is_refreshing_while_model_refreshes():
+    model = mock_model()
+    release = threading.Event()
+    model.refresh.side_effect = lambda: release.wait()
+
+    refresher = Refresher(model, interval=60).start()
+    assert wait_for(lambda: refresher.is_refreshing)
+
+    release.set()
+    assert wait_for(lambda: not refresher.is_refreshing)
+    refresher.stop()
+
+
+def test_refresher_keeps_error_and_is_stale():
+    model = mock_model()
+    model.refresh.side_effect = Exception("broker down")
+
+    refresher = Refresher(model, interval=60).start()
+    assert wait_for(lambda: refresher.error is not None)
+    assert refresher.is_stale()
+    refresher.stop()
+
+
+def test_refresher_is_stale_after_two_intervals():
+    model = mock_model()
+    refresher = Refresher(model, interval=10)
+    assert not refresher.is_stale()
+
+    model.snapshot.created_at = time.time() - 5
+    assert not refresher.is_stale()
+
+    model.snapshot.created_at = time.time() - 21
+    assert refresher.is_stale()
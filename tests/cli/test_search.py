@@ -0,0 +1,44 @@
+from unittest.mock import patch
+from cli.search import NamespaceIndex, SearchIndex
+from cli import helper
+
+
+def test_search_index_search():
+    index = SearchIndex(["alpha.orders", "beta.Orders", "alpha.users", "_confluent"])
+
+    assert list(index.search("")) == [0, 1, 2, 3]
+    assert list(index.search("ORDERS")) == [0, 1]
+    assert list(index.search("alpha ord")) == [0]
+    assert list(index.search("a")) == [0, 1, 2]
+    assert list(index.search("missing")) == []
+
+
+def test_search_index_search_narrows_previous_results():
+    index = SearchIndex([f"topic.{i}" for i in range(1000)])
+
+    assert len(index.search("topic.1")) == 111
+    assert index._last_query == "topic.1"
+    assert list(index.search("topic.12")) == [12] + list(range(120, 130))
+
+    # A query that does not extend the previous one searches the index again
+    assert list(index.search("topic.99")) == [99] + list(range(990, 1000))
+
+
+def test_namespace_index_update():
+    index = NamespaceIndex(max_namespaces=2)
+
+    row_ids = index.update(["alpha.1", "alpha.2", "beta.1", "_gamma.1", "__internal"])
+    assert {k: list(v) for k, v in row_ids.items()} == {"alpha": [0, 1], "beta": [2], "gamma": [3]}
+    assert index.get_top_namespaces() == {"alpha": 2, "beta": 1}
+
+
+def test_namespace_index_update_only_parses_added_keys():
+    index = NamespaceIndex()
+    index.update(["alpha.1", "alpha.2", "beta.1"])
+
+    with patch.object(helper, "get_prefix", wraps=helper.get_prefix) as get_prefix:
+        row_ids = index.update(["alpha.2", "beta.1", "beta.2"])
+
+    get_prefix.assert_called_once_with("beta.2")
+    assert {k: list(v) for k, v in row_ids.items()} == {"alpha": [0], "beta": [1, 2]}
+    assert index.get_top_namespaces() == {"beta": 2, "alpha": 1}
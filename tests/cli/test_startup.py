@@ -0,0 +1,79 @@
+import json
+import os
+import subprocess
+import sys
+
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "..", "src")
+
+# The first frame of a large table only formats the lines that fit in the window
+WINDOW_HEIGHT = 40
+TOPIC_COUNT = 50000
+
+FIRST_FRAME = """
+import sys
+from collections import defaultdict
+from unittest.mock import MagicMock, patch
+from cli.model import TopicModel
+from cli.view import TopicView
+from cli.table import Table
+
+height, topic_count = map(int, sys.argv[1:])
+formatted = []
+format_line = Table.format
+
+def counting_format(self, values):
+    formatted.append(values)
+    return format_line(self, values)
+
+def new_window(h, w, *args):
+    window = MagicMock()
+    window.getmaxyx.return_value = (h, w)
+    window.getbegyx.return_value = (0, 0)
+    window.subwin.side_effect = new_window
+    window.derwin.side_effect = new_window
+    return window
+
+with patch("cli.view.curses_color_pair", defaultdict(int)), patch("curses.doupdate"), \\
+        patch.object(Table, "format", counting_format):
+    model = TopicModel({"bootstrap.servers": "mock:9092"})
+    model.client = MagicMock()
+    model.client.list.return_value = [{"name": f"topic.{i}", "partitions": i % 12} for i in range(topic_count)]
+    view = TopicView(new_window(height, 160))
+    model.update_input(view.input)
+    model.refresh()
+    view.display(model)
+
+print(len(model.contents) - 1)
+print(len(formatted))
+"""
+
+
+def run_python(code, *args):
+    env = {**os.environ, "PYTHONPATH": SRC}
+    result = subprocess.run(
+        [sys.executable, "-c", code, *map(str, args)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.splitlines()
+
+
+def test_startup_import_is_lazy():
+    output = run_python(
+        "import sys, json\n"
+        "import cli.main\n"
+        "print(json.dumps([m for m in ('curses', 'confluent_kafka', 'kafka_wrapper', 'yaml') if m in sys.modules]))\n"
+    )
+
+    assert json.loads(output[0]) == []
+
+
+def test_startup_first_frame():
+    output = run_python(FIRST_FRAME, WINDOW_HEIGHT, TOPIC_COUNT)
+    row_count, formatted_count = map(int, output[-2:])
+
+    assert row_count == TOPIC_COUNT
+    assert 0 < formatted_count <= WINDOW_HEIGHT
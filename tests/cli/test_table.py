@@ -0,0 +1,69 @@
+from cli.table import Table
+
+import pytest
+import tracemalloc
+
+
+@pytest.fixture
+def table():
+    return Table(["TOPIC", "PARTITIONS"], [("alpha", 12), ("beta.topic", 3), ("gamma", 100)])
+
+
+def test_table_lines(table):
+    assert len(table) == 4
+    assert table[0] == "TOPIC       PARTITIONS"
+    assert table[1] == "alpha       12"
+    assert table[-1] == "gamma       100"
+    assert table[2:] == ["beta.topic  3", "gamma       100"]
+    with pytest.raises(IndexError):
+        table[4]
+
+
+def test_table_widths_are_updated_on_append(table):
+    table.append(("a.much.longer.topic.name", 1))
+
+    assert table.widths == [24, 10]
+    assert table[1] == "alpha                     12"
+
+
+def test_table_sort_numeric(table):
+    assert table.get_sorted_row_ids(1) == [1, 0, 2]
+    assert table.get_sorted_row_ids(1, reverse=True) == [2, 0, 1]
+    assert table.sort_row_ids([2, 1], 1) == [1, 2]
+
+
+def test_table_columns(table):
+    table.append((None, 4))
+
+    assert [type(column).__name__ for column in table.columns] == ["ListColumn", "IntColumn"]
+    assert table.rows[-1] == (None, 4)
+    assert list(table.columns[0]) == ["alpha", "beta.topic", "gamma", None]
+
+
+def test_table_missing_values(table):
+    table.append((None, 4))
+
+    # missing values are shown as "-" and ordered first
+    assert table[4] == "-           4"
+    assert table.get_sorted_row_ids(0) == [3, 0, 1, 2]
+    assert table.get_sorted_row_ids(0, reverse=True) == [2, 1, 0, 3]
+
+
+def test_table_memory_benchmark():
+    # Rows as the snapshot held them before, a tuple with a str and an int per row
+    def get_rows():
+        return ((f"namespace.{i % 100}.topic.{i}", i % 12) for i in range(100_000))
+
+    def get_bytes_per_row(build):
+        tracemalloc.start()
+        try:
+            rows = build(get_rows())
+            return tracemalloc.get_traced_memory()[0] / 100_000
+        finally:
+            tracemalloc.stop()
+
+    tuple_bytes_per_row = get_bytes_per_row(list)
+    table_bytes_per_row = get_bytes_per_row(lambda rows: Table(["TOPIC", "PARTITIONS"], rows))
+
+    # About 140 bytes per row as tuples and 40 bytes per row in the table
+    assert table_bytes_per_row < tuple_bytes_per_row / 3
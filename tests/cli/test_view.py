@@ -0,0 +1,117 @@
+from collections import defaultdict
+from types import MappingProxyType
+from unittest.mock import MagicMock, patch
+from cli.table import Table
+from cli.view import (
+    TopicView,
+    ConsumerGroupView,
+    ConsumerGroupLagView,
+    BACK,
+    COMMAND,
+    DESCRIBE,
+    PRODUCE,
+    REFILTER,
+    REFRESH,
+    REPAINT,
+)
+from curses_wrapper import textbox
+
+import curses
+import pytest
+
+
+def new_window(h, w, *args):
+    window = MagicMock()
+    window.getmaxyx.return_value = (h, w)
+    window.getbegyx.return_value = (0, 0)
+    window.subwin.side_effect = new_window
+    window.derwin.side_effect = new_window
+    return window
+
+
+@pytest.fixture
+def view():
+    with patch("cli.view.curses_color_pair", defaultdict(int)):
+        yield TopicView(new_window(40, 160))
+
+
+@pytest.fixture
+def model():
+    model = MagicMock()
+    model.controls = {"i": "Show Internal"}
+    model.namespaces = MappingProxyType({0: "all", 1: "alpha"})
+    return model
+
+
+def test_topic_view_dispatch(view, model):
+    assert view.dispatch(curses.KEY_DOWN, model) == REPAINT
+    assert view.dispatch(ord("1"), model) == REFILTER
+    assert view.get_namespace() == 1
+    assert view.dispatch(ord("i"), model) == REFRESH
+    assert view.input["show_internal"]
+    assert view.dispatch(ord(":"), model) == COMMAND
+    assert view.dispatch(ord("p"), model) == PRODUCE
+
+    # unbound keys and namespaces that do not exist do nothing
+    assert view.dispatch(ord("x"), model) is None
+    assert view.dispatch(ord("5"), model) is None
+
+
+def test_topic_view_dispatch_filter(view, model):
+    assert view.dispatch(ord("/"), model) == REPAINT
+    assert view.dispatch(ord("i"), model) == REFILTER
+    assert view.dispatch(ord(":"), model) == REFILTER
+    assert view.filter == "i:"
+    assert view.dispatch(curses.KEY_DOWN, model) == REPAINT
+    assert view.dispatch(ord("\n"), model) == REPAINT
+    assert not view.is_filtering
+    assert not view.input["show_internal"]
+
+
+def test_topic_view_get_keymap_is_rebuilt_when_namespaces_change(view, model):
+    keymap = view.get_keymap(model)
+    assert view.get_keymap(model) is keymap
+
+    model.namespaces = MappingProxyType({0: "all", 1: "alpha", 2: "beta"})
+    assert ord("2") in view.get_keymap(model)
+
+
+def test_view_get_selected_key(view, model):
+    model.headers = ["ID", "STATE"]
+    model.contents = Table(model.headers, [("alpha.group", "STABLE"), ("beta.group", "STABLE")])
+    model.get_row_ids.return_value = None
+
+    # the cursor starts on the first row below the header
+    assert view.get_selected_key(model) == "alpha.group"
+    view.scroll_manager.current = 2
+    assert view.get_selected_key(model) == "beta.group"
+    view.scroll_manager.current = 3
+    assert view.get_selected_key(model) is None
+
+    # the cursor is on the rows selected by the filter and the sort order
+    view.filter = "beta"
+    model.get_row_ids.return_value = [1]
+    view.scroll_manager.current = 1
+    assert view.get_selected_key(model) == "beta.group"
+
+
+def test_consumer_group_views_dispatch_describe_and_back(model):
+    with patch("cli.view.curses_color_pair", defaultdict(int)):
+        group_view = ConsumerGroupView(new_window(40, 160))
+        lag_view = ConsumerGroupLagView(new_window(40, 160))
+
+    assert group_view.dispatch(ord("d"), model) == DESCRIBE
+    assert lag_view.dispatch(textbox.KEY_ESCAPE, model) == BACK
+
+    # escape clears the filter before it goes back
+    lag_view.dispatch(ord("/"), model)
+    assert lag_view.dispatch(textbox.KEY_ESCAPE, model) == REFILTER
+    assert lag_view.dispatch(textbox.KEY_ESCAPE, model) == BACK
+
+
+def test_view_get_refresh_status_after_failed_first_refresh(view):
+    refresher = MagicMock(is_refreshing=False, refreshed_at=None, error=None)
+    assert view.get_refresh_status(refresher) == ""
+
+    refresher.error = Exception("broker transport failure")
+    assert view.get_refresh_status(refresher) == " refresh failed "
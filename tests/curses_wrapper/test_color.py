@@ -1,10 +1,21 @@
 from unittest.mock import patch
-from curses_wrapper import CursesColor
+from curses_wrapper import CursesColor, CursesColorPair
+from curses_wrapper.color import NumberAllocator
 import pytest
 import curses
 import os
 
 
+class CountingSet(set):
+    """A set that counts its membership checks, i.e. the work of an allocation."""
+
+    lookups = 0
+
+    def __contains__(self, item):
+        self.lookups += 1
+        return super().__contains__(item)
+
+
 def test_curses_color_start_color(mock_curses):
     curses.COLORS = 256
     cc = CursesColor()
@@ -144,3 +155,71 @@ def test_curses_color_items(curses_color):
     assert color_name_to_number_items["RED"] == 253
     assert color_name_to_number_items["GREEN"] == 252
     assert color_name_to_number_items["BLUE"] == 251
+
+
+def test_curses_color__delitem__(curses_color):
+    color_number = curses_color["RED"]
+    del curses_color["RED"]
+
+    assert "RED" not in curses_color.color_name_to_number
+    assert color_number not in curses_color._used_color_numbers
+
+    # the released color number is reused first
+    assert curses_color.next_color_number() == color_number
+    curses_color["CUSTOM"] = (1, 2, 3)
+    assert curses_color["CUSTOM"] == color_number
+
+
+def test_curses_color_init_colors_when_max_colors(curses_color):
+    curses_color.init_colors(color_names=list(curses_color.color_names)[: curses.COLORS - 10])
+    used_color_numbers = set(curses_color._used_color_numbers)
+
+    with pytest.raises(Exception, match=f"All {curses.COLORS} colors are set."):
+        curses_color.init_colors(
+            color_names=list(curses_color.color_names)[curses.COLORS - 10 : curses.COLORS + 10]
+        )
+
+    # nothing was allocated
+    assert curses_color._used_color_numbers == used_color_numbers
+
+
+def test_number_allocator():
+    allocator = NumberAllocator(4, -1, -1)
+    assert [allocator.allocate() for _ in range(3)] == [4, 3, 2]
+
+    allocator.release(3)
+    allocator.used.add(1)
+    assert allocator.peek() == 3
+    assert allocator.allocate_many(2) == [3, 0]
+    assert allocator.allocate() is None
+
+    allocator.release(4)
+    assert allocator.allocate_many(2) is None
+    assert allocator.allocate() == 4
+
+
+def test_curses_color_init_colors_and_pairs_full_palette(mock_curses):
+    # The full palette, i.e. every color and a color pair for each on two backgrounds
+    curses.COLORS = 1024
+    curses.COLOR_PAIRS = 65536
+    curses_color = CursesColor()
+    with patch.dict(os.environ, {"TERM": "xterm-256color"}):
+        curses_color.start_color()
+    curses_color_pair = CursesColorPair(curses_color)
+    curses_color._used_color_numbers = CountingSet()
+    curses_color_pair._used_pair_numbers = CountingSet()
+
+    curses_color.init_colors(color_names=list(curses_color.color_names))
+    curses_color_pair.init_pairs("BLACK")
+    curses_color_pair.init_pairs("WHITE")
+
+    color_count = len(curses_color.color_name_to_number)
+    pair_count = len(curses_color_pair.pair_name_to_number)
+    assert pair_count == 2 * color_count
+    assert len(set(curses_color_pair._pair_name_to_pair_number.values())) == pair_count
+
+    # every number is allocated once, without scanning the numbers already in use
+    assert curses.init_color.call_count == color_count
+    assert curses.init_pair.call_count == pair_count
+    assert curses_color._used_color_numbers.lookups <= 2 * color_count
+    assert curses_color_pair._used_pair_numbers.lookups <= 2 * pair_count
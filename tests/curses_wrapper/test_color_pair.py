@@ -61,3 +61,19 @@ def test_curses_color_pair__iter__(curses_color_pair):
 
 def test_curses_color_pair_items(curses_color_pair):
     assert "BLACK_ON_DEFAULT" in dict(curses_color_pair.items())
+
+
+def test_curses_color_pair__setitem__with_existing_pair(curses_color_pair):
+    used_pair_numbers = set(curses_color_pair._used_pair_numbers)
+    curses_color_pair["RED_ON_DEFAULT"] = ("RED", "BLUE")
+
+    # the color pair was updated in place
+    assert curses_color_pair._used_pair_numbers == used_pair_numbers
+
+
+def test_curses_color_pair__delitem__(curses_color_pair):
+    pair_number = curses_color_pair._pair_name_to_pair_number["RED_ON_DEFAULT"]
+    del curses_color_pair["RED_ON_DEFAULT"]
+
+    assert "RED_ON_DEFAULT" not in curses_color_pair.pair_name_to_number
+    assert curses_color_pair.next_pair_number() == pair_number
@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock
+from curses_wrapper import ScrollManager, LazyRows
+
+import curses
+import pytest
+
+
+@pytest.fixture
+def window():
+    window = MagicMock()
+    window.getmaxyx.return_value = (10, 40)
+    window.getbegyx.return_value = (0, 0)
+    return window
+
+
+@pytest.fixture
+def scroll_manager(window):
+    sm = ScrollManager()
+    sm.init(window, color_pair_id=1, cursor_start_position=1, has_fixed_header_line=True)
+    return sm
+
+
+def test_lazy_rows():
+    rows = LazyRows(3, lambda i: f"line {i}", lambda i: i + 10)
+    assert len(rows) == 3
+    assert rows[1] == {"line": "line 1", "color_pair_id": 11}
+    assert rows[-1]["line"] == "line 2"
+    assert [r["line"] for r in rows[1:]] == ["line 1", "line 2"]
+    with pytest.raises(IndexError):
+        rows[3]
+
+
+def test_scroll_manager_display_only_materializes_visible_rows(scroll_manager, window):
+    get_line = MagicMock(side_effect=lambda i: "HEADER" if i == 0 else f"row {i}")
+    scroll_manager.items = LazyRows(100_000, get_line)
+
+    for _ in range(5):
+        scroll_manager.scroll(ScrollManager.DOWN)
+    scroll_manager.display()
+
+    # the visible window and the fixed header line
+    assert get_line.call_count <= scroll_manager.max_lines + 1
+    assert window.addnstr.call_count == scroll_manager.max_lines
+    assert scroll_manager.select_item_line() == "row 6"
+
+
+def test_scroll_manager_display_with_list_items(scroll_manager, window):
+    scroll_manager.items = [{"line": "HEADER"}, {"line": "row 1", "color_pair_id": 2}]
+    scroll_manager.display()
+
+    window.addnstr.assert_any_call(0, 0, "HEADER".ljust(40), 40, 1)
+    window.addnstr.assert_any_call(
+        1, 0, "row 1".ljust(40), 40, 2 | curses.A_REVERSE | curses.A_BOLD
+    )
+
+
+def test_scroll_manager_display_repaints_only_damaged_lines(scroll_manager, window):
+    scroll_manager.items = LazyRows(100, lambda i: "HEADER" if i == 0 else f"row {i}")
+    scroll_manager.display()
+    window.reset_mock()
+
+    # Moving the cursor damages the old and the new cursor lines
+    scroll_manager.scroll(ScrollManager.DOWN)
+    scroll_manager.display()
+
+    assert [c.args[0] for c in window.addnstr.call_args_list] == [1, 2]
+    window.erase.assert_not_called()
+    window.refresh.assert_not_called()
+    window.noutrefresh.assert_called_once()
+
+    # Nothing changed, nothing is repainted
+    window.reset_mock()
+    scroll_manager.display()
+    window.addnstr.assert_not_called()
+
+
+def test_scroll_manager_display_clears_lines_no_longer_drawn(scroll_manager, window):
+    scroll_manager.items = [{"line": "HEADER"}, {"line": "row 1"}, {"line": "row 2"}]
+    scroll_manager.display()
+    window.reset_mock()
+
+    scroll_manager.items = [{"line": "HEADER"}, {"line": "row 1"}]
+    scroll_manager.display()
+
+    window.move.assert_called_once_with(2, 0)
+    window.clrtoeol.assert_called_once()
+    window.addnstr.assert_not_called()
+
+    # An invalidated window is erased and repainted
+    window.reset_mock()
+    scroll_manager.invalidate()
+    scroll_manager.display()
+    window.erase.assert_called_once()
+    assert window.addnstr.call_count == 2
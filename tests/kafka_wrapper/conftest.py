@@ -2,6 +2,8 @@ from unittest.mock import MagicMock
 from kafka_wrapper.broker import Broker
 from kafka_wrapper.topic import Topic
 from kafka_wrapper.consumer_group import ConsumerGroup
+from kafka_wrapper.async_topic import AsyncTopic
+from kafka_wrapper.async_consumer_group import AsyncConsumerGroup
 
 import pytest
 
@@ -35,3 +37,17 @@ def kafka_consumer_group(admin_client):
     g = ConsumerGroup({"bootstrap.servers": "mock:9092"})
     g.admin_client = admin_client
     return g
+
+
+@pytest.fixture
+def async_kafka_topic(admin_client):
+    t = AsyncTopic({"bootstrap.servers": "mock:9092"})
+    t.admin_client = admin_client
+    return t
+
+
+@pytest.fixture
+def async_kafka_consumer_group(admin_client):
+    g = AsyncConsumerGroup({"bootstrap.servers": "mock:9092"})
+    g.admin_client = admin_client
+    return g
@@ -0,0 +1,92 @@
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+from confluent_kafka import ConsumerGroupState, ConsumerGroupTopicPartitions, TopicPartition
+
+import asyncio
+import threading
+import time
+
+
+def resolved_later(value, delay=0.1):
+    """Returns a future that is resolved from another thread, like the AdminClient futures."""
+    future = Future()
+    threading.Timer(delay, future.set_result, args=[value]).start()
+    return future
+
+
+def group_metadata():
+    metadata = MagicMock(members=[], is_simple_consumer_group=False)
+    metadata.state.name = "EMPTY"
+    return metadata
+
+
+def test_async_consumer_group_list(admin_client, async_kafka_consumer_group):
+    group = MagicMock(group_id="group1", is_simple_consumer_group=False)
+    group.state.name = "STABLE"
+    admin_client.list_consumer_groups.return_value = resolved_later(MagicMock(valid=[group]))
+
+    result = asyncio.run(async_kafka_consumer_group.list())
+
+    admin_client.list_consumer_groups.assert_called_once_with(
+        states={ConsumerGroupState.STABLE}, request_timeout=10
+    )
+    assert result == [{"id": "group1", "type": "high-level", "state": "STABLE"}]
+
+
+def test_async_consumer_group_describe_runs_groups_concurrently(
+    admin_client, async_kafka_consumer_group
+):
+    group_ids = [f"group{i}" for i in range(10)]
+    admin_client.describe_consumer_groups.side_effect = lambda ids, request_timeout: {
+        group_id: resolved_later(group_metadata()) for group_id in ids
+    }
+
+    async def describe_each_group():
+        return await asyncio.gather(
+            *(
+                async_kafka_consumer_group.describe(group_ids=[g], include_offset_lag=False)
+                for g in group_ids
+            )
+        )
+
+    start = time.monotonic()
+    results = asyncio.run(describe_each_group())
+
+    # ten 100ms requests complete in roughly the time of one
+    assert time.monotonic() - start < 0.5
+    assert [list(r) for r in results] == [[g] for g in group_ids]
+    assert results[0]["group0"]["state"] == "EMPTY"
+
+
+def test_async_consumer_group_describe_with_offset_lag(admin_client, async_kafka_consumer_group):
+    metadata = group_metadata()
+    member = MagicMock(member_id="member1", host="host1", client_id="client1")
+    member.assignment.topic_partitions = [TopicPartition("topic1", 0)]
+    metadata.members = [member]
+    admin_client.describe_consumer_groups.return_value = {"group1": resolved_later(metadata)}
+    admin_client.list_consumer_group_offsets.return_value = {
+        "group1": resolved_later(
+            ConsumerGroupTopicPartitions("group1", [TopicPartition("topic1", 0, 10)])
+        )
+    }
+
+    # the committed offsets are awaited instead of waited on in a thread
+    with patch(
+        "kafka_wrapper.consumer_group.ConsumerGroup._get_watermarks",
+        return_value={("topic1", 0): (0, 100)},
+    ) as mock_get_watermarks, patch(
+        "kafka_wrapper.consumer_group.ConsumerGroup.get_committed_offsets"
+    ) as mock_get_committed_offsets:
+        result = asyncio.run(async_kafka_consumer_group.describe(group_ids=["group1"]))
+
+    mock_get_committed_offsets.assert_not_called()
+    mock_get_watermarks.assert_called_once_with([("topic1", 0)], None)
+    assert result["group1"]["members"][0]["assignments"] == [
+        {
+            "topic": "topic1",
+            "partition": 0,
+            "current_offset": "10",
+            "log_end_offset": 100,
+            "lag": "90",
+        }
+    ]
@@ -0,0 +1,57 @@
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+from confluent_kafka.admin import ConfigResource, ResourceType
+
+import asyncio
+import threading
+
+
+def resolved_later(value, delay=0.01):
+    """Returns a future that is resolved from another thread, like the AdminClient futures."""
+    future = Future()
+    threading.Timer(delay, future.set_result, args=[value]).start()
+    return future
+
+
+def test_async_topic_describe_configs(admin_client, async_kafka_topic):
+    admin_client.list_topics.return_value = MagicMock(
+        topics={topic: {} for topic in ["topic1", "topic2"]}
+    )
+    admin_client.describe_configs.side_effect = lambda resources: {
+        r: resolved_later({"cleanup.policy": MagicMock(value="delete")}) for r in resources
+    }
+
+    result = asyncio.run(async_kafka_topic.describe_configs())
+
+    admin_client.describe_configs.assert_called_once_with(
+        [ConfigResource(ResourceType.TOPIC, "topic1"), ConfigResource(ResourceType.TOPIC, "topic2")]
+    )
+    assert set(result) == {"topic1", "topic2"}
+
+
+def test_async_topic_delete(admin_client, async_kafka_topic):
+    admin_client.delete_topics.return_value = {
+        "topic1": resolved_later(None),
+        "topic2": resolved_later(None),
+    }
+
+    asyncio.run(async_kafka_topic.delete(["topic1", "topic2"]))
+    admin_client.delete_topics.assert_called_once_with(["topic1", "topic2"], operation_timeout=10)
+
+
+def test_async_topic_list(admin_client, async_kafka_topic):
+    admin_client.list_topics.return_value = MagicMock(topics={"topic1": MagicMock(partitions={})})
+    admin_client.list_topics.return_value.topics["topic1"].__str__.return_value = "topic1"
+
+    result = asyncio.run(async_kafka_topic.list())
+    assert result == [{"name": "topic1", "partitions": 0}]
+
+
+def test_async_topic_list_fresh_metadata_skips_the_executor(admin_client, async_kafka_topic):
+    admin_client.list_topics.return_value = MagicMock(topics={})
+    asyncio.run(async_kafka_topic.list())
+
+    # the cached snapshot is returned on the loop, only a fetch runs on the executor
+    with patch.object(async_kafka_topic, "_run", side_effect=AssertionError):
+        assert asyncio.run(async_kafka_topic.list()) == []
+    admin_client.list_topics.assert_called_once()
@@ -0,0 +1,48 @@
+from kafka_wrapper.background import BackgroundLoop
+
+import threading
+
+
+def test_background_loop_restart_uses_new_events():
+    calls = []
+    called = threading.Event()
+
+    def target():
+        calls.append(threading.current_thread())
+        called.set()
+
+    loop = BackgroundLoop("k4-test")
+    assert not loop.is_running
+    loop.start(target, interval=60)
+    assert called.wait(5)
+    first_thread, first_stopped = loop._thread, loop._stopped
+
+    # starting a running loop does nothing
+    loop.start(target, interval=60)
+    assert loop._thread is first_thread
+
+    loop.stop()
+    assert not loop.is_running
+
+    # the old thread is joined and keeps its stopped event
+    called.clear()
+    loop.start(target, interval=60)
+    assert not first_thread.is_alive()
+    assert first_stopped.is_set()
+    assert loop._stopped is not first_stopped
+    assert loop.is_running
+    assert called.wait(5)
+    assert calls[-1] is loop._thread
+
+    loop.stop()
+
+
+def test_background_loop_delay_first_and_wake():
+    called = threading.Event()
+    loop = BackgroundLoop("k4-test")
+    loop.start(called.set, interval=60, delay_first=True)
+    assert not called.wait(0.05)
+
+    loop.wake()
+    assert called.wait(5)
+    loop.stop()
@@ -1,7 +1,10 @@
 import pytest
-from unittest.mock import MagicMock, call
+from concurrent.futures import Future
+from unittest.mock import MagicMock, call, patch
 from confluent_kafka.admin import ConfigResource, ResourceType
-from confluent_kafka import ConsumerGroupState
+from confluent_kafka import ConsumerGroupState, KafkaException
+
+import threading
 
 
 def test_broker_list(admin_client, kafka_broker):
@@ -87,3 +90,92 @@ def test_broker_alter_with_broker_ids(admin_client, kafka_broker):
             call.alter_configs().items().__iter__(),
         ]
     )
+
+
+class FakeBrokerRequests:
+    """Resolves each per-broker request from another thread and tracks the requests in flight."""
+
+    def __init__(self, failing_broker_ids=()):
+        self.failing_broker_ids = failing_broker_ids
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, resources, **kwargs):
+        resource = resources[0]
+        future = Future()
+
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        def resolve():
+            with self.lock:
+                self.in_flight -= 1
+            if resource.name in self.failing_broker_ids:
+                future.set_exception(KafkaException("broker is down"))
+            else:
+                config_entry = MagicMock(value="1000", is_read_only=False)
+                config_entry.name = "log.retention.ms"
+                future.set_result({"log.retention.ms": config_entry})
+
+        threading.Timer(0.02, resolve).start()
+        return {resource: future}
+
+
+def test_broker_describe_all_configs_bounds_requests_in_flight(admin_client, kafka_broker):
+    requests = FakeBrokerRequests(failing_broker_ids=("3",))
+    admin_client.describe_configs.side_effect = requests
+    broker_ids = list(range(1, 9))
+
+    results = kafka_broker.describe_all_configs(broker_ids=broker_ids, max_in_flight=3)
+
+    assert admin_client.describe_configs.call_count == len(broker_ids)
+    assert requests.max_in_flight <= 3
+    assert results[1] == {"status": "OK", "configs": {"log.retention.ms": "1000"}}
+    assert results[3] == {"status": "ERROR", "error": str(KafkaException("broker is down"))}
+
+
+def test_broker_alter_rolling(admin_client, kafka_broker):
+    requests = FakeBrokerRequests()
+    admin_client.alter_configs.side_effect = requests
+    config = {"log.retention.ms": "1000"}
+
+    # the requests of a wave are complete before the delay to the next wave
+    in_flight_when_sleeping = []
+
+    def sleep(seconds):
+        in_flight_when_sleeping.append(requests.in_flight)
+
+    with patch("kafka_wrapper.broker.time.sleep", side_effect=sleep) as mock_sleep:
+        results = kafka_broker.alter(
+            config, broker_ids=[1, 2, 3, 4, 5], max_in_flight=2, rolling=True, wave_delay=0.05
+        )
+
+    # three waves with a delay between each
+    assert mock_sleep.call_args_list == [call(0.05), call(0.05)]
+    assert in_flight_when_sleeping == [0, 0]
+    assert requests.max_in_flight <= 2
+    assert all(r == {"status": "OK"} for r in results.values())
+
+
+def test_broker_alter_records_request_errors(admin_client, kafka_broker):
+    requests = FakeBrokerRequests()
+
+    def alter_configs(resources, **kwargs):
+        if resources[0].name == "2":
+            raise ValueError("invalid config")
+        return requests(resources, **kwargs)
+
+    admin_client.alter_configs.side_effect = alter_configs
+    results = kafka_broker.alter(
+        {"log.retention.ms": "1000"}, broker_ids=[1, 2, 3], max_in_flight=2
+    )
+
+    # the requests in flight when broker 2 failed still complete
+    assert results == {
+        1: {"status": "OK"},
+        2: {"status": "ERROR", "error": "invalid config"},
+        3: {"status": "OK"},
+    }
+    assert requests.in_flight == 0
@@ -0,0 +1,125 @@
+from unittest.mock import MagicMock, patch
+from kafka_wrapper.client_pool import AdminClientPool
+from kafka_wrapper.topic import Topic
+from kafka_wrapper.consumer_group import ConsumerGroup
+
+import pytest
+import threading
+
+
+@pytest.fixture
+def pool():
+    return AdminClientPool(client_factory=MagicMock)
+
+
+def test_admin_client_pool_acquire_shares_client(pool):
+    config = {"bootstrap.servers": "mock:9092"}
+    client1 = pool.acquire(config)
+    client2 = pool.acquire(dict(config))
+    assert client1 is client2
+    assert pool.ref_count(config) == 2
+    assert len(pool) == 1
+
+
+def test_admin_client_pool_acquire_with_different_config(pool):
+    client1 = pool.acquire({"bootstrap.servers": "mock:9092"})
+    client2 = pool.acquire({"bootstrap.servers": "mock:9093"})
+    assert client1 is not client2
+    assert len(pool) == 2
+
+
+def test_admin_client_pool_disables_auto_topic_creation():
+    client_factory = MagicMock()
+    pool = AdminClientPool(client_factory=client_factory)
+    pool.acquire({"bootstrap.servers": "mock:9092"})
+    client_factory.assert_called_once_with(
+        {"bootstrap.servers": "mock:9092", "allow.auto.create.topics": False}
+    )
+
+
+def test_admin_client_pool_auto_topic_creation_override():
+    client_factory = MagicMock()
+    pool = AdminClientPool(client_factory=client_factory)
+    pool.acquire({"bootstrap.servers": "mock:9092", "allow.auto.create.topics": True})
+    client_factory.assert_called_once_with(
+        {"bootstrap.servers": "mock:9092", "allow.auto.create.topics": True}
+    )
+
+
+def test_admin_client_pool_key_with_unhashable_value(pool):
+    callback = []
+    config = {"bootstrap.servers": "mock:9092", "oauth_cb": callback}
+    assert pool.acquire(config) is pool.acquire(config)
+
+
+def test_admin_client_pool_release_and_prune(pool):
+    config = {"bootstrap.servers": "mock:9092"}
+    client = pool.acquire(config)
+    pool.release(config)
+    assert pool.ref_count(config) == 0
+
+    # Released clients stay warm until pruned
+    assert pool.acquire(config) is client
+    pool.release(config)
+    pool.prune()
+    assert config not in pool
+
+
+def test_admin_client_pool_close(pool):
+    pool.acquire({"bootstrap.servers": "mock:9092"})
+    pool.close()
+    assert len(pool) == 0
+
+
+def test_admin_client_pool_refreshes_watermarks_in_background():
+    pool = AdminClientPool(
+        client_factory=MagicMock, watermark_max_staleness=0.05, watermark_refresh_interval=0.01
+    )
+    config = {"bootstrap.servers": "mock:9092"}
+    refreshed = threading.Event()
+
+    with patch("kafka_wrapper.client_pool.list_watermarks") as list_watermarks:
+        list_watermarks.side_effect = lambda client, topic_partitions: refreshed.set() or {}
+        client = pool.acquire(config)
+        for _ in range(2):
+            pool.watermark_cache(config).get(
+                [("topic1", 0)], lambda topic_partitions: {("topic1", 0): (0, 10)}
+            )
+        assert refreshed.wait(timeout=2)
+        pool.close()
+
+    # the partition that was read again is refreshed with the pooled client
+    list_watermarks.assert_called_with(client, [("topic1", 0)])
+
+
+def test_admin_client_pool_without_watermark_refresh():
+    # the background refresh is opt-in
+    pool = AdminClientPool(client_factory=MagicMock)
+    config = {"bootstrap.servers": "mock:9092"}
+    pool.acquire(config)
+    assert not pool.watermark_cache(config)._refresh_loop.is_running
+
+
+def test_kafka_resources_share_pooled_client(pool):
+    config = {"bootstrap.servers": "mock:9092"}
+    topic = Topic(config, admin_client_pool=pool)
+    group = ConsumerGroup(config, admin_client_pool=pool)
+    assert topic.admin_client is group.admin_client
+    assert pool.ref_count(config) == 2
+
+    with topic, group:
+        pass
+
+    assert pool.ref_count(config) == 0
+
+
+def test_kafka_resources_share_watermark_cache(pool):
+    config = {"bootstrap.servers": "mock:9092"}
+    topic = Topic(config, admin_client_pool=pool)
+    group = ConsumerGroup(config, admin_client_pool=pool)
+    assert topic.watermark_cache is group.watermark_cache
+
+    # background refreshes are stopped with the pool
+    group.watermark_cache.start(MagicMock(), interval=60)
+    pool.close()
+    assert not group.watermark_cache._refresh_loop.is_running
@@ -1,6 +1,14 @@
+from concurrent.futures import Future
 import pytest
 from unittest.mock import MagicMock, call, patch
-from confluent_kafka import ConsumerGroupState, TopicPartition
+from confluent_kafka import (
+    ConsumerGroupState,
+    ConsumerGroupTopicPartitions,
+    TopicPartition,
+    OFFSET_INVALID,
+    KafkaError,
+)
+from confluent_kafka.admin import OffsetSpec
 from kafka_wrapper.consumer_group import ConsumerGroup
 
 
@@ -122,32 +130,220 @@ def test_consumer_group_list_only_high_level(admin_client, kafka_consumer_group)
     )
 
 
-def test_consumer_group_get_offset_lag(kafka_consumer_group, consumer):
-    mock_partitions = [
-        MagicMock(topic="topic1", partition=0, offset=10),
-        MagicMock(topic="topic1", partition=1, offset=-1),
-        MagicMock(topic="topic2", partition=0, offset=100),
-    ]
-    consumer.committed.return_value = mock_partitions
-    consumer.get_watermark_offsets.side_effect = [(0, 100), (0, 200), (50, 200)]
+def committed_offsets(group_id, offsets):
+    future = Future()
+    future.set_result(
+        ConsumerGroupTopicPartitions(
+            group_id, [TopicPartition(t, p, offset) for (t, p), offset in offsets.items()]
+        )
+    )
+    return {group_id: future}
+
+
+def list_offsets(offsets):
+    def list_offsets(topic_partition_offsets, request_timeout):
+        futures = {}
+        for tp, offset_spec in topic_partition_offsets.items():
+            futures[tp] = Future()
+            low, high = offsets[(tp.topic, tp.partition)]
+            is_earliest = type(offset_spec) is type(OffsetSpec.earliest())
+            futures[tp].set_result(MagicMock(offset=low if is_earliest else high))
+        return futures
+
+    return list_offsets
+
+
+def test_consumer_group_get_offset_lag(admin_client, kafka_consumer_group):
+    admin_client.list_consumer_group_offsets.return_value = committed_offsets(
+        "group1", {("topic1", 0): 10, ("topic1", 1): OFFSET_INVALID, ("topic2", 0): 100}
+    )
+    admin_client.list_offsets.side_effect = list_offsets(
+        {("topic1", 0): (0, 100), ("topic1", 1): (0, 200), ("topic2", 0): (50, 200)}
+    )
 
     topic_partitions = [
         TopicPartition("topic1", 0),
         TopicPartition("topic1", 1),
         TopicPartition("topic2", 0),
     ]
+    result = kafka_consumer_group.get_offset_lag(topic_partitions, group_id="group1")
+
+    # the committed offsets are those of the described group
+    request = admin_client.list_consumer_group_offsets.call_args.args[0][0]
+    assert request.group_id == "group1"
+    assert request.topic_partitions == topic_partitions
+
+    assert result["topic1"][0] == {"current_offset": "10", "log_end_offset": 100, "lag": "90"}
+    assert result["topic1"][1] == {"current_offset": "-", "log_end_offset": 200, "lag": "200"}
+    assert result["topic2"][0] == {"current_offset": "100", "log_end_offset": 200, "lag": "100"}
+
+
+def test_consumer_group_get_offset_lag_with_consumer(admin_client, kafka_consumer_group):
+    consumer = MagicMock()
+    consumer.committed.return_value = [TopicPartition("topic1", 0, 10)]
+    admin_client.list_offsets.side_effect = list_offsets({("topic1", 0): (0, 100)})
+
+    topic_partitions = [TopicPartition("topic1", 0)]
     result = kafka_consumer_group.get_offset_lag(topic_partitions, consumer)
-    consumer.assert_has_calls(
-        [
-            call.__bool__(),
-            call.committed(topic_partitions, timeout=10),
-            call.get_watermark_offsets(mock_partitions[0], timeout=10, cached=False),
-            call.get_watermark_offsets(mock_partitions[1], timeout=10, cached=False),
-            call.get_watermark_offsets(mock_partitions[2], timeout=10, cached=False),
-            call.close(),
-        ]
+
+    # the committed offsets are those of the consumer's group
+    consumer.committed.assert_called_once_with(topic_partitions, timeout=10)
+    consumer.close.assert_called_once()
+    admin_client.list_consumer_group_offsets.assert_not_called()
+    assert result == {"topic1": {0: {"current_offset": "10", "log_end_offset": 100, "lag": "90"}}}
+
+
+def test_consumer_group_get_committed_offsets_skips_partition_errors(
+    admin_client, kafka_consumer_group
+):
+    failed = MagicMock(
+        topic="topic1",
+        partition=1,
+        offset=OFFSET_INVALID,
+        error=KafkaError(KafkaError.UNKNOWN_TOPIC_OR_PART),
+    )
+    future = Future()
+    future.set_result(
+        ConsumerGroupTopicPartitions("group1", [TopicPartition("topic1", 0, 10), failed])
+    )
+    admin_client.list_consumer_group_offsets.return_value = {"group1": future}
+
+    result = kafka_consumer_group.get_committed_offsets({"group1": None})
+
+    assert result == {"group1": {("topic1", 0): 10}}
+
+
+def test_consumer_group_get_groups_offset_lag(admin_client, kafka_consumer_group):
+    offsets = {
+        "group1": {("topic1", 0): 10, ("topic1", 1): 20},
+        "group2": {("topic1", 0): 5, ("topic2", 0): 5},
+    }
+    admin_client.list_consumer_group_offsets.side_effect = (
+        lambda requests, request_timeout: committed_offsets(
+            requests[0].group_id, offsets[requests[0].group_id]
+        )
+    )
+    admin_client.list_offsets.side_effect = list_offsets(
+        {("topic1", 0): (0, 100), ("topic1", 1): (0, 100), ("topic2", 0): (0, 50)}
+    )
+
+    result = kafka_consumer_group.get_groups_offset_lag(
+        {
+            "group1": [TopicPartition("topic1", 0), TopicPartition("topic1", 1)],
+            "group2": [TopicPartition("topic1", 0), TopicPartition("topic2", 0)],
+            "group3": [],
+        }
     )
 
+    # one committed offsets request per group with assignments
+    assert admin_client.list_consumer_group_offsets.call_count == 2
+
+    # the watermarks of the partition read by both groups are fetched once
+    for call_args in admin_client.list_offsets.call_args_list:
+        assert len(call_args.args[0]) == 3
+
+    assert result["group1"]["topic1"][1]["lag"] == "80"
+    assert result["group2"]["topic1"][0]["lag"] == "95"
+    assert result["group2"]["topic2"][0]["lag"] == "45"
+    assert result["group3"] == {}
+
+
+def test_consumer_group_get_group_offsets(admin_client, kafka_consumer_group):
+    offsets = {
+        "group1": {("topic1", 0): 10, ("topic1", 1): OFFSET_INVALID},
+        "group2": {("topic1", 0): 5, ("topic2", 0): 5},
+    }
+    admin_client.list_consumer_group_offsets.side_effect = (
+        lambda requests, request_timeout: committed_offsets(
+            requests[0].group_id, offsets[requests[0].group_id]
+        )
+    )
+    admin_client.list_offsets.side_effect = list_offsets(
+        {("topic1", 0): (0, 100), ("topic1", 1): (0, 100), ("topic2", 0): (-1, -1)}
+    )
+
+    result = kafka_consumer_group.get_group_offsets(["group1", "group2"])
+
+    # every partition the groups committed to is requested
+    for call_args in admin_client.list_consumer_group_offsets.call_args_list:
+        assert call_args.args[0][0].topic_partitions is None
+
+    # partitions without a committed offset or a log end offset are left out
+    assert result == {"group1": {("topic1", 0): (10, 100)}, "group2": {("topic1", 0): (5, 100)}}
+
+
+def test_consumer_group_describe_batches_offset_lag(admin_client, kafka_consumer_group):
+    member = MagicMock(member_id="member1", host="host1", client_id="client1")
+    member.assignment.topic_partitions = [TopicPartition("topic1", 0), TopicPartition("topic1", 1)]
+    group_metadata = MagicMock(members=[member])
+    group_metadata.state.name = "STABLE"
+    future = MagicMock()
+    future.result.return_value = group_metadata
+    admin_client.describe_consumer_groups.return_value = {"group1": future}
+
+    with patch(
+        "kafka_wrapper.consumer_group.ConsumerGroup.get_groups_offset_lag"
+    ) as mock_get_groups_offset_lag:
+        mock_get_groups_offset_lag.return_value = {
+            "group1": {
+                "topic1": {
+                    0: {"current_offset": "1", "log_end_offset": 2, "lag": "1"},
+                    1: {"current_offset": "3", "log_end_offset": 5, "lag": "2"},
+                }
+            }
+        }
+        result = kafka_consumer_group.describe(group_ids=["group1"])
+
+    mock_get_groups_offset_lag.assert_called_once_with(
+        {"group1": [TopicPartition("topic1", 0), TopicPartition("topic1", 1)]}
+    )
+    assignments = result["group1"]["members"][0]["assignments"]
+    assert [a["lag"] for a in assignments] == ["1", "2"]
+
+
+def test_consumer_group_iter_describe_yields_groups_as_they_complete(
+    admin_client, kafka_consumer_group
+):
+    group1_future, group2_future = Future(), Future()
+    admin_client.describe_consumer_groups.return_value = {
+        "group1": group1_future,
+        "group2": group2_future,
+    }
+    group_metadata = MagicMock(members=[])
+    group_metadata.state.name = "EMPTY"
+
+    groups = kafka_consumer_group.iter_describe(
+        group_ids=["group1", "group2"], include_offset_lag=False
+    )
+
+    # group2 is described before group1
+    group2_future.set_result(group_metadata)
+    assert next(groups)[0] == "group2"
+    group1_future.set_result(group_metadata)
+    group_id, description = next(groups)
+    assert group_id == "group1"
+    assert description["members"][0]["id"] == "group1"
+    assert list(groups) == []
+
+
+def test_consumer_group_iter_describe_with_offset_lag(admin_client, kafka_consumer_group):
+    member = MagicMock(member_id="member1", host="host1", client_id="client1")
+    member.assignment.topic_partitions = [TopicPartition("topic1", 0)]
+    future = Future()
+    future.set_result(MagicMock(members=[member]))
+    admin_client.describe_consumer_groups.return_value = {"group1": future}
+
+    with patch(
+        "kafka_wrapper.consumer_group.ConsumerGroup.get_groups_offset_lag"
+    ) as mock_get_groups_offset_lag:
+        mock_get_groups_offset_lag.return_value = {
+            "group1": {"topic1": {0: {"current_offset": "1", "log_end_offset": 2, "lag": "1"}}}
+        }
+        result = dict(kafka_consumer_group.iter_describe(group_ids=["group1"]))
+
+    assert mock_get_groups_offset_lag.call_args.args[0] == {"group1": [TopicPartition("topic1", 0)]}
+    assert result["group1"]["members"][0]["assignments"][0]["lag"] == "1"
+
 
 def test_consumer_group_describe(admin_client, kafka_consumer_group):
     group_ids = ["group1", "group2"]
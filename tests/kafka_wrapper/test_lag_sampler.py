@@ -0,0 +1,174 @@
+from unittest.mock import MagicMock
+from kafka_wrapper.lag_sampler import LagSampler, OffsetRing
+
+import pytest
+import threading
+import time
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def consumer_group():
+    return MagicMock()
+
+
+def test_offset_ring_overwrites_the_oldest_samples():
+    ring = OffsetRing(3)
+    for i in range(5):
+        ring.append(i, i * 10, i * 20)
+
+    assert len(ring) == 3
+    assert list(ring) == [(2, 20, 40), (3, 30, 60), (4, 40, 80)]
+    assert ring[-1] == (4, 40, 80)
+    with pytest.raises(IndexError):
+        ring[3]
+
+
+def test_offset_ring_get_stats():
+    ring = OffsetRing(10)
+    ring.append(0, 100, 200)
+    assert ring.get_stats() == {
+        "committed_offset": 100,
+        "log_end_offset": 200,
+        "lag": 100,
+        "consume_rate": None,
+        "produce_rate": None,
+        "lag_trend": None,
+        "eta": None,
+    }
+
+    # 30 messages per second are consumed while 20 are produced, and the group caught up
+    ring.append(10, 400, 400)
+    stats = ring.get_stats()
+    assert stats["consume_rate"] == 30
+    assert stats["produce_rate"] == 20
+    assert stats["lag_trend"] == -10
+    assert stats["lag"] == 0
+    assert stats["eta"] == 0
+
+
+def test_offset_ring_get_stats_eta():
+    ring = OffsetRing(10)
+    for t in range(0, 40, 10):
+        ring.append(t, 1000 + t * 30, 2000 + t * 10)
+
+    stats = ring.get_stats()
+    assert stats["lag"] == 400
+    assert stats["lag_trend"] == pytest.approx(-20)
+    assert stats["eta"] == pytest.approx(20)
+
+
+def test_offset_ring_get_stats_falling_behind():
+    ring = OffsetRing(10)
+    ring.append(0, 100, 200)
+    ring.append(10, 150, 400)
+
+    stats = ring.get_stats()
+    assert stats["lag_trend"] == 15
+    assert stats["eta"] is None
+
+
+def test_lag_sampler_sample(consumer_group, clock):
+    consumer_group.get_group_offsets.return_value = {
+        "group1": {("topic1", 0): (100, 200), ("topic1", 1): (0, 0)},
+    }
+    sampler = LagSampler(consumer_group, group_ids=["group1"], clock=clock)
+
+    assert sampler.sample() == 2
+    consumer_group.get_group_offsets.assert_called_once_with(["group1"], None)
+    consumer_group.list.assert_not_called()
+
+    clock.now = 10
+    consumer_group.get_group_offsets.return_value = {
+        "group1": {("topic1", 0): (300, 300), ("topic1", 1): (50, 100)},
+    }
+    sampler.sample()
+
+    assert sampler.get_group_ids() == ["group1"]
+    assert sampler.get_samples("group1", "topic1", 0) == [(0, 100, 200), (10, 300, 300)]
+
+    partition_stats = sampler.get_partition_stats("group1")
+    assert [(p["topic"], p["partition"], p["lag"], p["consume_rate"]) for p in partition_stats] == [
+        ("topic1", 0, 0, 20),
+        ("topic1", 1, 50, 5),
+    ]
+
+    group_stats = sampler.get_group_stats("group1")
+    assert group_stats["partitions"] == 2
+    assert group_stats["lag"] == 50
+    assert group_stats["consume_rate"] == 25
+    assert group_stats["produce_rate"] == 20
+    assert group_stats["lag_trend"] == -5
+    assert group_stats["eta"] == 10
+    assert sampler.get_group_stats("group2") is None
+
+
+def test_lag_sampler_forgets_partitions_no_longer_committed(consumer_group, clock):
+    consumer_group.list.return_value = [{"id": "group1"}, {"id": "group2"}]
+    consumer_group.get_group_offsets.return_value = {
+        "group1": {("topic1", 0): (100, 200)},
+        "group2": {("topic1", 0): (100, 200)},
+    }
+    sampler = LagSampler(consumer_group, clock=clock)
+    sampler.sample()
+
+    # the sampled groups are listed at every sample
+    consumer_group.get_group_offsets.assert_called_once_with(["group1", "group2"], None)
+
+    consumer_group.list.return_value = [{"id": "group1"}]
+    consumer_group.get_group_offsets.return_value = {"group1": {("topic2", 0): (0, 10)}}
+    sampler.sample()
+
+    assert sampler.get_group_ids() == ["group1"]
+    assert sampler.get_samples("group1", "topic1", 0) == []
+    assert len(sampler.get_samples("group1", "topic2", 0)) == 1
+
+
+def test_lag_sampler_start_samples_in_the_background(consumer_group):
+    sampled = threading.Event()
+
+    def get_group_offsets(group_ids, max_staleness_ms):
+        sampled.set()
+        return {"group1": {("topic1", 0): (100, 200)}}
+
+    consumer_group.get_group_offsets.side_effect = get_group_offsets
+    sampler = LagSampler(consumer_group, group_ids=["group1"]).start(interval=60)
+    try:
+        assert sampled.wait(5)
+    finally:
+        sampler.stop()
+
+    assert sampler.error is None
+
+
+def test_lag_sampler_keeps_the_error_of_a_failed_sample(consumer_group):
+    sampled = threading.Event()
+
+    def get_group_offsets(group_ids, max_staleness_ms):
+        sampled.set()
+        raise RuntimeError("broker down")
+
+    consumer_group.get_group_offsets.side_effect = get_group_offsets
+    sampler = LagSampler(consumer_group, group_ids=["group1"]).start(interval=60)
+    try:
+        assert sampled.wait(5)
+    finally:
+        sampler.stop()
+
+    for _ in range(100):
+        if sampler.error:
+            break
+        time.sleep(0.01)
+    assert isinstance(sampler.error, RuntimeError)
@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+from kafka_wrapper.metadata_cache import MetadataCache
+
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_metadata_cache_get_reuses_snapshot_within_ttl(clock):
+    cache = MetadataCache(ttl=5, clock=clock)
+    fetch = MagicMock()
+
+    assert cache.get(fetch) is cache.get(fetch)
+    assert fetch.call_count == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+def test_metadata_cache_get_fetches_after_ttl(clock):
+    cache = MetadataCache(ttl=5, clock=clock)
+    fetch = MagicMock()
+
+    cache.get(fetch)
+    clock.now = 5
+    assert cache.peek() is None
+    cache.get(fetch)
+    assert fetch.call_count == 2
+    assert cache.misses == 2
+
+
+def test_metadata_cache_invalidate(clock):
+    cache = MetadataCache(ttl=5, clock=clock)
+    fetch = MagicMock()
+
+    cache.get(fetch)
+    cache.invalidate()
+    cache.get(fetch)
+    assert fetch.call_count == 2
+
+
+def test_metadata_cache_without_ttl(clock):
+    cache = MetadataCache(ttl=0, clock=clock)
+    fetch = MagicMock()
+
+    cache.get(fetch)
+    cache.get(fetch)
+    assert fetch.call_count == 2
+    assert cache.hits == 0
@@ -0,0 +1,207 @@
+from io import BytesIO
+from kafka_wrapper.producer import (
+    DEFAULT_CONFIG,
+    DeliveryStats,
+    Producer,
+    guess_format,
+    read_delimited,
+    read_length_prefixed,
+    read_ndjson,
+)
+
+import pytest
+import struct
+import threading
+import time
+
+
+class FakeKafkaProducer:
+    """Holds produced messages until they are delivered by poll() or flush(), or deliver() in a test."""
+
+    def __init__(self, config, auto_deliver=True):
+        self.config = config
+        self.auto_deliver = auto_deliver
+        self.produced = []
+        self.pending = []
+        self.errors = {}
+        self.buffer_errors = 0
+        self._lock = threading.Lock()
+
+    def produce(self, topic, value=None, key=None, headers=None, partition=None, on_delivery=None):
+        if self.buffer_errors:
+            self.buffer_errors -= 1
+            raise BufferError("Local: Queue full")
+
+        with self._lock:
+            self.produced.append(
+                {
+                    "topic": topic,
+                    "key": key,
+                    "value": value,
+                    "headers": headers,
+                    "partition": partition,
+                }
+            )
+            self.pending.append((on_delivery, len(self.produced) - 1))
+
+    def deliver(self):
+        with self._lock:
+            pending, self.pending = self.pending, []
+        for on_delivery, i in pending:
+            on_delivery(self.errors.get(i), self.produced[i])
+
+    def poll(self, timeout):
+        if self.auto_deliver:
+            self.deliver()
+        time.sleep(0.001)
+
+    def flush(self, timeout=-1):
+        self.deliver()
+        return 0
+
+
+def new_producer(max_in_flight_bytes=1024, **kwargs):
+    return Producer(
+        {"bootstrap.servers": "mock:9092"},
+        max_in_flight_bytes=max_in_flight_bytes,
+        poll_interval=0.01,
+        producer_factory=lambda config: FakeKafkaProducer(config, **kwargs),
+    )
+
+
+def test_read_ndjson():
+    stream = BytesIO(
+        b'{"key": "k1", "value": {"id": 1}, "partition": 2, "headers": {"h": "v"}}\n'
+        b"\n"
+        b'{"value": "v2"}\n'
+        b'["not", "a", "message"]\n'
+    )
+
+    assert list(read_ndjson(stream)) == [
+        {"key": b"k1", "value": b'{"id": 1}', "partition": 2, "headers": {"h": b"v"}},
+        {"key": None, "value": b"v2"},
+        {"key": None, "value": b'["not", "a", "message"]'},
+    ]
+
+
+def test_read_delimited():
+    stream = BytesIO(b"k1\tv1\tmore\r\nv2\n\nk3,v3\n")
+
+    assert list(read_delimited(stream)) == [
+        {"key": b"k1", "value": b"v1\tmore"},
+        {"key": None, "value": b"v2"},
+        {"key": None, "value": b"k3,v3"},
+    ]
+    assert list(read_delimited(BytesIO(b"k3,v3\n"), b","))[0] == {"key": b"k3", "value": b"v3"}
+
+
+def test_read_length_prefixed():
+    stream = BytesIO(
+        struct.pack(">i", 2)
+        + b"k1"
+        + struct.pack(">i", 3)
+        + b"v\x001"
+        + struct.pack(">i", -1)
+        + struct.pack(">i", 0)
+    )
+
+    assert list(read_length_prefixed(stream)) == [
+        {"key": b"k1", "value": b"v\x001"},
+        {"key": None, "value": b""},
+    ]
+
+
+def test_read_length_prefixed_truncated():
+    stream = BytesIO(struct.pack(">i", 2) + b"k1" + struct.pack(">i", 10) + b"short")
+
+    with pytest.raises(ValueError, match="Truncated"):
+        list(read_length_prefixed(stream))
+
+
+def test_guess_format():
+    assert guess_format("messages.ndjson") == "ndjson"
+    assert guess_format("messages.JSONL") == "ndjson"
+    assert guess_format("messages.bin") == "binary"
+    assert guess_format("messages.tsv") == "delimited"
+
+
+def test_delivery_stats_percentiles():
+    stats = DeliveryStats()
+    for i in range(1, 101):
+        stats.record(i / 1000, 10)
+    stats.record(1, 10, error="timed out")
+
+    assert stats.get_percentile(50) == 0.05
+    assert stats.get_percentile(99) == 0.099
+    assert (stats.messages, stats.bytes, stats.errors, stats.last_error) == (
+        100,
+        1000,
+        1,
+        "timed out",
+    )
+    assert DeliveryStats().get_percentile(50) is None
+
+
+def test_producer_produce_all():
+    with new_producer() as producer:
+        report = producer.produce_all("topic1", read_delimited(BytesIO(b"k1\tv1\nk2\tv2\nv3\n")))
+        fake = producer._producer
+
+    # batching and compression are enabled unless configured otherwise
+    assert fake.config == {**DEFAULT_CONFIG, "bootstrap.servers": "mock:9092"}
+    assert [(m["key"], m["value"]) for m in fake.produced] == [
+        (b"k1", b"v1"),
+        (b"k2", b"v2"),
+        (None, b"v3"),
+    ]
+    assert report["messages"] == 3
+    assert report["bytes"] == 10
+    assert report["errors"] == 0
+    assert report["p50_latency_ms"] is not None
+    assert report["messages_per_second"] > 0
+    assert producer.in_flight == 0
+
+
+def test_producer_reports_delivery_errors():
+    producer = new_producer(auto_deliver=False)
+    producer._producer.errors[1] = "Broker: Message too large"
+
+    report = producer.produce_all("topic1", [{"value": b"v1"}, {"value": b"v2"}])
+    producer.close()
+
+    assert report["messages"] == 1
+    assert report["errors"] == 1
+    assert report["last_error"] == "Broker: Message too large"
+
+
+def test_producer_bounds_in_flight_bytes():
+    producer = new_producer(max_in_flight_bytes=10, auto_deliver=False)
+    producer.produce("topic1", b"123456")
+
+    # the second message waits for the delivery of the first
+    produced = threading.Event()
+    thread = threading.Thread(
+        target=lambda: producer.produce("topic1", b"123456") or produced.set()
+    )
+    thread.start()
+    assert not produced.wait(0.2)
+    assert producer.in_flight_bytes == 6
+
+    producer._producer.deliver()
+    assert produced.wait(5)
+    assert producer.in_flight_bytes == 6
+    producer.close()
+    assert producer.in_flight_bytes == 0
+
+
+def test_producer_retries_when_the_queue_is_full():
+    producer = new_producer()
+    producer._producer.buffer_errors = 2
+
+    producer.produce("topic1", b"v1", key=b"k1", partition=3, headers={"h": b"v"})
+    producer.close()
+
+    assert producer._producer.produced == [
+        {"topic": "topic1", "key": b"k1", "value": b"v1", "headers": {"h": b"v"}, "partition": 3}
+    ]
+    assert producer.stats.messages == 1
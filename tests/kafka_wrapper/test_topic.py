@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, call
 from confluent_kafka.admin import NewTopic, ConfigResource, ResourceType
-from confluent_kafka import KafkaException
+from confluent_kafka import KafkaException, KafkaError
 
 
 def test_topic_list(admin_client, kafka_topic):
@@ -26,6 +26,72 @@ def test_topic_list_without_internal(admin_client, kafka_topic):
     )
 
 
+def test_topic_list_reuses_cached_metadata(admin_client, kafka_topic):
+    admin_client.list_topics.return_value = MagicMock(topics={"topic1": MagicMock()})
+
+    kafka_topic.list()
+    kafka_topic.describe()
+    kafka_topic.describe_configs()
+    assert admin_client.list_topics.call_count == 1
+    assert kafka_topic.metadata_cache.hits == 2
+
+    # mutations invalidate the cached metadata
+    kafka_topic.delete(["topic1"])
+    kafka_topic.list()
+    assert admin_client.list_topics.call_count == 2
+
+
+def test_topic_delete_invalidates_metadata_after_completion(admin_client, kafka_topic):
+    admin_client.list_topics.return_value = MagicMock(topics={"topic1": MagicMock()})
+    kafka_topic.list()
+
+    # a fetch while the deletion is pending still sees the cached metadata
+    future = MagicMock()
+    future.result.side_effect = lambda: kafka_topic.list()
+    admin_client.delete_topics.return_value = {"topic1": future}
+    kafka_topic.delete(["topic1"])
+    assert admin_client.list_topics.call_count == 1
+
+    kafka_topic.list()
+    assert admin_client.list_topics.call_count == 2
+
+
+def test_topic_delete_failure_invalidates_metadata(admin_client, kafka_topic):
+    admin_client.list_topics.return_value = MagicMock(topics={"topic1": MagicMock()})
+    kafka_topic.list()
+
+    future = MagicMock()
+    future.result.side_effect = KafkaException(KafkaError(KafkaError.UNKNOWN_TOPIC_OR_PART))
+    admin_client.delete_topics.return_value = {"topic1": future}
+    with pytest.raises(KafkaException):
+        kafka_topic.delete(["topic1"])
+
+    kafka_topic.list()
+    assert admin_client.list_topics.call_count == 2
+
+
+def test_topic_does_exist(admin_client, kafka_topic):
+    admin_client.list_topics.return_value = MagicMock(topics={"topic1": MagicMock(error=None)})
+    assert kafka_topic.does_exist("topic1")
+    admin_client.list_topics.assert_called_once_with(topic="topic1", timeout=10)
+
+
+def test_topic_does_not_exist(admin_client, kafka_topic):
+    error = MagicMock()
+    error.code.return_value = KafkaError.UNKNOWN_TOPIC_OR_PART
+    admin_client.list_topics.return_value = MagicMock(topics={"topic1": MagicMock(error=error)})
+    assert not kafka_topic.does_exist("topic1")
+
+
+def test_topic_does_exist_with_cached_metadata(admin_client, kafka_topic):
+    admin_client.list_topics.return_value = MagicMock(topics={"topic1": MagicMock()})
+    kafka_topic.list()
+
+    assert kafka_topic.does_exist("topic1")
+    assert not kafka_topic.does_exist("topic2")
+    admin_client.list_topics.assert_called_once_with(timeout=10)
+
+
 def test_topic_create(admin_client, kafka_topic):
     topic_name = "topic"
     num_partitions = 3
@@ -56,12 +122,13 @@ def test_topic_create(admin_client, kafka_topic):
 def test_topic_describe(admin_client, kafka_topic):
     _ = kafka_topic.describe(topic_names=["topic1", "topic2"])
 
-    admin_client.assert_has_calls(
+    # assert that only the named topics metadata is requested
+    admin_client.list_topics.assert_has_calls(
         [
-            call.list_topics(timeout=10),
-            call.list_topics().topics.items(),
-            call.list_topics().topics.items().__iter__(),
-        ]
+            call(topic="topic1", timeout=10),
+            call(topic="topic2", timeout=10),
+        ],
+        any_order=True,
     )
 
     # assert that list_topics is called when the topics argument is not specified
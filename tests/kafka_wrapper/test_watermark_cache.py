@@ -0,0 +1,180 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import MagicMock
+from kafka_wrapper.watermark_cache import WatermarkCache
+
+import pytest
+import threading
+import time
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def fetch_watermarks(topic_partitions):
+    return {(topic, partition): (0, partition * 10) for topic, partition in topic_partitions}
+
+
+def test_watermark_cache_get_reuses_fresh_watermarks(clock):
+    cache = WatermarkCache(max_staleness=5, clock=clock)
+    fetch = MagicMock(side_effect=fetch_watermarks)
+
+    assert cache.get([("topic1", 1), ("topic1", 2)], fetch) == {
+        ("topic1", 1): (0, 10),
+        ("topic1", 2): (0, 20),
+    }
+    assert cache.get([("topic1", 2), ("topic1", 3)], fetch) == {
+        ("topic1", 2): (0, 20),
+        ("topic1", 3): (0, 30),
+    }
+
+    # only the missing partition was fetched the second time
+    assert fetch.call_args.args[0] == [("topic1", 3)]
+    assert cache.stats() == {"hits": 1, "misses": 3, "hit_ratio": 0.25, "partitions": 3}
+
+
+def test_watermark_cache_get_with_max_staleness(clock):
+    cache = WatermarkCache(max_staleness=5, clock=clock)
+    fetch = MagicMock(side_effect=fetch_watermarks)
+
+    cache.get([("topic1", 1)], fetch)
+    clock.now = 2
+    cache.get([("topic1", 1)], fetch)
+    assert fetch.call_count == 1
+
+    # the caller only accepts watermarks up to a second old
+    cache.get([("topic1", 1)], fetch, max_staleness_ms=1000)
+    assert fetch.call_count == 2
+
+    cache.get([("topic1", 1)], fetch, max_staleness_ms=0)
+    assert fetch.call_count == 3
+
+
+def test_watermark_cache_get_in_batches(clock):
+    cache = WatermarkCache(batch_size=2, clock=clock)
+    fetch = MagicMock(side_effect=fetch_watermarks)
+
+    cache.get([("topic1", p) for p in range(5)], fetch)
+    assert [len(c.args[0]) for c in fetch.call_args_list] == [2, 2, 1]
+
+
+def test_watermark_cache_evicts_least_recently_used(clock):
+    cache = WatermarkCache(max_partitions=2, clock=clock)
+
+    cache.get([("topic1", 1), ("topic1", 2)], fetch_watermarks)
+    cache.get([("topic1", 1)], fetch_watermarks)
+    cache.get([("topic1", 3)], fetch_watermarks)
+
+    assert len(cache) == 2
+    assert cache.peek(("topic1", 2)) is None
+    assert cache.peek(("topic1", 1)) == (0, 10)
+
+
+def test_watermark_cache_get_fetch_error(clock):
+    cache = WatermarkCache(clock=clock)
+
+    with pytest.raises(RuntimeError):
+        cache.get([("topic1", 1)], MagicMock(side_effect=RuntimeError))
+
+    # the failed partitions are fetched again by the next caller
+    assert cache.get([("topic1", 1)], fetch_watermarks) == {("topic1", 1): (0, 10)}
+
+
+def test_watermark_cache_get_concurrently():
+    cache = WatermarkCache()
+    barrier = threading.Barrier(8)
+    fetched = []
+
+    def fetch(topic_partitions):
+        fetched.extend(topic_partitions)
+        time.sleep(0.05)
+        return fetch_watermarks(topic_partitions)
+
+    def get(i):
+        barrier.wait()
+        return cache.get([("topic1", p) for p in range(200)], fetch)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(get, range(8)))
+
+    # the callers that lost the race waited for the partitions fetched by the others
+    assert all(result == results[0] for result in results)
+    assert len(fetched) == 200
+
+
+def test_watermark_cache_background_refresh(clock):
+    cache = WatermarkCache(max_staleness=1, clock=clock)
+    fetch = MagicMock(side_effect=fetch_watermarks)
+    cache.start(fetch, interval=60)
+    try:
+        # a partition read once is left to its readers
+        cache.get([("topic1", 1), ("topic1", 2)], fetch)
+        cache._refresh(fetch, interval=0.5)
+        assert fetch.call_count == 1
+
+        # a partition read again is refreshed once it expires before the next refresh
+        cache.get([("topic1", 1)], fetch)
+        clock.now = 0.4
+        cache._refresh(fetch, interval=0.5)
+        assert fetch.call_count == 1
+
+        clock.now = 0.5
+        cache._refresh(fetch, interval=0.5)
+        assert fetch.call_count == 2
+        assert fetch.call_args.args[0] == [("topic1", 1)]
+
+        clock.now = 1.2
+        assert cache.get([("topic1", 1)], fetch) == {("topic1", 1): (0, 10)}
+        assert fetch.call_count == 2
+    finally:
+        cache.stop()
+
+
+def test_watermark_cache_background_refresh_error(clock):
+    cache = WatermarkCache(max_staleness=1, clock=clock)
+    cache.start(fetch_watermarks, interval=60)
+    try:
+        cache.get([("topic1", 1)], fetch_watermarks)
+        cache.get([("topic1", 1)], fetch_watermarks)
+
+        in_flight = []
+
+        def fail(topic_partitions):
+            in_flight.extend(cache._in_flight[key] for key in topic_partitions)
+            raise RuntimeError("broker is down")
+
+        clock.now = 0.5
+        cache._refresh(fail, interval=0.5)
+    finally:
+        cache.stop()
+
+    # the readers waiting on the failed refresh are not given its error
+    assert [f.result() for f in in_flight] == [None]
+    assert not cache._in_flight
+
+
+def test_watermark_cache_get_after_failed_background_refresh(clock):
+    cache = WatermarkCache(clock=clock)
+    refresh = cache._in_flight[("topic1", 1)] = Future()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        reader = executor.submit(cache.get, [("topic1", 1)], fetch_watermarks)
+
+        # the reader counts the partition fetched by the refresh as a hit and waits for it
+        while not cache.hits:
+            time.sleep(0.001)
+        with cache._lock:
+            cache._in_flight.pop(("topic1", 1))
+        refresh.set_result(None)
+
+        # and fetches the partition itself when the refresh failed
+        assert reader.result(timeout=2) == {("topic1", 1): (0, 10)}
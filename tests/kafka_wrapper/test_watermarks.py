@@ -0,0 +1,35 @@
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+from confluent_kafka import KafkaError, KafkaException
+from kafka_wrapper.watermarks import list_watermarks, UNKNOWN
+
+
+def list_offsets(topic_partition_offsets, request_timeout):
+    futures = {}
+    for tp in topic_partition_offsets:
+        futures[tp] = Future()
+        if tp.topic == "deleted":
+            futures[tp].set_exception(KafkaException(KafkaError(KafkaError.UNKNOWN_TOPIC_OR_PART)))
+        else:
+            futures[tp].set_result(MagicMock(offset=tp.partition * 10))
+    return futures
+
+
+def test_list_watermarks(admin_client):
+    admin_client.list_offsets.side_effect = list_offsets
+
+    result = list_watermarks(admin_client, [("topic1", 1), ("topic1", 2), ("topic1", 1)])
+    assert result == {("topic1", 1): (10, 10), ("topic1", 2): (20, 20)}
+
+    # the earliest and latest offsets of every partition are listed in two requests
+    assert admin_client.list_offsets.call_count == 2
+    assert len(admin_client.list_offsets.call_args.args[0]) == 2
+
+
+def test_list_watermarks_unknown_partition(admin_client):
+    admin_client.list_offsets.side_effect = list_offsets
+
+    assert list_watermarks(admin_client, [("deleted", 0), ("topic1", 1)]) == {
+        ("deleted", 0): UNKNOWN,
+        ("topic1", 1): (10, 10),
+    }